@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import ast
+    import json
+    import os
+    import platform
+    import random
+    import shutil
+    import subprocess
+    import sys
+    import tempfile
+    import time
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Benchmark the checkers on reproducible synthetic corpora of Python scripts (offline, using a fake \"pyguymer3\").",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--checkers",
+        choices = [
+            "checkAllKeywordArguments",
+            "checkEverything",
+            "checkPyGuymer3KeywordArguments",
+            "lintSession",
+        ],
+        default = [
+            "checkAllKeywordArguments",
+            "checkEverything",
+            "checkPyGuymer3KeywordArguments",
+            "lintSession",
+        ],
+           help = "the checkers to benchmark",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--density",
+        default = 0.25,
+           help = "the probability that each generated statement is a call that the checkers look for (such as \"zip()\", \"map()\", \"subprocess.run()\" or \"pyguymer3.now()\")",
+           type = float,
+    )
+    parser.add_argument(
+        "--files",
+        default = [
+            10,
+            100,
+            1000,
+        ],
+           help = "the numbers of Python scripts in each corpus",
+          nargs = "+",
+           type = int,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes for the checkers to use",
+           type = int,
+    )
+    parser.add_argument(
+        "--json",
+        default = None,
+           dest = "jName",
+           help = "the JSON file to write the results to",
+           type = str,
+    )
+    parser.add_argument(
+        "--repeats",
+        default = 3,
+           help = "the number of times to run each checker on each corpus (the fastest run is reported)",
+           type = int,
+    )
+    parser.add_argument(
+        "--seed",
+        default = 0,
+           help = "the seed of the random number generator",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    dname = os.path.dirname(os.path.realpath(__file__))
+
+    # Load the seed pattern ...
+    with open(f"{dname}/tests/astTree.py", "rt", encoding = "utf-8") as fObj:
+        seed = fObj.read()
+
+    # Define the statements to generate, where the first ones are the calls that
+    # the checkers look for and the last ones are filler ...
+    calls = [
+        "ans = list(zip(x, x))",
+        "ans = list(zip(x, x, strict = True))",
+        "ans = list(map(str, x))",
+        "ans = subprocess.run([\"true\"], check = True)",
+        "ans = subprocess.run([\"true\"], check = True, encoding = \"utf-8\", timeout = 60.0)",
+        "ans = pyguymer3.now()",
+        "ans = pyguymer3.generate_password(length = 8)",
+        "ans = pyguymer3.geo.buffer(x, 1.0)",
+        "ans = pyguymer3.geo.buffer(x, 1.0, nAng = 9, ramLimit = 1024)",
+    ]
+    fillers = [
+        "ans = [y * 2.0 for y in x]",
+        "ans = {\"a\" : 1, \"b\" : [1, 2, 3], \"c\" : (x, x)}",
+        "ans = x[0] + x[-1] if x else 0.0",
+        "ans = sum(y ** 2 for y in x) / max(1, len(x))",
+        "ans = \"hello world\".replace(\"world\", str(len(x)))",
+    ]
+
+    # Define the fake library ...
+    # NOTE: This is enough of "pyguymer3" for the checkers to import it and to
+    #       build a database of the keyword-only arguments of its functions, so
+    #       that the benchmark runs offline and does not depend on the installed
+    #       version of the real "pyguymer3".
+    fakeLibrary = {
+        "pyguymer3/__init__.py" : "__version__ = \"0.0.0\"\n\ndef now():\n    pass\n\ndef generate_password(\n    *,\n    length = 8,\n):\n    pass\n\ndef start_session(\n    *,\n    cookies = None,\n    headers = None,\n):\n    pass\n",
+        "pyguymer3/geo/__init__.py" : "def buffer(\n    shape,\n    dist,\n    /,\n    *,\n    nAng = 9,\n    ramLimit = 1024,\n):\n    pass\n",
+    }
+
+    # **************************************************************************
+
+    # Find out which commit is being benchmarked (if Git is installed) ...
+    commit = "unknown"
+    if shutil.which("git") is not None:
+        resp = subprocess.run(
+            ["git", "-C", dname, "rev-parse", "HEAD"],
+               check = False,
+            encoding = "utf-8",
+              stderr = subprocess.DEVNULL,
+              stdout = subprocess.PIPE,
+             timeout = 60.0,
+        )
+        commit = resp.stdout.strip() or commit
+
+    # Initialize results ...
+    results = {
+         "commit" : commit,
+        "density" : args.density,
+           "jobs" : args.jobs,
+         "python" : platform.python_version(),
+           "runs" : [],
+           "seed" : args.seed,
+    }
+
+    # Print header ...
+    print(f"Benchmarking commit {commit} with Python {results['python']} (seed = {args.seed:d}, density = {args.density:.3f}, jobs = {args.jobs:d}) ...")
+    print(f"{'checker':<32s} {'files':>8s} {'nodes':>12s} {'time [s]':>10s} {'files/s':>10s} {'nodes/s':>12s} {'peak RSS [KiB]':>15s}")
+
+    # Create a temporary directory ...
+    with tempfile.TemporaryDirectory(prefix = "benchmarkCheckers.") as tname:
+        # Write the fake library ...
+        for fname, src in fakeLibrary.items():
+            os.makedirs(os.path.dirname(f"{tname}/lib/{fname}"), exist_ok = True)
+            with open(f"{tname}/lib/{fname}", "wt", encoding = "utf-8") as fObj:
+                fObj.write(src)
+
+        # Create an environment for the checkers which finds the fake library
+        # (and the local modules) first ...
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join([f"{tname}/lib", dname] + ([env["PYTHONPATH"]] if "PYTHONPATH" in env else []))
+
+        # Loop over corpus sizes ...
+        for nFiles in args.files:
+            # Create corpus ...
+            cname = f"{tname}/corpus{nFiles:d}"
+            nNodes = 0
+
+            # Loop over Python scripts ...
+            for iFile in range(nFiles):
+                # Create a random number generator for this Python script, so
+                # that it is the same whatever size the corpus is ...
+                rng = random.Random(f"{args.seed:d}/{iFile:d}")
+
+                # Generate some functions, each one having some statements and
+                # some calls to the other functions (some of which do not pass
+                # all of the keyword-only arguments) ...
+                # NOTE: The names of the functions are the same in every Python
+                #       script, as "checkAllKeywordArguments.py" resolves each
+                #       function call to the module that it is defined in (see
+                #       "funcs.symbol_table()"), so this also checks that calls
+                #       to functions which have the same name in different
+                #       modules do not collide.
+                lines = [
+                    "#!/usr/bin/env python3",
+                    "",
+                    "# Import standard modules ...",
+                    "import subprocess",
+                    "",
+                ]
+                nFuncs = rng.randint(2, 8)
+                for iFunc in range(nFuncs):
+                    lines.append(f"def func{iFunc:d}(\n    x,\n    /,\n    *,\n    alpha = 1,\n    beta = 2,\n):")
+                    for _ in range(rng.randint(4, 16)):
+                        if rng.random() < args.density:
+                            lines.append(f"    {rng.choice(calls)}")
+                        else:
+                            lines.append(f"    {rng.choice(fillers)}")
+                    if iFunc > 0:
+                        lines.append(f"    ans = func{rng.randrange(iFunc):d}(x, alpha = 1{', beta = 2' if rng.random() < 0.5 else ''})")
+                    lines.append("    return ans")
+                    lines.append("")
+
+                # Append the seed pattern ...
+                src = "\n".join(lines) + "\n" + seed.removeprefix("#!/usr/bin/env python3\n")
+
+                # Save the Python script (in folders of 100 Python scripts) and
+                # count how many nodes are in it ...
+                fname = f"{cname}/dir{iFile // 100:04d}/file{iFile:06d}.py"
+                os.makedirs(os.path.dirname(fname), exist_ok = True)
+                with open(fname, "wt", encoding = "utf-8") as fObj:
+                    fObj.write(src)
+                nNodes += sum(1 for _ in ast.walk(ast.parse(src)))
+
+            # Loop over checkers ...
+            for checker in args.checkers:
+                # Initialize timings ...
+                wall = float("inf")
+                maxrss = 0
+
+                # Loop over repeats ...
+                for _ in range(args.repeats):
+                    # Run the checker and wait for it to finish, recording how
+                    # long it took and its peak memory usage ...
+                    # NOTE: The peak resident set size is reported by "wait4()"
+                    #       in KiB on Linux and in bytes on MacOS.
+                    with open(f"{tname}/stderr.log", "w+t", encoding = "utf-8") as fObj:
+                        start = time.perf_counter()
+                        with subprocess.Popen(
+                            [
+                                sys.executable,
+                                f"{dname}/{checker}.py",
+                                cname,
+                                "--cache-dir", f"{tname}/cache",
+                                "--jobs", f"{args.jobs:d}",
+                                "--no-cache",
+                            ],
+                                 env = env,
+                              stderr = fObj,
+                              stdout = subprocess.DEVNULL,
+                        ) as proc:
+                            _, status, rusage = os.wait4(proc.pid, 0)
+                            proc.returncode = os.waitstatus_to_exitcode(status)
+                        wall = min(wall, time.perf_counter() - start)
+                        maxrss = max(maxrss, rusage.ru_maxrss // (1024 if sys.platform == "darwin" else 1))
+
+                        # Check that the checker finished successfully ...
+                        if proc.returncode != 0:
+                            fObj.seek(0)
+                            raise Exception(f"\"{checker}.py\" failed on \"{cname}\" (exit code {proc.returncode:d}):\n{fObj.read()}") from None
+
+                # Append results and print them ...
+                results["runs"].append(
+                    {
+                        "checker" : checker,
+                          "files" : nFiles,
+                         "maxrss" : maxrss,
+                          "nodes" : nNodes,
+                           "wall" : wall,
+                    }
+                )
+                print(f"{checker:<32s} {nFiles:>8,d} {nNodes:>12,d} {wall:>10.3f} {nFiles / wall:>10,.1f} {nNodes / wall:>12,.1f} {maxrss:>15,d}")
+
+    # Save results ...
+    if args.jName is not None:
+        with open(args.jName, "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                results,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 
+# Define the version of the cache (which must be changed whenever the structure
+# of the summaries changes) ...
+CACHE_VERSION = "3"
+
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
     import argparse
-    import ast
+    import os
+    import sys
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
@@ -26,143 +28,259 @@ if __name__ == "__main__":
         help = "the folder to check",
         type = str,
     )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of summaries in",
+           type = str,
+    )
     parser.add_argument(
         "--debug",
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--format",
+        choices = [
+            "jsonl",
+            "sarif",
+            "text",
+        ],
+        default = "text",
+           help = "the format to print the diagnostics in (\"jsonl\" and \"sarif\" are streamed as they are found, with the file, the line, the column, the rule ID and the message of each diagnostic)",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to parse Python scripts with",
+           type = int,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of summaries",
+    )
+    parser.add_argument(
+        "--shard",
+        default = None,
+           help = "only summarise the Python scripts whose paths (relative to the folder) hash into this shard, written as \"i/N\" (for example, \"1/4\"), and save the summaries to \"--shard-file\" instead of printing anything (see \"mergeShards.py\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--shard-file",
+        default = None,
+           dest = "shardFile",
+           help = "the JSON file to save the summaries of the shard to (if not given then it is \"checkAllKeywordArguments.shard<i>of<N>.json\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--since",
+        default = None,
+           help = "only report on the Python scripts which differ from this Git reference and the Python scripts which call their changed functions (listing them with \"git diff\", along with the new ones which are not tracked)",
+           type = str,
+    )
+    parser.add_argument(
+        "--staged",
+        action = "store_true",
+          help = "only report on the Python scripts which are staged and the Python scripts which call their changed functions (listing them with \"git diff --cached\" and summarising their staged contents)",
+    )
     args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+
+    # Parse the shard ...
+    # NOTE: The Python scripts which are affected by the changes since a Git
+    #       reference can only be found once all of the Python scripts are
+    #       summarised, which a shard does not do.
+    shard = None
+    if args.shard is not None:
+        if args.since is not None or args.staged:
+            raise Exception("\"--shard\" cannot be used with \"--since\" or \"--staged\"") from None
+        shard = funcs.parse_shard(args.shard)
+        if args.shardFile is None:
+            args.shardFile = f"checkAllKeywordArguments.shard{shard[0]:d}of{shard[1]:d}.json"
 
     # **************************************************************************
 
-    # Initialize database ...
-    funcs : dict[str, list[str]] = {}
+    # Load cache ...
+    cache = {}
+    if not args.noCache:
+        cache = funcs.load_cache(
+            f"{args.cacheDir}/checkAllKeywordArguments.json",
+            CACHE_VERSION,
+            debug = args.debug,
+        )
+
+    # **************************************************************************
 
-    # Loop over files in folder ...
-    for fname in pyguymer3.return_file_list(
-        args.dname,
-            allowHidden = True,
-                  debug = args.debug,
-        follow_symlinks = False,
-        return_symlinks = False,
+    # Initialize lists ...
+    iFiles = []
+    fnames = []
+    entries = []
+    tasks = []
+    taskEntries = []
+
+    # Initialize dictionary (which is only used for staged Python scripts) ...
+    stagedSrcs = {}
+
+    # Find the Python scripts which have changed (if only they are to be
+    # reported on) and read the staged contents of the staged ones (which are
+    # what will be committed, even if the files have been changed since they
+    # were staged) ...
+    changed = None
+    if args.since is not None or args.staged:
+        changed = [
+            fname for fname in funcs.changed_files(
+                args.dname,
+                  since = args.since,
+                 staged = args.staged,
+                timeout = 60.0,
+            ) if fname.endswith(".py")
+        ]
+        if args.staged:
+            stagedSrcs = funcs.staged_sources(
+                args.dname,
+                changed,
+                timeout = 60.0,
+            )
+
+    # Loop over files in folder (listing them from the Git index where
+    # possible, which skips Git submodules) ...
+    for iFile, fname in enumerate(
+        funcs.list_files(
+            args.dname,
+              debug = args.debug,
+            timeout = 60.0,
+        )
     ):
         # Skip files which are not Python scripts ...
         if not fname.endswith(".py"):
             continue
 
-        # Skip Python scripts which are known Git submodules ...
-        if "/openflights/" in fname:
-            continue
-        if "/ourairports-data/" in fname:
-            continue
-        if "/stations/" in fname:
-            continue
-        if "/validator/" in fname:
+        # Skip this Python script if it is not in the shard ...
+        if shard is not None and not funcs.in_shard(
+            os.path.relpath(fname, args.dname),
+            shard,
+        ):
             continue
 
-        # Load the Python script ...
-        with open(fname, "rt", encoding = "utf-8") as fObj:
-            src = fObj.read()
-
-        # Parse the Python script ...
-        tree = ast.parse(src)
-
-        # Loop over bodies ...
-        for body in tree.body:
-            # Skip bodies which are not function definitions ...
-            if not isinstance(body, ast.FunctionDef):
-                continue
-
-            # Find out how many arguments and keyword-only arguments there are ...
-            nArgs = len(body.args.args)
-            nKwArgs = len(body.args.kwonlyargs)
-
-            # Check if there are any arguments which are not explicitly either
-            # keyword-only arguments or positional-only arguments...
-            if nArgs != 0:
-                # Cry ...
-                raise Exception(f"\"{fname}\" has ambiguous arguments (you need to use / and * in the definition)") from None
-
-            # Skip if there aren't any keyword-only arguments ...
-            if nKwArgs == 0:
-                continue
-
-            # Add this function to the database ...
-            if body.name not in funcs:
-                funcs[body.name] = []
+        # Find the cache entry of the Python script and skip it if it is
+        # already summarised ...
+        # NOTE: Staged Python scripts are summarised from their staged
+        #       contents, so they do not use the cache (which is keyed by the
+        #       file).
+        if fname in stagedSrcs:
+            src = stagedSrcs[fname]
+            entry = {
+                "sha" : funcs.blob_sha(src),
+            }
+        else:
+            entry, src = funcs.check_cache(
+                cache,
+                fname,
+                sha = None,
+            )
+        iFiles.append(iFile)
+        fnames.append(fname)
+        entries.append(entry)
+        if all(key in entry for key in ["aliases", "calls", "defs", "methods"]):
+            continue
 
-            # Loop over keyword-only arguments ...
-            for iKwArg in range(nKwArgs):
-                # Append this keyword-only argument to the database ...
-                funcs[body.name].append(body.args.kwonlyargs[iKwArg].arg)
+        # Load the Python script (if it has not been loaded already) ...
+        if src is None:
+            with open(fname, "rb") as fObj:
+                src = fObj.read()
 
-            # Skip this function if its keyword-only arguments are already sorted ...
-            if funcs[body.name] == sorted(funcs[body.name], key = str.lower):
-                continue
+        # Append task ...
+        tasks.append((src,))
+        taskEntries.append(entry)
 
-            # Print ...
-            print(f"The keyword-only arguments of \"{body.name}()\" in \"{fname}\" are not sorted.")
+    # Summarise the imports, the function (and method) definitions and the
+    # function calls in the Python scripts, parsing each one only once (in
+    # parallel, if requested) ...
+    for entry, summary in zip(
+        taskEntries,
+        funcs.run_jobs(
+            funcs.summarise_keyword_arguments,
+            tasks,
+            jobs = args.jobs,
+        ),
+        strict = True,
+    ):
+        entry.update(summary)
 
     # **************************************************************************
 
-    # Loop over files in folder ...
-    for fname in pyguymer3.return_file_list(
-        args.dname,
-            allowHidden = True,
-                  debug = args.debug,
-        follow_symlinks = False,
-        return_symlinks = False,
-    ):
-        # Skip files which are not Python scripts ...
-        if not fname.endswith(".py"):
-            continue
+    # Check if this is a shard ...
+    if shard is not None:
+        # Save the summaries of the shard (the keyword-only arguments can only
+        # be checked once the summaries of all of the shards are merged) ...
+        funcs.save_shard(
+            args.shardFile,
+            "checkAllKeywordArguments",
+            CACHE_VERSION,
+            shard,
+            [
+                (
+                    iFile,
+                    fname,
+                    {
+                        "aliases" : entry["aliases"],
+                          "calls" : entry["calls"],
+                           "defs" : entry["defs"],
+                        "methods" : entry["methods"],
+                    },
+                )
+                for iFile, fname, entry in zip(iFiles, fnames, entries, strict = True)
+            ],
+            context = {},
+        )
+    else:
+        # Check if only the Python scripts which have changed are to be
+        # reported on ...
+        targets = None
+        if changed is not None:
+            # Find the Python scripts which have changed and the Python scripts
+            # which call any function whose keyword-only arguments have changed
+            # (compared to the Git reference, or to "HEAD" for the staged Python
+            # scripts) ...
+            targets = funcs.keyword_targets(
+                args.dname,
+                fnames,
+                entries,
+                changed,
+                base = "HEAD" if args.since is None else args.since,
+            )
 
-        # Skip Python scripts which are known Git submodules ...
-        if "/openflights/" in fname:
-            continue
-        if "/stations/" in fname:
-            continue
-        if "/validator/" in fname:
-            continue
+        # Print (or stream) the keyword-only arguments which are not sorted
+        # or not passed ...
+        if args.format == "text":
+            for line in funcs.report_keyword_arguments(
+                fnames,
+                entries,
+                  table = None,
+                targets = targets,
+            ):
+                print(line)
+        else:
+            funcs.write_report(
+                funcs.keyword_diagnostics(
+                    fnames,
+                    entries,
+                      table = None,
+                    targets = targets,
+                ),
+                sys.stdout,
+                 fmt = args.format,
+                tool = "checkAllKeywordArguments",
+            )
 
-        # Load the Python script ...
-        with open(fname, "rt", encoding = "utf-8") as fObj:
-            src = fObj.read()
-
-        # Parse the Python script ...
-        tree = ast.parse(src)
-
-        # Loop over bodies ...
-        for body in tree.body:
-            # Skip bodies which are not function definitions ...
-            if not isinstance(body, ast.FunctionDef):
-                continue
-
-            # Loop over nodes in the body ...
-            for node in ast.walk(body):
-                # Skip this node if it is not a function call (or if it is a
-                # member of a module) ...
-                if not isinstance(node, ast.Call):
-                    continue
-                if not isinstance(node.func, ast.Name):
-                    continue
-
-                # Skip this function call if it is not in the database ...
-                if node.func.id not in funcs:
-                    continue
-
-                # Find all the keyword-only arguments that are passed ...
-                keywords = []
-                for keyword in node.keywords:
-                    if not keyword.arg:
-                        continue
-                    keywords.append(keyword.arg)
-
-                # Loop over keyword-only arguments that *should* be passed ...
-                for keyword in funcs[node.func.id]:
-                    # Skip this keyword-only argument if it is passed ...
-                    if keyword in keywords:
-                        continue
-
-                    # Print ...
-                    print(f"\"{body.name}()\" in \"{fname}\" calls \"{node.func.id}()\" but does not pass \"{keyword} = \".")
+    # Save cache ...
+    if not args.noCache:
+        funcs.save_cache(
+            f"{args.cacheDir}/checkAllKeywordArguments.json",
+            CACHE_VERSION,
+            cache,
+        )
@@ -1,273 +1,24 @@
 #!/usr/bin/env python3
 
-# Define function ...
-def checkAddArgument(nodeIn, fnameIn, /):
-    """
-    Check that all "parser.add_argument()" calls specify the type.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Attribute):                              # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "parser.add_argument()" call ...
-    if nodeIn.func.attr != "add_argument":
-        return
-    if nodeIn.func.value.id != "parser":
-        return
-
-    # Skip this node if it is a Boolean flag ...
-    skip = False
-    for keyword in nodeIn.keywords:
-        if keyword.arg == "action":
-            if keyword.value.value in ["store_false", "store_true",]:
-                skip = True
-                break
-    if skip:
-        return
-
-    # Skip this node if it sets the argument type ...
-    skip = False
-    for keyword in nodeIn.keywords:
-        if keyword.arg == "type":
-            skip = True
-            break
-    if skip:
-        return
-
-    # Print ...
-    print(f"\"{fnameIn}\" adds the argument \"{nodeIn.args[0].value}\" without specifying the type.")
-
-# Define function ...
-def checkCartopy(nodeIn, fnameIn, /):
-    """
-    Check that all "ax*.stock_img()", "ax*.background_img()", "ax*.add_image()",
-    "ax*.imshow()" and "ax*.pcolormesh()" calls specify the regrid shape but not
-    the interpolation or the resampling.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Attribute):                              # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "ax*.stock_img()" call or a
-    # "ax*.background_img()" call or a "ax*.add_image()" call or a
-    # "ax*.imshow()" call or a "ax*.pcolormesh()" call ...
-    if nodeIn.func.attr not in [
-        "stock_img",
-        "background_img",
-        "add_image",
-        "imshow",
-        "pcolormesh",
-    ]:
-        return
-    if not nodeIn.func.value.id.startswith("ax"):
-        return
-
-    # Print message if this node does not set the regrid shape ...
-    setsKeyword = False
-    for keyword in nodeIn.keywords:
-        if keyword.arg == "regrid_shape":
-            setsKeyword = True
-            break
-    if not setsKeyword:
-        print(f"\"{fnameIn}\" has a \"{nodeIn.func.value.id}.{nodeIn.func.attr}()\" call without specifying \"regrid_shape\".")
-
-    # Print message if this node sets the interpolation ...
-    setsKeyword = False
-    for keyword in nodeIn.keywords:
-        if keyword.arg == "interpolation":
-            setsKeyword = True
-            break
-    if setsKeyword:
-        print(f"\"{fnameIn}\" has a \"{nodeIn.func.value.id}.{nodeIn.func.attr}()\" call which specifies \"interpolation\".")
-
-    # Print message if this node sets the resample ...
-    setsKeyword = False
-    for keyword in nodeIn.keywords:
-        if keyword.arg == "resample":
-            setsKeyword = True
-            break
-    if setsKeyword:
-        print(f"\"{fnameIn}\" has a \"{nodeIn.func.value.id}.{nodeIn.func.attr}()\" call which specifies \"resample\".")
-
-# Define function ...
-def checkLegend(nodeIn, fnameIn, /):
-    """
-    Check that all "ax*.legend()" calls specify the location.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Attribute):                              # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "ax*.legend()" call ...
-    if nodeIn.func.attr != "legend":
-        return
-    if not nodeIn.func.value.id.startswith("ax"):
-        return
-
-    # Skip this node if it sets the location ...
-    skip = False
-    for keyword in nodeIn.keywords:
-        if keyword.arg == "loc":
-            skip = True
-            break
-    if skip:
-        return
-
-    # Print ...
-    print(f"\"{fnameIn}\" adds a legend to \"{nodeIn.func.value.id}\" without specifying the location.")
-
-# Define function ...
-def checkMap(nodeIn, fnameIn, /):
-    """
-    Check that all "map()" calls specify the strictness.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Name):                                   # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "map()" call ...
-    if nodeIn.func.id != "map":
-        return
-
-    # Loop over keyword arguments ...
-    for kwArg in ["strict",]:
-        # Skip this node if it sets the "map()" keyword argument ...
-        skip = False
-        for keyword in nodeIn.keywords:
-            if keyword.arg == kwArg:
-                skip = True
-                break
-        if skip:
-            continue
-
-        # Print ...
-        print(f"\"{fnameIn}\" uses \"map()\" without specifying the {kwArg}.")
-
-# Define function ...
-def checkPost(nodeIn, fnameIn, /):
-    """
-    Check that all "requests.post()" calls specify the timeout.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Attribute):                              # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "requests.post()" call ...
-    if nodeIn.func.attr != "post":
-        return
-    if nodeIn.func.value.id != "requests":
-        return
-
-    # Loop over keyword arguments ...
-    for kwArg in ["timeout",]:
-        # Skip this node if it sets the "requests.post()" keyword argument ...
-        skip = False
-        for keyword in nodeIn.keywords:
-            if keyword.arg == kwArg:
-                skip = True
-                break
-        if skip:
-            continue
-
-        # Print ...
-        print(f"\"{fnameIn}\" uses \"requests.post()\" without specifying the {kwArg}.")
-
-# Define function ...
-def checkRun(nodeIn, fnameIn, /):
-    """
-    Check that all "subprocess.run()" calls specify the timeout.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Attribute):                              # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "subprocess.run()" call ...
-    if nodeIn.func.attr != "run":
-        return
-    if nodeIn.func.value.id != "subprocess":
-        return
-
-    # Loop over keyword arguments ...
-    for kwArg in ["check", "encoding", "timeout",]:
-        # Skip this node if it sets the "subprocess.run()" keyword argument ...
-        skip = False
-        for keyword in nodeIn.keywords:
-            if keyword.arg == kwArg:
-                skip = True
-                break
-        if skip:
-            continue
-
-        # Print ...
-        print(f"\"{fnameIn}\" uses \"subprocess.run()\" without specifying the {kwArg}.")
-
-# Define function ...
-def checkZip(nodeIn, fnameIn, /):
-    """
-    Check that all "zip()" calls specify the strictness.
-    """
-
-    # Skip this node if it is not a function call (or if it is not an attribute
-    # call) ...
-    if not isinstance(nodeIn, ast.Call):                                        # pylint: disable=E0606
-        return
-    if not isinstance(nodeIn.func, ast.Name):                                   # pylint: disable=E0606
-        return
-
-    # Skip this node if it is not a "zip()" call ...
-    if nodeIn.func.id != "zip":
-        return
-
-    # Loop over keyword arguments ...
-    for kwArg in ["strict",]:
-        # Skip this node if it sets the "zip()" keyword argument ...
-        skip = False
-        for keyword in nodeIn.keywords:
-            if keyword.arg == kwArg:
-                skip = True
-                break
-        if skip:
-            continue
-
-        # Print ...
-        print(f"\"{fnameIn}\" uses \"zip()\" without specifying the {kwArg}.")
+# Define the version of the cache (which must be changed whenever the structure
+# of the diagnostics changes) ...
+CACHE_VERSION = "1"
 
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
     import argparse
-    import ast
+    import collections
+    import json
+    import os
+    import resource
+    import sys
+    import time
+    import typing
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
@@ -282,53 +33,537 @@ if __name__ == "__main__":
         help = "the folder to check",
         type = str,
     )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of diagnostics in",
+           type = str,
+    )
     parser.add_argument(
         "--debug",
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--format",
+        choices = [
+            "jsonl",
+            "sarif",
+            "text",
+        ],
+        default = "text",
+           help = "the format to print the diagnostics in (\"jsonl\" and \"sarif\" are streamed as they are found, with the file, the line, the column, the rule ID and the message of each diagnostic) (\"--profile\" is printed to standard error if it is not \"text\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to parse and check Python scripts with",
+           type = int,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of diagnostics (or the shared store of diagnostics keyed by Git blob ID)",
+    )
+    parser.add_argument(
+        "--perf",
+        action = "store_true",
+          help = "also check the rules of the performance anti-patterns in \"checkEverythingPerformance.json\" (such as membership tests of lists, \"open()\" and \"json.load()\" and string concatenation inside loops), which report how deeply they are nested inside loops",
+    )
+    parser.add_argument(
+        "--profile",
+        action = "store_true",
+          help = "print how long is spent finding, reading, parsing, walking and checking the Python scripts (and checking each rule) and the peak memory usage (use with \"--no-cache\" to profile every Python script)",
+    )
+    parser.add_argument(
+        "--profile-json",
+        default = None,
+           dest = "profileJson",
+           help = "the JSON file to write the profile to (implies \"--profile\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--profile-top",
+        default = 10,
+           dest = "profileTop",
+           help = "the number of the slowest Python scripts to print if \"--profile\"",
+           type = int,
+    )
+    parser.add_argument(
+        "--rev",
+        default = None,
+           dest = "revs",
+           help = "the Git revisions (for example, commits, branches or tags) to check, reading the Python scripts from the Git object store instead of from the folder (only the shared store of diagnostics keyed by Git blob ID is used)",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--rules",
+        default = [
+            f"{os.path.dirname(os.path.realpath(__file__))}/checkEverything.json",
+        ],
+           dest = "rFiles",
+           help = "the JSON files of rules to check",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--shard",
+        default = None,
+           help = "only check the Python scripts whose paths (relative to the folder) hash into this shard, written as \"i/N\" (for example, \"1/4\"), and save the diagnostics to \"--shard-file\" instead of printing them (see \"mergeShards.py\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--shard-file",
+        default = None,
+           dest = "shardFile",
+           help = "the JSON file to save the diagnostics of the shard to (if not given then it is \"checkEverything.shard<i>of<N>.json\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--since",
+        default = None,
+           help = "only check the Python scripts which differ from this Git reference (listing them with \"git diff\", along with the new ones which are not tracked)",
+           type = str,
+    )
+    parser.add_argument(
+        "--staged",
+        action = "store_true",
+          help = "only check the Python scripts which are staged (listing them with \"git diff --cached\" and checking their staged contents)",
+    )
     args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+    args.profile = args.profile or args.profileJson is not None
+    if args.perf:
+        args.rFiles.append(f"{os.path.dirname(os.path.realpath(__file__))}/checkEverythingPerformance.json")
+    args.rFiles = tuple(os.path.realpath(rFile) for rFile in args.rFiles)
+
+    # Check arguments ...
+    if args.revs is not None and (args.since is not None or args.staged):
+        raise Exception("\"--rev\" cannot be used with \"--since\" or \"--staged\"") from None
+
+    # Parse the shard ...
+    shard = None
+    if args.shard is not None:
+        shard = funcs.parse_shard(args.shard)
+        if args.shardFile is None:
+            args.shardFile = f"checkEverything.shard{shard[0]:d}of{shard[1]:d}.json"
+
+    # Start timer ...
+    start = time.perf_counter()
 
     # **************************************************************************
 
-    # Loop over files in folder ...
-    for fname in pyguymer3.return_file_list(
-        args.dname,
-            allowHidden = True,
-                  debug = args.debug,
-        follow_symlinks = False,
-        return_symlinks = False,
-    ):
+    # Compile the rules ...
+    rules, _ = funcs.compile_rules(args.rFiles)
+    fingerprints = {}
+    for rule in rules:
+        fingerprints[rule["id"]] = rule["fingerprint"]
+
+    # Load cache ...
+    cache = {}
+    if not args.noCache and args.revs is None:
+        cache = funcs.load_cache(
+            f"{args.cacheDir}/checkEverything.json",
+            CACHE_VERSION,
+            debug = args.debug,
+        )
+
+    # Open the store of diagnostics keyed by Git blob ID, which is shared by
+    # every folder and every revision that is checked (so that byte-identical
+    # Python scripts are only checked once), and find the Git blob IDs of the
+    # unmodified files in folder from the Git index (so that their diagnostics
+    # can be found without reading them) ...
+    db = None
+    index = {}
+    if not args.noCache:
+        db = funcs.open_blob_store(
+            f"{args.cacheDir}/checkEverything.sqlite3",
+            CACHE_VERSION,
+        )
+        if args.revs is None:
+            index = funcs.index_blobs(
+                args.dname,
+                timeout = 60.0,
+            )
+
+    # **************************************************************************
+
+    # Initialize lists ...
+    iFiles = []
+    fnames = []
+    entries = []
+    tasks = []
+    taskIndices = []
+    taskNames = []
+    taskReads = []
+    storeEntries = []
+
+    # Initialize dictionaries, queue and stream (which are only used for
+    # revisions) ...
+    blobs : dict[str, dict[str, typing.Any]] = {}
+    keys = {}
+    shas = {}
+    pending : collections.deque[str] = collections.deque()
+    stream = None
+
+    # Initialize dictionary (which is only used for staged Python scripts) ...
+    stagedSrcs = {}
+
+    # List either the files in the revisions (from the Git object store), the
+    # files in folder which have changed (using Git) or all of the files in
+    # folder (listing them from the Git index where possible, which skips Git
+    # submodules) ...
+    if args.revs is not None:
+        # Loop over revisions and name each file after its revision and its
+        # path ...
+        for rev in dict.fromkeys(args.revs):
+            for path, sha in funcs.list_tree(
+                args.dname,
+                rev,
+                timeout = 60.0,
+            ):
+                keys[f"{rev}:{os.path.join(args.dname, path)}"] = f"{rev}:{path}"
+                shas[f"{rev}:{os.path.join(args.dname, path)}"] = sha
+        candidates = list(shas.keys())
+
+        # Start streaming the contents of the Python scripts from the Git
+        # object store, asking for each blob only when it is needed (by adding
+        # it to the queue just before asking the stream for it) ...
+        stream = funcs.cat_blobs(
+            args.dname,
+            iter(pending.popleft, None),
+        )
+    elif args.since is not None or args.staged:
+        candidates = funcs.changed_files(
+            args.dname,
+              since = args.since,
+             staged = args.staged,
+            timeout = 60.0,
+        )
+
+        # Read the staged contents of the Python scripts (which are what will be
+        # committed, even if the files have been changed since they were
+        # staged) ...
+        if args.staged:
+            stagedSrcs = funcs.staged_sources(
+                args.dname,
+                [fname for fname in candidates if fname.endswith(".py")],
+                timeout = 60.0,
+            )
+    else:
+        candidates = funcs.list_files(
+            args.dname,
+              debug = args.debug,
+            timeout = 60.0,
+        )
+
+    # Loop over files ...
+    for iFile, fname in enumerate(candidates):
         # Skip files which are not Python scripts ...
         if not fname.endswith(".py"):
             continue
 
-        # Skip Python scripts which are known Git submodules ...
-        if "/openflights/" in fname:
+        # Skip this Python script if it is not in the shard ...
+        if shard is not None and not funcs.in_shard(
+            keys.get(fname, os.path.relpath(fname, args.dname)),
+            shard,
+        ):
             continue
-        if "/ourairports-data/" in fname:
+
+        # Find the cache entry of the Python script and make a list of the rules
+        # which do not have valid cached diagnostics in it ...
+        # NOTE: Blobs which appear in more than one revision (or at more than
+        #       one path) share a single entry, so they are only checked once.
+        # NOTE: Staged Python scripts are checked from their staged contents,
+        #       so they do not use the cache (which is keyed by the file).
+        readStart = time.perf_counter()
+        if fname in stagedSrcs:
+            src = stagedSrcs[fname]
+            entry = {
+                "sha" : funcs.blob_sha(src),
+            }
+        elif args.revs is None:
+            entry, src = funcs.check_cache(
+                cache,
+                fname,
+                sha = index.get(fname),
+            )
+        elif shas[fname] in blobs:
+            iFiles.append(iFile)
+            fnames.append(fname)
+            entries.append(blobs[shas[fname]])
             continue
-        if "/stations/" in fname:
+        else:
+            entry = blobs[shas[fname]] = {
+                "sha" : shas[fname],
+            }
+            src = None
+        if "rules" not in entry:
+            entry["rules"] = {}
+        ruleIds = []
+        for rule in rules:
+            if entry["rules"].get(rule["id"], {}).get("fingerprint") != fingerprints[rule["id"]]:
+                ruleIds.append(rule["id"])
+        iFiles.append(iFile)
+        fnames.append(fname)
+        entries.append(entry)
+
+        # Load the diagnostics of these rules from the store (if they were
+        # found for a byte-identical Python script before) ...
+        if db is not None and ruleIds:
+            stored = funcs.load_blob_results(
+                db,
+                entry["sha"],
+                {ruleId : fingerprints[ruleId] for ruleId in ruleIds},
+            )
+            entry["rules"].update(stored)
+            ruleIds = [ruleId for ruleId in ruleIds if ruleId not in stored]
+
+        # Skip this Python script if there aren't any rules which need
+        # checking ...
+        if not ruleIds:
             continue
-        if "/validator/" in fname:
+
+        # Remember to save the diagnostics of this Python script in the store
+        # (once they have been found) ...
+        if db is not None:
+            storeEntries.append(entry)
+
+        # Read the Python script from the Git object store (if it is in a
+        # revision) ...
+        if stream is not None:
+            pending.append(entry["sha"])
+            _, src = next(stream)
+
+        # Find which trigger tokens appear in the Python script (without
+        # parsing it, and loading it only if any of them do) and store empty
+        # diagnostics for the rules which cannot match anything in it ...
+        found, src = funcs.find_triggers(
+            fname if src is None else src,
+            tuple(trigger for rule in rules if rule["id"] in ruleIds for trigger in rule["triggers"]),
+            load = True,
+        )
+        for rule in rules:
+            if rule["id"] in ruleIds and found.isdisjoint(rule["triggers"]):
+                entry["rules"][rule["id"]] = {
+                    "diagnostics" : [],
+                    "fingerprint" : fingerprints[rule["id"]],
+                }
+                ruleIds.remove(rule["id"])
+
+        # Skip this Python script if there aren't any rules which can match
+        # anything in it ...
+        if not ruleIds:
             continue
 
-        # Load the Python script ...
-        with open(fname, "rt", encoding = "utf-8") as fObj:
-            src = fObj.read()
-
-        # Parse the Python script ...
-        tree = ast.parse(src)
-
-        # Loop over bodies ...
-        for body in tree.body:
-            # Loop over nodes in the body ...
-            for node in ast.walk(body):
-                # Check everything ...
-                checkAddArgument(node, fname)
-                checkCartopy(node, fname)
-                checkLegend(node, fname)
-                checkMap(node, fname)
-                checkPost(node, fname)
-                checkRun(node, fname)
-                checkZip(node, fname)
+        # Append task ...
+        tasks.append((src, args.rFiles, tuple(ruleIds)))
+        taskIndices.append(len(entries) - 1)
+        taskNames.append(fname)
+        taskReads.append(time.perf_counter() - readStart)
+
+    # Stop streaming the contents of the Python scripts from the Git object
+    # store ...
+    if stream is not None:
+        stream.close()
+
+    # Stop timer and start timer ...
+    phases = {
+        "find" : time.perf_counter() - start,
+    }
+    start = time.perf_counter()
+
+    # Parse and check the Python scripts (in parallel, if requested, and
+    # profiling them, if requested), yielding the answers as soon as they have
+    # been found ...
+    taskStats : list[dict[str, typing.Any]] = []
+    answers = funcs.iter_jobs(
+        funcs.profile_source if args.profile else funcs.check_source,
+        tasks,
+        jobs = args.jobs,
+    )
+
+    # Define function ...
+    def checked(scriptEntries, /):
+        """Yield each Python script as soon as its diagnostics have been found"""
+
+        # Pair each task with its answer and find the first one ...
+        done = zip(taskIndices, answers, strict = True)
+        task = next(done, None)
+
+        # Loop over Python scripts ...
+        for i, (iScript, scriptName) in enumerate(zip(iFiles, fnames, strict = True)):
+            # Store the diagnostics in the cache entry (if this Python script
+            # needed checking, as the tasks are in the same order as the Python
+            # scripts) and find the next task ...
+            scriptEntry = scriptEntries[i]
+            if task is not None and task[0] == i:
+                results = task[1]
+                if args.profile:
+                    results, scriptStats = results
+                    taskStats.append(scriptStats)
+                for scriptRuleId, diagnostics in results.items():
+                    scriptEntry["rules"][scriptRuleId] = {
+                        "diagnostics" : diagnostics,
+                        "fingerprint" : fingerprints[scriptRuleId],
+                    }
+                task = next(done, None)
+
+            # Forget about the cached diagnostics of any rules which no longer
+            # exist ...
+            for scriptRuleId in list(scriptEntry["rules"].keys()):
+                if scriptRuleId not in fingerprints:
+                    del scriptEntry["rules"][scriptRuleId]
+
+            # Forget about this Python script once it has been reported (if it
+            # isn't going to be saved in the cache), so that the diagnostics are
+            # never all in memory at the same time ...
+            if args.noCache:
+                scriptEntries[i] = None
+
+            # Yield the Python script ...
+            yield iScript, scriptName, scriptEntry
+
+    # Initialize list ...
+    shardFiles = []
+
+    # Report the diagnostics of each Python script as soon as they have been
+    # found (in the same order as the Python scripts), either by streaming
+    # them, by printing them or by appending them to the results of the shard
+    # (if there are any) ...
+    if shard is None and args.format != "text":
+        funcs.write_report(
+            (
+                diagnostic
+                for _, fname, entry in checked(entries)
+                for diagnostic in funcs.rule_diagnostics(fname, entry["rules"], rules)
+            ),
+            sys.stdout,
+             fmt = args.format,
+            tool = "checkEverything",
+        )
+    else:
+        for iFile, fname, entry in checked(entries):
+            lines = funcs.report_rules(fname, entry["rules"], rules)
+            if shard is not None:
+                if lines:
+                    shardFiles.append((iFile, fname, lines))
+                continue
+            for line in lines:
+                print(line)
+
+    # Stop timer and start timer ...
+    phases["check"] = time.perf_counter() - start
+    start = time.perf_counter()
+
+    # **************************************************************************
+
+    # Save the results of the shard ...
+    if shard is not None:
+        funcs.save_shard(
+            args.shardFile,
+            "checkEverything",
+            CACHE_VERSION,
+            shard,
+            shardFiles,
+            context = {},
+        )
+
+    # Save cache ...
+    if not args.noCache and args.revs is None:
+        funcs.save_cache(
+            f"{args.cacheDir}/checkEverything.json",
+            CACHE_VERSION,
+            cache,
+        )
+
+    # Save the new diagnostics in the store and close it ...
+    if db is not None:
+        for entry in storeEntries:
+            funcs.save_blob_results(
+                db,
+                entry["sha"],
+                entry["rules"],
+            )
+        db.commit()
+        db.close()
+
+    # Stop timer ...
+    phases["save"] = time.perf_counter() - start
+
+    # **************************************************************************
+
+    # Check if the user wants to profile ...
+    if args.profile:
+        # Initialize profile ...
+        # NOTE: The peak resident set sizes are reported by "getrusage()" in
+        #       KiB on Linux and in bytes on MacOS.
+        profile : dict[str, typing.Any] = {
+                "checked" : len(tasks),
+                  "files" : len(fnames),
+                  "nodes" : sum(stats["nodes"] for stats in taskStats),
+                 "phases" : phases,
+             "peakRssKiB" : {
+                "children" : resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+                    "self" : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+            },
+                  "rules" : {},
+                "scripts" : [],
+                  "times" : {
+                "parse" : sum(stats["parse"] for stats in taskStats),
+                 "read" : sum(taskReads),
+                "rules" : sum(sum(ruleStats["time"] for ruleStats in stats["rules"].values()) for stats in taskStats),
+                 "walk" : sum(stats["walk"] for stats in taskStats),
+            },
+        }
+
+        # Loop over rules and sum their calls and their times ...
+        for rule in rules:
+            profile["rules"][rule["id"]] = {
+                "calls" : sum(stats["rules"].get(rule["id"], {}).get("calls", 0) for stats in taskStats),
+                 "time" : sum(stats["rules"].get(rule["id"], {}).get("time", 0.0) for stats in taskStats),
+            }
+
+        # Loop over checked Python scripts and make a list of the slowest ones ...
+        for fname, read, stats in zip(taskNames, taskReads, taskStats, strict = True):
+            profile["scripts"].append(
+                {
+                    "fname" : fname,
+                    "nodes" : stats["nodes"],
+                    "parse" : stats["parse"],
+                     "read" : read,
+                    "rules" : sum(ruleStats["time"] for ruleStats in stats["rules"].values()),
+                    "total" : read + stats["parse"] + stats["walk"] + sum(ruleStats["time"] for ruleStats in stats["rules"].values()),
+                     "walk" : stats["walk"],
+                }
+            )
+        profile["scripts"].sort(key = lambda script: script["total"], reverse = True)
+        profile["scripts"] = profile["scripts"][:args.profileTop]
+
+        # Print profile (to standard error if the diagnostics are not printed
+        # as text, so that it does not corrupt them) ...
+        pObj = sys.stdout if args.format == "text" else sys.stderr
+        print(80 * "*", file = pObj)
+        print(f"Found {profile['files']:,d} Python scripts ({profile['checked']:,d} of which needed checking) in {phases['find']:.6f} s, checked and reported them in {phases['check']:.6f} s and saved them in {phases['save']:.6f} s.", file = pObj)
+        print(f"Reading took {profile['times']['read']:.6f} s, parsing took {profile['times']['parse']:.6f} s, walking {profile['nodes']:,d} nodes took {profile['times']['walk']:.6f} s and checking rules took {profile['times']['rules']:.6f} s.", file = pObj)
+        for ruleId, ruleStats in profile["rules"].items():
+            print(f"  \"{ruleId}\" was checked {ruleStats['calls']:,d} times in {ruleStats['time']:.6f} s.", file = pObj)
+        print(f"The {len(profile['scripts']):,d} slowest Python scripts were:", file = pObj)
+        for script in profile["scripts"]:
+            print(f"  \"{script['fname']}\" took {script['total']:.6f} s (reading took {script['read']:.6f} s, parsing took {script['parse']:.6f} s, walking {script['nodes']:,d} nodes took {script['walk']:.6f} s and checking rules took {script['rules']:.6f} s).", file = pObj)
+        print(f"The peak memory usage was {profile['peakRssKiB']['self']:,d} KiB (and {profile['peakRssKiB']['children']:,d} KiB in child processes, such as worker processes).", file = pObj)
+
+        # Save profile ...
+        if args.profileJson is not None:
+            with open(args.profileJson, "wt", encoding = "utf-8") as jObj:
+                json.dump(
+                    profile,
+                    jObj,
+                    ensure_ascii = False,
+                          indent = 4,
+                       sort_keys = True,
+                )
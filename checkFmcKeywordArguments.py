@@ -1,22 +1,19 @@
 #!/usr/bin/env python3
 
+# Define the version of the cache (which must be changed whenever the structure
+# of the summaries changes) ...
+CACHE_VERSION = "3"
+
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
     import argparse
-    import ast
     import os
+    import sys
 
-    # Import my modules ...
-    try:
-        import fmc
-    except:
-        raise Exception("\"fmc\" is not installed; run \"pip install --user git+https://github.com/Guymer/fmc.git\"") from None
-    try:
-        import pyguymer3
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
@@ -31,16 +28,80 @@ if __name__ == "__main__":
         help = "the folder to check",
         type = str,
     )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of summaries in",
+           type = str,
+    )
     parser.add_argument(
         "--debug",
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--format",
+        choices = [
+            "jsonl",
+            "sarif",
+            "text",
+        ],
+        default = "text",
+           help = "the format to print the diagnostics in (\"jsonl\" and \"sarif\" are streamed as they are found, with the file, the line, the column, the rule ID and the message of each diagnostic) (the log is only printed if it is \"text\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to parse Python scripts with",
+           type = int,
+    )
+    parser.add_argument(
+        "--library",
+        default = [
+            "fmc",
+        ],
+           dest = "libraries",
+           help = "the installed libraries to check the calls of",
+          nargs = "+",
+           type = str,
+    )
     parser.add_argument(
         "--lite",
         action = "store_true",
           help = "don't check for \"un-important\" keyword-only arguments (see \"--un-important-keyword-arguments\")",
     )
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of summaries",
+    )
+    parser.add_argument(
+        "--shard",
+        default = None,
+           help = "only summarise the Python scripts whose paths (relative to the folder) hash into this shard, written as \"i/N\" (for example, \"1/4\"), and save the summaries to \"--shard-file\" instead of printing anything (see \"mergeShards.py\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--shard-file",
+        default = None,
+           dest = "shardFile",
+           help = "the JSON file to save the summaries of the shard to (if not given then it is \"checkFmcKeywordArguments.shard<i>of<N>.json\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--since",
+        default = None,
+           help = "only check the Python scripts which differ from this Git reference (listing them with \"git diff\", along with the new ones which are not tracked)",
+           type = str,
+    )
+    parser.add_argument(
+        "--staged",
+        action = "store_true",
+          help = "only check the Python scripts which are staged (listing them with \"git diff --cached\" and checking their staged contents)",
+    )
     parser.add_argument(
         "--un-important-keyword-arguments",
         default = [
@@ -59,190 +120,211 @@ if __name__ == "__main__":
            type = str,
     )
     args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+
+    # Parse the shard ...
+    shard = None
+    if args.shard is not None:
+        shard = funcs.parse_shard(args.shard)
+        if args.shardFile is None:
+            args.shardFile = f"checkFmcKeywordArguments.shard{shard[0]:d}of{shard[1]:d}.json"
 
     # **************************************************************************
 
     # Initialize database ...
-    funcs : dict[str, list[str]] = {}
+    kwFuncs : dict[str, list[str]] = {}
+
+    # Loop over libraries and add the keyword-only arguments of their functions
+    # to the database ...
+    for library in args.libraries:
+        kwFuncs.update(
+            funcs.signature_index(
+                library,
+                cacheDir = args.cacheDir,
+                   debug = args.debug,
+                    jobs = args.jobs,
+                 noCache = args.noCache,
+            )
+        )
 
-    # Loop over files in folder ...
-    for fname in pyguymer3.return_file_list(
-        fmc.__path__[0],
-            allowHidden = True,
-                  debug = args.debug,
-        follow_symlinks = False,
-        return_symlinks = False,
-    ):
+    # **************************************************************************
+
+    # Load cache ...
+    cache = {}
+    if not args.noCache:
+        cache = funcs.load_cache(
+            f"{args.cacheDir}/checkFmcKeywordArguments.json",
+            CACHE_VERSION,
+            debug = args.debug,
+        )
+
+    # Create short-hand for where the summaries of the function calls to the
+    # libraries are stored in the cache entries ...
+    callsKey = f"calls/{','.join(args.libraries)}"
+
+    # Initialize lists ...
+    iFiles = []
+    fnames = []
+    entries = []
+    tasks = []
+    taskEntries = []
+
+    # Initialize dictionary (which is only used for staged Python scripts) ...
+    stagedSrcs = {}
+
+    # List either the files in folder which have changed (using Git) or all of
+    # the files in folder (listing them from the Git index where possible,
+    # which skips Git submodules) ...
+    if args.since is not None or args.staged:
+        candidates = funcs.changed_files(
+            args.dname,
+              since = args.since,
+             staged = args.staged,
+            timeout = 60.0,
+        )
+
+        # Read the staged contents of the Python scripts (which are what will be
+        # committed, even if the files have been changed since they were
+        # staged) ...
+        if args.staged:
+            stagedSrcs = funcs.staged_sources(
+                args.dname,
+                [fname for fname in candidates if fname.endswith(".py")],
+                timeout = 60.0,
+            )
+    else:
+        candidates = funcs.list_files(
+            args.dname,
+              debug = args.debug,
+            timeout = 60.0,
+        )
+
+    # Loop over files ...
+    for iFile, fname in enumerate(candidates):
         # Skip files which are not Python scripts ...
         if not fname.endswith(".py"):
             continue
 
-        # Skip Python scripts which are known Git submodules ...
-        if "/openflights/" in fname:
-            continue
-        if "/ourairports-data/" in fname:
-            continue
-        if "/stations/" in fname:
+        # Skip this Python script if it is not in the shard ...
+        if shard is not None and not funcs.in_shard(
+            os.path.relpath(fname, args.dname),
+            shard,
+        ):
             continue
-        if "/validator/" in fname:
-            continue
-
-        # Load the Python script ...
-        with open(fname, "rt", encoding = "utf-8") as fObj:
-            src = fObj.read()
-
-        # Parse the Python script ...
-        tree = ast.parse(src)
-
-        # Loop over bodies ...
-        for body in tree.body:
-            # Skip bodies which are not function definitions ...
-            if not isinstance(body, ast.FunctionDef):
-                continue
-
-            # Find out how many keyword-only arguments there are ...
-            nKwArgs = len(body.args.kwonlyargs)
-
-            # Skip if there aren't any keyword-only arguments ...
-            if nKwArgs == 0:
-                continue
-
-            # Determine key ...
-            key = f'fmc{os.path.dirname(fname).removeprefix(f"{fmc.__path__[0]}").replace("/", ".")}.{body.name}'
 
-            # Add this function to the database ...
-            if key not in funcs:
-                funcs[key] = []
+        # Find the cache entry of the Python script and skip it if the FMC
+        # function calls in it are already summarised ...
+        # NOTE: Staged Python scripts are checked from their staged contents,
+        #       so they do not use the cache (which is keyed by the file).
+        if fname in stagedSrcs:
+            src = stagedSrcs[fname]
+            entry = {
+                "sha" : funcs.blob_sha(src),
+            }
+        else:
+            entry, src = funcs.check_cache(
+                cache,
+                fname,
+                sha = None,
+            )
+        iFiles.append(iFile)
+        fnames.append(fname)
+        entries.append(entry)
+        if callsKey in entry:
+            continue
 
-            # Loop over keyword-only arguments ...
-            for iKwArg in range(nKwArgs):
-                # Append this keyword-only argument to the database ...
-                funcs[key].append(body.args.kwonlyargs[iKwArg].arg)
+        # Store an empty summary of the FMC function calls in the Python
+        # script if none of the libraries are named in it (without parsing
+        # it, and loading it only if any of them are), as they cannot be
+        # imported without being named ...
+        found, src = funcs.find_triggers(
+            fname if src is None else src,
+            tuple(args.libraries),
+            load = True,
+        )
+        if not found:
+            entry[callsKey] = []
+            continue
 
-    # **************************************************************************
+        # Append task ...
+        tasks.append((src, tuple(args.libraries)))
+        taskEntries.append(entry)
+
+    # Summarise the FMC function calls in the Python scripts (in parallel, if
+    # requested) ...
+    for entry, calls in zip(
+        taskEntries,
+        funcs.run_jobs(
+            funcs.summarise_library_calls,
+            tasks,
+            jobs = args.jobs,
+        ),
+        strict = True,
+    ):
+        entry[callsKey] = calls
 
-    # Initialize log ...
+    # Initialize list ...
     log = []
 
-    # Loop over files in folder ...
-    for fname in pyguymer3.return_file_list(
-        args.dname,
-            allowHidden = True,
+    # Check if this is a shard ...
+    if shard is not None:
+        # Save the summaries of the shard (and everything else that is needed
+        # to check them once the summaries of all of the shards are merged) ...
+        funcs.save_shard(
+            args.shardFile,
+            "checkFmcKeywordArguments",
+            CACHE_VERSION,
+            shard,
+            [
+                (iFile, fname, entry[callsKey])
+                for iFile, fname, entry in zip(iFiles, fnames, entries, strict = True)
+            ],
+            context = {
+                      "debug" : args.debug,
+                    "kwFuncs" : kwFuncs,
+                       "lite" : args.lite,
+                "unImpKwArgs" : args.unImpKwArgs,
+            },
+        )
+    elif args.format != "text":
+        # Check the FMC function calls in the Python scripts and stream the
+        # diagnostics ...
+        funcs.write_report(
+            funcs.library_diagnostics(
+                fnames,
+                [entry[callsKey] for entry in entries],
+                kwFuncs,
+                       lite = args.lite,
+                unImpKwArgs = args.unImpKwArgs,
+            ),
+            sys.stdout,
+             fmt = args.format,
+            tool = "checkFmcKeywordArguments",
+        )
+    else:
+        # Check the FMC function calls in the Python scripts ...
+        lines, log = funcs.report_library_calls(
+            fnames,
+            [entry[callsKey] for entry in entries],
+            kwFuncs,
                   debug = args.debug,
-        follow_symlinks = False,
-        return_symlinks = False,
-    ):
-        # Skip files which are not Python scripts ...
-        if not fname.endswith(".py"):
-            continue
-
-        print(f"Checking \"{fname}\" ...")
-
-        # Skip Python scripts which are known Git submodules ...
-        if "/openflights/" in fname:
-            continue
-        if "/ourairports-data/" in fname:
-            continue
-        if "/stations/" in fname:
-            continue
-        if "/validator/" in fname:
-            continue
-
-        # Load the Python script ...
-        with open(fname, "rt", encoding = "utf-8") as fObj:
-            src = fObj.read()
-
-        # Parse the Python script ...
-        tree = ast.parse(src)
-
-        # Loop over bodies ...
-        for body in tree.body:
-            # Loop over nodes in the body ...
-            for node in ast.walk(body):
-                # Skip this node if it is not a function call ...
-                if not isinstance(node, ast.Call):
-                    continue
-
-                # Skip this function call if the function is not an attribute ...
-                if not isinstance(node.func, ast.Attribute):
-                    continue
-
-                # Make a guess at recreating the source code, and skip if it
-                # isn't from FMC ...
-                srcGuess = ast.unparse(node)
-                if not srcGuess.startswith("fmc."):
-                    continue
-
-                print(f"  Found \"{srcGuess}\".")
-
-                # Determine key and skip if this FMC function doesn't have
-                # keywords ...
-                key = srcGuess.split("(", maxsplit = 1)[0].split("[", maxsplit = 1)[0]
-                if key not in funcs:
-                    print(f"    \"{key}\" doesn't have any keywords.")
-                    continue
-
-                # Make a dictionary of flags ...
-                flags = {}
-                for keyword in funcs[key]:
-                    flags[keyword] = False
-
-                # Handle FMC attributes ...
-                if isinstance(node.func.value, ast.Attribute):
-                    for keyword in node.keywords:
-                        if keyword.arg in funcs[key]:
-                            flags[keyword.arg] = True
-                            continue
-                        raise Exception(f"{fname} » {srcGuess} » \"{keyword.arg}\" is specified but it is not a recognised keyword")
-                    for keyword, flag in flags.items():
-                        if flag:
-                            if args.lite and keyword in args.unImpKwArgs:
-                                log.append(f"ERROR: {fname} » {srcGuess} » \"{keyword}\" is specified but it shouldn't be")
-                            continue
-                        if not args.lite or keyword not in args.unImpKwArgs:
-                            print(f"    \"{keyword}\" isn't specified.")
-                            log.append(f"LOG: {fname} » {srcGuess} » \"{keyword}\" isn't specified")
-                    continue
-
-                # Handle FMC calls ...
-                if isinstance(node.func.value, ast.Call):
-                    for keyword in node.func.value.keywords:
-                        if keyword.arg in funcs[key]:
-                            flags[keyword.arg] = True
-                            continue
-                        raise Exception(f"{fname} » {srcGuess} » \"{keyword.arg}\" is specified but it is not a recognised keyword")
-                    for keyword, flag in flags.items():
-                        if flag:
-                            if args.lite and keyword in args.unImpKwArgs:
-                                log.append(f"ERROR: {fname} » {srcGuess} » \"{keyword}\" is specified but it shouldn't be")
-                            continue
-                        if not args.lite or keyword not in args.unImpKwArgs:
-                            print(f"    \"{keyword}\" isn't specified.")
-                            log.append(f"LOG: {fname} » {srcGuess} » \"{keyword}\" isn't specified")
-                    continue
-
-                # Handle FMC names ...
-                if isinstance(node.func.value, ast.Name):
-                    for keyword in node.keywords:
-                        if keyword.arg in funcs[key]:
-                            flags[keyword.arg] = True
-                            continue
-                        raise Exception(f"{fname} » {srcGuess} » \"{keyword.arg}\" is specified but it is not a recognised keyword")
-                    for keyword, flag in flags.items():
-                        if flag:
-                            if args.lite and keyword in args.unImpKwArgs:
-                                log.append(f"ERROR: {fname} » {srcGuess} » \"{keyword}\" is specified but it shouldn't be")
-                            continue
-                        if not args.lite or keyword not in args.unImpKwArgs:
-                            print(f"    \"{keyword}\" isn't specified.")
-                            log.append(f"LOG: {fname} » {srcGuess} » \"{keyword}\" isn't specified")
-                    continue
-
-                # Catch unexpected types ...
-                print(f"WARNING: Unable to ascertain the keywords specified as \"node.func.value\" is a \"{type(node.func.value)}\".")
-                if args.debug:
-                    print(ast.dump(node, indent = 4))
+                   lite = args.lite,
+            unImpKwArgs = args.unImpKwArgs,
+        )
+
+        # Print ...
+        for line in lines:
+            print(line)
+
+    # Save cache ...
+    if not args.noCache:
+        funcs.save_cache(
+            f"{args.cacheDir}/checkFmcKeywordArguments.json",
+            CACHE_VERSION,
+            cache,
+        )
 
     # Print log ...
-    print(80 * "*")
-    print("\n".join(log))
+    if shard is None and args.format == "text":
+        print(80 * "*")
+        print("\n".join(log))
@@ -5,25 +5,49 @@
 if __name__ == "__main__":
     # Import standard modules ...
     import argparse
-    import glob
+    import concurrent.futures
     import os
-    import shutil
-    import subprocess
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
     # Create argument parser and parse the arguments ...
     parser = argparse.ArgumentParser(
            allow_abbrev = False,
-            description = "Add required files to GitHub repositories.",
+            description = "Add required files to GitHub repositories and find the required files which are out-of-date (which are different to the ones in this Git repository).",
         formatter_class = argparse.ArgumentDefaultsHelpFormatter,
     )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of Git repositories in",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 8,
+           help = "the number of Git repositories to check at the same time",
+           type = int,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of Git repositories",
+    )
+    parser.add_argument(
+        "--sync",
+        action = "store_true",
+          help = "overwrite (and add to the Git index) the required files which are out-of-date with the ones in this Git repository (unless they have uncommitted changes or merge conflicts)",
+    )
     parser.add_argument(
         "--timeout",
         default = 60.0,
@@ -31,167 +55,41 @@ if __name__ == "__main__":
            type = float,
     )
     args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
 
     # **************************************************************************
 
-    # Loop over Git repositories ...
-    for gName in sorted(glob.glob("*/.git")):
-        # Skip this Git repository if it is a submodule ...
-        if not os.path.isdir(gName):
-            continue
-
-        # Create short-hands ...
-        dName = os.path.dirname(gName)
-        onGist = pyguymer3.git_remote(
-            dName,
-            timeout = args.timeout,
-        ).startswith("git@gist.github.com:")
-        onGitHub = pyguymer3.git_remote(
-            dName,
-            timeout = args.timeout,
-        ).startswith("git@github.com:")
-
-        # Find all files in the Git repository ...
-        gFiles = pyguymer3.git_files(
-            dName,
-            timeout = args.timeout,
-        )
+    # Find the Git repositories (finding their remotes from the cache, which is
+    # only refreshed for the Git repositories which have changed) and skip the
+    # ones which are submodules ...
+    repositories = [
+        repository for repository in funcs.discover_repositories(
+            ".",
+            cacheDir = None if args.noCache else args.cacheDir,
+               debug = args.debug,
+             timeout = args.timeout,
+        ) if repository["gitDir"]
+    ]
 
-        # Check that the basic required files are present ...
-        requiredFiles = [
-            ".editorconfig",
-            ".gitignore",
-            ".mypy.ini",
-            ".pylint.ini",
-            ".shellcheckrc",
-            "README.md",
-            "requirements.txt",
-        ]
-        if onGist or onGitHub:
-            requiredFiles += [
-                ".github/FUNDING.yml",
-                "LICENCE.txt",
-            ]
-        for gFile in requiredFiles:
-            if gFile in gFiles:
-                continue
-            if onGist and "/" in gFile: # NOTE: Gist cannot handle sub-folders.
-                continue
-            print(f"\"{dName}/{gFile}\" is missing.")
-            shutil.copy(
-                f"{os.path.dirname(os.path.realpath(__file__))}/{gFile}",
-                f"{dName}/{gFile}",
-            )
-            subprocess.run(
-                ["git", "add", "--intent-to-add", gFile],
-                   check = True,
-                     cwd = dName,
-                encoding = "utf-8",
-                  stderr = subprocess.DEVNULL,
-                  stdout = subprocess.DEVNULL,
-                 timeout = args.timeout,
-            )
-
-        # Skip Git repository if it is not published on GitHub ...
-        if not onGitHub:
-            continue
-
-        # Determine if it has any BASH scripts and check that the required
-        # GitHub Action workflow YAML file is present ...
-        hasBash = False
-        for gFile in gFiles:
-            if gFile.endswith(".sh"):
-                hasBash = True
-                break
-        if hasBash and ".github/workflows/shellcheck.yaml" not in gFiles:
-            print(f"\"{dName}/.github/workflows/shellcheck.yaml\" is missing.")
-            shutil.copy(
-                f"{os.path.dirname(os.path.realpath(__file__))}/.github/workflows/shellcheck.yaml",
-                f"{dName}/.github/workflows/shellcheck.yaml",
-            )
-            subprocess.run(
-                ["git", "add", "--intent-to-add", ".github/workflows/shellcheck.yaml"],
-                   check = True,
-                     cwd = dName,
-                encoding = "utf-8",
-                  stderr = subprocess.DEVNULL,
-                  stdout = subprocess.DEVNULL,
-                 timeout = args.timeout,
-            )
-        if not hasBash and ".github/workflows/shellcheck.yaml" in gFiles:
-            print(f"\"{dName}/.github/workflows/shellcheck.yaml\" is present but shouldn't be.")
+    # Define function ...
+    def check(repository, /):
+        """Check a Git repository, reporting (rather than raising) any errors"""
 
-        # Determine if it has any FORTRAN programs and check that the required
-        # GitHub Action workflow YAML file is present ...
-        hasFortran = False
-        for gFile in gFiles:
-            if gFile.endswith(".f90") or gFile.endswith(".F90"):
-                hasFortran = True
-                break
-        if hasFortran and ".github/workflows/gmake.yaml" not in gFiles:
-            print(f"\"{dName}/.github/workflows/gmake.yaml\" is missing.")
-            shutil.copy(
-                f"{os.path.dirname(os.path.realpath(__file__))}/.github/workflows/gmake.yaml",
-                f"{dName}/.github/workflows/gmake.yaml",
+        # Check the Git repository ...
+        try:
+            return funcs.check_required_files(
+                repository,
+                os.path.dirname(os.path.realpath(__file__)),
+                   sync = args.sync,
+                timeout = args.timeout,
             )
-            subprocess.run(
-                ["git", "add", "--intent-to-add", ".github/workflows/gmake.yaml"],
-                   check = True,
-                     cwd = dName,
-                encoding = "utf-8",
-                  stderr = subprocess.DEVNULL,
-                  stdout = subprocess.DEVNULL,
-                 timeout = args.timeout,
-            )
-        if not hasFortran and ".github/workflows/gmake.yaml" in gFiles:
-            print(f"\"{dName}/.github/workflows/gmake.yaml\" is present but shouldn't be.")
-
-        # Determine if it has any Python scripts and check that the required
-        # GitHub Action workflow YAML file is present ...
-        hasPython = False
-        for gFile in gFiles:
-            if gFile.endswith(".py"):
-                hasPython = True
-                break
-        if hasPython and ".github/workflows/mypy.yaml" not in gFiles:
-            print(f"\"{dName}/.github/workflows/mypy.yaml\" is missing.")
-            shutil.copy(
-                f"{os.path.dirname(os.path.realpath(__file__))}/.github/workflows/mypy.yaml",
-                f"{dName}/.github/workflows/mypy.yaml",
-            )
-            subprocess.run(
-                ["git", "add", "--intent-to-add", ".github/workflows/mypy.yaml"],
-                   check = True,
-                     cwd = dName,
-                encoding = "utf-8",
-                  stderr = subprocess.DEVNULL,
-                  stdout = subprocess.DEVNULL,
-                 timeout = args.timeout,
-            )
-        if not hasPython and ".github/workflows/mypy.yaml" in gFiles:
-            print(f"\"{dName}/.github/workflows/mypy.yaml\" is present but shouldn't be.")
+        except Exception as err:                                                # pylint: disable=broad-exception-caught
+            return [f"\"{repository['dname']}\" cannot be checked ({err})."]
 
-        # Determine if it has any Python scripts and check that the required
-        # GitHub Action workflow YAML file is present ...
-        hasPython = False
-        for gFile in gFiles:
-            if gFile.endswith(".py"):
-                hasPython = True
-                break
-        if hasPython and ".github/workflows/pylint.yaml" not in gFiles:
-            print(f"\"{dName}/.github/workflows/pylint.yaml\" is missing.")
-            shutil.copy(
-                f"{os.path.dirname(os.path.realpath(__file__))}/.github/workflows/pylint.yaml",
-                f"{dName}/.github/workflows/pylint.yaml",
-            )
-            subprocess.run(
-                ["git", "add", "--intent-to-add", ".github/workflows/pylint.yaml"],
-                   check = True,
-                     cwd = dName,
-                encoding = "utf-8",
-                  stderr = subprocess.DEVNULL,
-                  stdout = subprocess.DEVNULL,
-                 timeout = args.timeout,
-            )
-        if not hasPython and ".github/workflows/pylint.yaml" in gFiles:
-            print(f"\"{dName}/.github/workflows/pylint.yaml\" is present but shouldn't be.")
+    # Check the Git repositories in a pool of threads (as the work is done by
+    # the Git processes) and print the reports (in the same order as the Git
+    # repositories) ...
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max(1, args.jobs)) as pool:
+        for lines in pool.map(check, repositories):
+            for line in lines:
+                print(line)
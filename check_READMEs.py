@@ -6,14 +6,10 @@ if __name__ == "__main__":
     # Import standard modules ...
     import argparse
     import glob
-    import json
     import os
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
@@ -32,16 +28,6 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
-    # Load list of standard Python modules ...
-    with open(f"{os.path.dirname(os.path.realpath(__file__, strict = True))}/Python 3.12 Standard Modules.json", "rt", encoding = "utf-8") as fObj:
-        standardModules = json.load(fObj)
-
-    # Append common non-standard Python modules that I do not want to be warned
-    # about ...
-    standardModules.append("f90")
-    standardModules.append("funcs")
-    standardModules.append("web_mod")
-
     # Define a dictionary mapping Python module import names to Pip package
     # installation names ...
     python2pip = {
@@ -66,86 +52,40 @@ if __name__ == "__main__":
 
         # **********************************************************************
 
-        # Initialize list of sub-paths to ignore ...
-        ipaths = [
-            f"{dname}/.git",
-            f"{dname}/build",
-        ]
-
-        # Deduce .gitmodules file name, check if it exists and populate list
-        # with paths to ignore if it does ...
-        mname = f"{dname}/.gitmodules"
-        if os.path.exists(mname):
-            with open(mname, "rt", encoding = "utf-8") as fObj:
-                for line in fObj:
-                    if not line.strip().startswith("path = "):
-                        continue
-                    ipaths.append(f'{dname}/{"=".join(line.strip().split("=")[1:]).strip()}')
-
-        # **********************************************************************
-
-        # Initialize list of imported non-standard modules ...
-        modules = []
+        # Initialize list of lists of imported modules ...
+        imports = []
 
-        # Loop over files in directory ...
-        for pname in pyguymer3.return_file_list(
+        # Loop over files in directory (listing them from the Git index where
+        # possible, which skips Git submodules) ...
+        for pname in funcs.list_files(
             dname,
-                allowHidden = True,
-                      debug = args.debug,
-            follow_symlinks = False,
-            return_symlinks = False,
+              debug = args.debug,
+            timeout = 60.0,
         ):
             # Skip if the file is not a Python script ...
             if not pname.endswith(".py"):
                 continue
 
             # Skip if the file is in a directory which is to be ignored ...
-            ignore = False
-            for ipath in ipaths:
-                if pname.startswith(ipath):
-                    ignore = True
-                    break
-            if ignore:
+            if pname.startswith(f"{dname}/build/"):
                 continue
 
-            # Find all the non-standard modules which are imported and append
-            # the missing ones to the list ...
-            with open(pname, "rt", encoding = "utf-8") as fObj:
-                for line in fObj:
-                    if not line.strip().startswith("import "):
-                        continue
-                    module = line.strip().split(" ")[1].split(".")[0]
-                    if module == dname:
-                        continue
-                    if module in standardModules:
-                        continue
-                    if module in modules:
-                        continue
-                    modules.append(module)
-
-        # Skip this README if the repository does not import any non-standard
-        # modules ...
+            # Find all the modules which are imported (skipping the Python
+            # script if it cannot be parsed, so that one broken Python script
+            # does not stop every README from being checked) ...
+            with open(pname, "rb") as fObj:
+                try:
+                    imports.append(funcs.summarise_imports(fObj.read()))
+                except (SyntaxError, ValueError) as err:
+                    if args.debug:
+                        print(f"WARNING: \"{pname}\" cannot be parsed ({err}), so it will be skipped.")
+
+        # Find all the non-standard modules which are imported and skip this
+        # README if the repository does not import any ...
+        modules = funcs.non_standard_modules(dname, imports)
         if len(modules) == 0:
             continue
 
-        # As Sphinx is not imported it is easy for this script to miss Sphinx
-        # requirements, so make sure that Sphinx is there if the Sphinx theme is
-        # imported ...
-        if "sphinx_rtd_theme" in modules:
-            if "sphinx" not in modules:
-                modules.append("sphinx")
-        if "sphinx" in modules:
-            if "sphinx_fortran" not in modules:
-                modules.append("sphinx_fortran")
-
-        # It is unclear if NumPy always pulls in Meson/Ninja to allow f2py
-        # builds, so manually add them just in case ...
-        if "numpy" in modules:
-            if "meson" not in modules:
-                modules.append("meson")
-            if "ninja" not in modules:
-                modules.append("ninja")
-
         # **********************************************************************
 
         # Open Pip requirements file for writing ...
@@ -168,22 +108,6 @@ if __name__ == "__main__":
 
         # **********************************************************************
 
-        # Load README ...
-        with open(rname, "rt", encoding = "utf-8") as fObj:
-            lines = fObj.readlines()
-
-        # Loop over imported non-standard modules ...
-        for module in sorted(modules):
-            if module in [
-                "meson",
-                "ninja",
-            ]:
-                continue
-            linked = False
-            for line in lines:
-                if line.strip().startswith(f"* [{module}]("):
-                    linked = True
-                    break
-            if linked:
-                continue
-            print(f"  ... needs a link adding for \"{module}\"")
+        # Print the modules which are not linked to from the README ...
+        for line in funcs.report_readme_links(rname, modules):
+            print(line)
@@ -0,0 +1,60 @@
+"""
+A Python 3 module containing the functions which are shared between the
+scripts in this repository.
+"""
+
+# Import sub-functions ...
+from .add_lite_arguments import add_lite_arguments
+from .blob_sha import blob_sha
+from .callee_key import callee_key
+from .cat_blobs import cat_blobs
+from .changed_files import changed_files
+from .check_cache import check_cache
+from .check_required_files import check_required_files
+from .check_rule import check_rule
+from .check_source import check_source
+from .compile_rules import compile_rules
+from .discover_repositories import discover_repositories
+from .find_triggers import find_triggers
+from .import_aliases import import_aliases
+from .in_shard import in_shard
+from .index_blobs import index_blobs
+from .inventory_repository import inventory_repository
+from .iter_jobs import iter_jobs
+from .keyword_diagnostics import keyword_diagnostics
+from .keyword_targets import keyword_targets
+from .library_diagnostics import library_diagnostics
+from .lint_source import lint_source
+from .list_files import list_files
+from .list_tree import list_tree
+from .load_blob_results import load_blob_results
+from .load_cache import load_cache
+from .loop_context import loop_context
+from .non_standard_modules import non_standard_modules
+from .open_blob_store import open_blob_store
+from .parse_shard import parse_shard
+from .plan_checks import plan_checks
+from .profile_source import profile_source
+from .qualified_name import qualified_name
+from .report_keyword_arguments import report_keyword_arguments
+from .report_library_calls import report_library_calls
+from .report_readme_links import report_readme_links
+from .report_rules import report_rules
+from .resolve_symbol import resolve_symbol
+from .rule_diagnostics import rule_diagnostics
+from .run_fleet import run_fleet
+from .run_jobs import run_jobs
+from .save_blob_results import save_blob_results
+from .save_cache import save_cache
+from .save_shard import save_shard
+from .signature_index import signature_index
+from .staged_sources import staged_sources
+from .store_checks import store_checks
+from .summarise_calls import summarise_calls
+from .summarise_definitions import summarise_definitions
+from .summarise_imports import summarise_imports
+from .summarise_keyword_arguments import summarise_keyword_arguments
+from .summarise_library_calls import summarise_library_calls
+from .summarise_methods import summarise_methods
+from .symbol_table import symbol_table
+from .write_report import write_report
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def add_lite_arguments(
+    parser,
+    /,
+):
+    """Add the arguments which make the checks of keyword-only arguments lite
+
+    This function adds the "--lite" and "--un-important-keyword-arguments"
+    arguments to an argument parser, so that all of the scripts which check the
+    keyword-only arguments of libraries share the same "un-important" ones.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        the argument parser
+    """
+
+    # Add arguments ...
+    parser.add_argument(
+        "--lite",
+        action = "store_true",
+          help = "don't check for \"un-important\" keyword-only arguments of the libraries (see \"--un-important-keyword-arguments\")",
+    )
+    parser.add_argument(
+        "--un-important-keyword-arguments",
+        default = [
+            "atomicParsleyPath",
+            "exiftoolPath",
+            "gifsiclePath",
+            "gitPath",
+            "jpegtranPath",
+            "lsdvdPath",
+            "metaflacPath",
+            "mp4filePath",
+            "mp4tagsPath",
+            "mplayerPath",
+            "optipngPath",
+            "pkgPath",
+            "portPath",
+            "tarPath",
+            "xzPath",
+            "zypperPath",
+
+            "angConv",                  # pyguymer3.geo.find_min_max_dist_bearing()
+            "background",               # Lots of functions.
+            "cacheDir",                 # Lots of functions.
+            "calcAdaptive",             # Lots of functions.
+            "calcAverage",              # Lots of functions.
+            "calcNone",                 # Lots of functions.
+            "calcPaeth",                # Lots of functions.
+            "calcSub",                  # Lots of functions.
+            "calcUp",                   # Lots of functions.
+            "choices",                  # Lots of functions.
+            "chunksize",                # Lots of functions.
+            "coastlines_edgecolor",     # pyguymer3.geo.add_axis()
+            "coastlines_facecolor",     # pyguymer3.geo.add_axis()
+            "coastlines_levels",        # pyguymer3.geo.add_axis()
+            "coastlines_linestyle",     # pyguymer3.geo.add_axis()
+            "coastlines_linewidth",     # pyguymer3.geo.add_axis()
+            "coastlines_resolution",    # pyguymer3.geo.add_axis()
+            "coastlines_zorder",        # pyguymer3.geo.add_axis()
+            "configureAgain",           # Lots of functions.
+            "cookies",                  # Lots of functions.
+            "crf",                      # pyguymer3.media.images2mp4()
+            "ensureNFC",                # Lots of functions.
+            "eps",                      # Lots of functions.
+            "extent",                   # pyguymer3.geo.add_map_background()
+            "form",                     # pyguymer3.media.images2mp4()
+            "gridlines_int",            # pyguymer3.geo.add_axis()
+            "gridlines_linecolor",      # pyguymer3.geo.add_axis()
+            "gridlines_linestyle",      # pyguymer3.geo.add_axis()
+            "gridlines_linewidth",      # pyguymer3.geo.add_axis()
+            "gridlines_zorder",         # pyguymer3.geo.add_axis()
+            "headers",                  # Lots of functions.
+            "iceOcean",                 # pyguymer3.geo.add_GSHHG_map()
+            "ignorableFiles",           # pyguymer3.remove_almost_empty_directories()
+            "islandLake",               # pyguymer3.geo.add_GSHHG_map()
+            "lakeLand",                 # pyguymer3.geo.add_GSHHG_map()
+            "landOcean",                # pyguymer3.geo.add_GSHHG_map()
+            "level",                    # pyguymer3.media.images2mp4()
+            "lossless",                 # Lots of functions.
+            "maxImagePixels",           # Lots of functions.
+            "method",                   # Lots of functions.
+            "minimize_size",            # Lots of functions.
+            "name",                     # pyguymer3.geo.add_map_background()
+            "physical",                 # pyguymer3.geo.add_NE_map()
+            "pondIsland",               # pyguymer3.geo.add_GSHHG_map()
+            "pool",                     # Lots of functions.
+            "prefix",                   # Lots of functions.
+            "profile",                  # pyguymer3.media.images2mp4()
+            "progressive",              # Lots of functions.
+            "quality",                  # Lots of functions.
+            "ramLimit",                 # Lots of functions.
+            "setModificationTime",      # Lots of functions.
+            "strict",                   # pyguymer3.geo.getRecordAttribute()
+            "tol",                      # Lots of functions.
+            "useSciPy",                 # pyguymer3.geo.find_middle_of_locs()
+
+            "gs",                       # A MatPlotLib subplot arrangement.
+
+            "nrows",                    # A MatPlotLib subplot arrangement.
+            "ncols",                    # A MatPlotLib subplot arrangement.
+            "index",                    # A MatPlotLib subplot arrangement.
+        ],
+           dest = "unImpKwArgs",
+           help = "the \"un-important\" keyword-only arguments of the libraries to not check for if \"--lite\"",
+          nargs = "+",
+           type = str,
+    )
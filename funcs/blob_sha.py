@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def blob_sha(
+    src,
+    /,
+):
+    """Find the Git blob ID of some file contents
+
+    This function returns the SHA-1 hash that Git would use as the blob ID of
+    some file contents, so that a file which Git already tracks can be
+    identified without reading it.
+
+    Parameters
+    ----------
+    src : bytes
+        the file contents
+
+    Returns
+    -------
+    ans : str
+        the Git blob ID
+    """
+
+    # Import standard modules ...
+    import hashlib
+
+    # Return answer ...
+    return hashlib.sha1(b"blob " + str(len(src)).encode("ascii") + b"\0" + src).hexdigest()
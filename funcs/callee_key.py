@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def callee_key(
+    node,
+    /,
+):
+    """Find the key of a function call
+
+    This function returns the key that a function call is dispatched on (either
+    "name" for a "name()" call or ".attr" for a "receiver.attr()" call) and the
+    name of the receiver (if the receiver is a simple name).
+
+    Parameters
+    ----------
+    node : ast.Call
+        the function call
+
+    Returns
+    -------
+    key : str or None
+        the key of the function call
+    receiver : str or None
+        the name of the receiver of the function call
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Check what sort of function call it is ...
+    if isinstance(node.func, ast.Name):
+        return node.func.id, None
+    if isinstance(node.func, ast.Attribute):
+        if isinstance(node.func.value, ast.Name):
+            return f".{node.func.attr}", node.func.value.id
+        return f".{node.func.attr}", None
+
+    # Return answer ...
+    return None, None
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def cat_blobs(
+    dname,
+    specs,
+    /,
+):
+    """Read some objects from a Git repository
+
+    This function reads some objects (for example, "HEAD:./foo.py" or a blob
+    ID) from the object store of a Git repository, without checking anything
+    out, by streaming them through a single long-lived "git cat-file --batch"
+    process. It is a generator, so the objects are never all in memory at the
+    same time.
+
+    Parameters
+    ----------
+    dname : str
+        the folder in the Git repository (which relative object names, such as
+        "HEAD:./foo.py", are relative to)
+    specs : iterable of str
+        the object names
+
+    Yields
+    ------
+    spec : str
+        the object name
+    contents : bytes or None
+        the contents of the object (or None if it does not exist)
+    """
+
+    # Import standard modules ...
+    import shutil
+    import subprocess
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Start Git ...
+    with subprocess.Popen(
+        [
+            gitPath,
+            "-C", dname,
+            "cat-file",
+            "--batch",
+        ],
+         stdin = subprocess.PIPE,
+        stdout = subprocess.PIPE,
+    ) as proc:
+        try:
+            # Loop over object names ...
+            for spec in specs:
+                # Ask for the object and read its header ...
+                proc.stdin.write(f"{spec}\n".encode("utf-8"))
+                proc.stdin.flush()
+                header = proc.stdout.readline().decode("utf-8").split()
+
+                # Check if the object does not exist ...
+                if len(header) != 3:
+                    yield spec, None
+                    continue
+
+                # Read the object (and the newline which follows it) ...
+                contents = proc.stdout.read(int(header[2]))
+                proc.stdout.read(1)
+                yield spec, contents
+        finally:
+            # Tell Git that there aren't any more objects ...
+            proc.stdin.close()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def changed_files(
+    dname,
+    /,
+    *,
+      since = None,
+     staged = False,
+    timeout = 60.0,
+):
+    """List the files in a Git repository which have changed
+
+    This function returns a sorted list of the files in a folder in a Git
+    repository which differ from a Git reference and/or which are staged,
+    using a single call to "git diff". Unless only the staged files are listed,
+    the new files which are not tracked (and not ignored) are listed too, using
+    a single call to "git ls-files", as they have changed as well. Deleted files
+    (and symbolic links) are not listed.
+
+    Parameters
+    ----------
+    dname : str
+        the folder
+    since : str, optional
+        the Git reference to compare the files against (if None then the files
+        are compared against the index, or against "HEAD" if "staged")
+    staged : bool, optional
+        only list the files which are staged
+    timeout : float, optional
+        the timeout for each call to Git
+
+    Returns
+    -------
+    fnames : list of str
+        the sorted file names
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Create the command ...
+    cmd = [
+        gitPath,
+        "-C", dname,
+        "diff",
+        "--name-only",
+        "-z",
+        "--relative",
+        "--diff-filter=d",
+    ]
+    if staged:
+        cmd.append("--cached")
+    if since is not None:
+        cmd.append(since)
+        cmd.append("--")
+
+    # List the files which have changed ...
+    try:
+        resp = subprocess.run(
+            cmd,
+               check = True,
+            encoding = "utf-8",
+              stderr = subprocess.PIPE,
+              stdout = subprocess.PIPE,
+             timeout = timeout,
+        )
+    except subprocess.CalledProcessError as err:
+        raise Exception(f"\"git diff\" failed in \"{dname}\": {err.stderr.strip().splitlines()[0] if err.stderr.strip() else err.returncode}") from None
+
+    # Create short-hand ...
+    paths = resp.stdout.split("\0")
+
+    # Check if the files which are not staged are wanted ...
+    if not staged:
+        # List the new files which are not tracked (and not ignored) ...
+        try:
+            resp = subprocess.run(
+                [gitPath, "-C", dname, "ls-files", "-z", "--others", "--exclude-standard"],
+                   check = True,
+                encoding = "utf-8",
+                  stderr = subprocess.PIPE,
+                  stdout = subprocess.PIPE,
+                 timeout = timeout,
+            )
+        except subprocess.CalledProcessError as err:
+            raise Exception(f"\"git ls-files\" failed in \"{dname}\": {err.stderr.strip().splitlines()[0] if err.stderr.strip() else err.returncode}") from None
+        paths += resp.stdout.split("\0")
+
+    # Loop over the files which have changed and skip the ones which are not
+    # (or no longer) regular files ...
+    fnames = []
+    for path in dict.fromkeys(paths):
+        fname = os.path.join(dname, path)
+        if not path or os.path.islink(fname) or not os.path.isfile(fname):
+            continue
+        fnames.append(fname)
+
+    # Return answer ...
+    return sorted(fnames)
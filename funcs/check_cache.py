@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def check_cache(
+    cache,
+    fname,
+    /,
+    *,
+    sha = None,
+):
+    """Find the cache entry of a file
+
+    This function returns the cache entry of a file (keyed by its absolute
+    path), creating a new (empty) one if the file has changed since it was last
+    cached. The contents of the file are only read if the size or the
+    modification time of the file have changed since it was last cached and
+    the Git blob ID of the file is not already known.
+
+    Parameters
+    ----------
+    cache : dict
+        the cache
+    fname : str
+        the file name
+    sha : str, optional
+        the Git blob ID of the current contents of the file, if it is already
+        known (for example, from "git ls-files -s"), in which case the file is
+        not read
+
+    Returns
+    -------
+    entry : dict
+        the cache entry of the file (any results stored in it are valid for the
+        current contents of the file)
+    src : bytes or None
+        the contents of the file (if they had to be read)
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import sub-functions ...
+    from .blob_sha import blob_sha
+
+    # Find out the size and the modification time of the file ...
+    stat = os.stat(fname)
+
+    # Return the cache entry if the file has not been touched ...
+    key = os.path.abspath(fname)
+    entry = cache.get(key)
+    if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry, None
+
+    # Load the file and find out its hash (if it is not already known) ...
+    src = None
+    if sha is None:
+        with open(fname, "rb") as fObj:
+            src = fObj.read()
+        sha = blob_sha(src)
+
+    # Update the cache entry if the file has been touched but its contents have
+    # not changed, otherwise replace it ...
+    if entry is not None and entry["sha"] == sha:
+        entry["mtime"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+    else:
+        entry = {
+            "mtime" : stat.st_mtime_ns,
+              "sha" : sha,
+             "size" : stat.st_size,
+        }
+        cache[key] = entry
+
+    # Return answer ...
+    return entry, src
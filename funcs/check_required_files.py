@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def check_required_files(
+    repository,
+    templates,
+    /,
+    *,
+       sync = False,
+    timeout = 60.0,
+):
+    """Check that a Git repository has the required files
+
+    This function checks that a Git repository has the basic required files
+    (and, if it is published on GitHub, the GitHub Action workflow YAML files
+    for the types of files that it has). The files in the Git repository are
+    listed once (from the Git index, along with their blob IDs) and indexed by
+    extension, so that every rule is a dictionary look-up. Any missing required
+    files are copied from the templates and then added to the Git index (with
+    "git add --intent-to-add") with a single call to Git. Any required files
+    which are present but whose blob IDs differ from the blob IDs of the
+    templates are reported as out-of-date (and are overwritten by the templates,
+    and added to the Git index, if asked to and if they don't have uncommitted
+    changes or merge conflicts), without reading them. Missing files whose
+    templates don't exist, and any errors, are reported rather than raised, so
+    that one Git repository cannot stop the others from being checked. It is
+    safe to call from a worker thread.
+
+    Parameters
+    ----------
+    repository : dict
+        the Git repository (see "discover_repositories()")
+    templates : str
+        the folder of the templates of the required files
+    sync : bool, optional
+        overwrite (and add to the Git index) the required files which are
+        out-of-date with the templates (unless they have uncommitted changes or
+        merge conflicts)
+    timeout : float, optional
+        the timeout for each call to Git
+
+    Returns
+    -------
+    lines : list of str
+        the lines of the report
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Import sub-functions ...
+    from .blob_sha import blob_sha
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Define the basic required files and the required files of Git
+    # repositories which are published on Gist or on GitHub ...
+    requiredFiles = [
+        ".editorconfig",
+        ".gitignore",
+        ".mypy.ini",
+        ".pylint.ini",
+        ".shellcheckrc",
+        "README.md",
+        "requirements.txt",
+    ]
+    publishedFiles = [
+        ".github/FUNDING.yml",
+        "LICENCE.txt",
+    ]
+
+    # Define the required files which are only starting points (which every Git
+    # repository changes), and so which are never compared to the templates ...
+    startingFiles = [
+        ".gitignore",
+        "README.md",
+        "requirements.txt",
+    ]
+
+    # Define the GitHub Action workflow YAML files which are required by Git
+    # repositories which are published on GitHub and which have files with any
+    # of the extensions, as (file, extensions) ...
+    workflows = [
+        (".github/workflows/shellcheck.yaml", [".sh"]),
+        (".github/workflows/gmake.yaml", [".f90", ".F90"]),
+        (".github/workflows/mypy.yaml", [".py"]),
+        (".github/workflows/pylint.yaml", [".py"]),
+    ]
+
+    # Create short-hands ...
+    dName = repository["dname"]
+    onGist = repository["onGist"]
+    onGitHub = repository["onGitHub"]
+
+    # Initialize lists ...
+    lines = []
+    missing = []
+    outOfDate = []
+    present = []
+    updated = []
+
+    # Find all files in the Git repository, along with their blob IDs ...
+    # NOTE: See https://git-scm.com/docs/git-ls-files#_output (where each entry
+    #       is "<mode> <object> <stage>\t<file>" and there is one entry for
+    #       each stage of a file which has merge conflicts).
+    try:
+        resp = subprocess.run(
+            [gitPath, "-C", dName, "ls-files", "--stage", "-z"],
+               check = True,
+            encoding = "utf-8",
+              stderr = subprocess.DEVNULL,
+              stdout = subprocess.PIPE,
+             timeout = timeout,
+        )
+    except subprocess.SubprocessError as err:
+        # Return answer ...
+        return [f"\"{dName}\" cannot be checked ({str(err).removesuffix('.')})."]
+    gFiles : dict[str, str] = {}
+    unmerged = set()
+    for entry in resp.stdout.split("\0"):
+        # Skip empty entries ...
+        if not entry:
+            continue
+
+        # Add the file ...
+        info, _, gFile = entry.partition("\t")
+        _, sha, stage = info.split(" ")
+        if gFile not in gFiles or stage == "0":
+            gFiles[gFile] = sha
+        if stage != "0":
+            unmerged.add(gFile)
+
+    # Index the files by extension ...
+    extensions : dict[str, list[str]] = {}
+    for gFile in gFiles:
+        extension = os.path.splitext(gFile)[1]
+        if extension not in extensions:
+            extensions[extension] = []
+        extensions[extension].append(gFile)
+
+    # **************************************************************************
+
+    # Check that the basic required files are present ...
+    for gFile in requiredFiles + (publishedFiles if onGist or onGitHub else []):
+        if onGist and "/" in gFile: # NOTE: Gist cannot handle sub-folders.
+            continue
+        if gFile in gFiles:
+            if gFile not in startingFiles:
+                present.append(gFile)
+            continue
+        if not os.path.exists(f"{templates}/{gFile}"):
+            lines.append(f"\"{dName}/{gFile}\" is missing (not added: template missing).")
+            continue
+        lines.append(f"\"{dName}/{gFile}\" is missing.")
+        missing.append(gFile)
+
+    # Check that the required GitHub Action workflow YAML files are present (and
+    # that the ones which aren't required are not present) ...
+    if onGitHub:
+        for gFile, exts in workflows:
+            required = any(ext in extensions for ext in exts)
+            if required and gFile in gFiles:
+                present.append(gFile)
+            if required and gFile not in gFiles and not os.path.exists(f"{templates}/{gFile}"):
+                lines.append(f"\"{dName}/{gFile}\" is missing (not added: template missing).")
+            elif required and gFile not in gFiles:
+                lines.append(f"\"{dName}/{gFile}\" is missing.")
+                missing.append(gFile)
+            if not required and gFile in gFiles:
+                lines.append(f"\"{dName}/{gFile}\" is present but shouldn't be.")
+
+    # Check that the required files which are present are the same as the
+    # templates ...
+    # NOTE: A file which has been added with "git add --intent-to-add" has the
+    #       blob ID of an empty file until it is staged, so it is skipped.
+    # NOTE: A template which doesn't exist cannot be compared, so it is skipped.
+    for gFile in present:
+        if not os.path.exists(f"{templates}/{gFile}"):
+            continue
+        with open(f"{templates}/{gFile}", "rb") as fObj:
+            sha = blob_sha(fObj.read())
+        if gFiles[gFile] in [sha, blob_sha(b"")]:
+            continue
+        outOfDate.append(gFile)
+
+    # Check if the out-of-date files are going to be overwritten ...
+    if sync and outOfDate:
+        # Find the files which have local changes (either staged or not) which
+        # have not been committed, so that they are not overwritten ...
+        # NOTE: The files which have merge conflicts were found above.
+        # NOTE: If there aren't any commits then every file is a local change.
+        # NOTE: If Git times out then every file is a local change.
+        try:
+            resp = subprocess.run(
+                [gitPath, "-C", dName, "diff-index", "--name-only", "-z", "HEAD", "--"],
+                   check = False,
+                encoding = "utf-8",
+                  stderr = subprocess.DEVNULL,
+                  stdout = subprocess.PIPE,
+                 timeout = timeout,
+            )
+        except subprocess.TimeoutExpired:
+            modified = set(outOfDate)
+        else:
+            if resp.returncode == 0:
+                modified = set(resp.stdout.split("\0")) - {""}
+            else:
+                modified = set(outOfDate)
+
+        # Loop over out-of-date files ...
+        for gFile in outOfDate:
+            if gFile in modified or gFile in unmerged:
+                lines.append(f"\"{dName}/{gFile}\" is out-of-date (not updated: local changes).")
+                continue
+            lines.append(f"\"{dName}/{gFile}\" is out-of-date (it has been updated).")
+            updated.append(gFile)
+    else:
+        # Loop over out-of-date files ...
+        for gFile in outOfDate:
+            lines.append(f"\"{dName}/{gFile}\" is out-of-date.")
+
+    # **************************************************************************
+
+    # Copy the missing and the out-of-date files from the templates (and forget
+    # about any which cannot be copied, so that they are not added) ...
+    for gFile in missing + updated:
+        try:
+            if os.path.dirname(gFile):
+                os.makedirs(f"{dName}/{os.path.dirname(gFile)}", exist_ok = True)
+            shutil.copy(
+                f"{templates}/{gFile}",
+                f"{dName}/{gFile}",
+            )
+        except OSError as err:
+            lines.append(f"\"{dName}/{gFile}\" cannot be copied ({err}).")
+            if gFile in missing:
+                missing.remove(gFile)
+            else:
+                updated.remove(gFile)
+
+    # Add the missing files and the out-of-date files to the Git index ...
+    for flags, fnames in [
+        (["--intent-to-add"], missing),
+        ([], updated),
+    ]:
+        # Skip if there aren't any files ...
+        if not fnames:
+            continue
+
+        # Add the files ...
+        try:
+            subprocess.run(
+                [gitPath, "-C", dName, "add"] + flags + ["--"] + fnames,
+                   check = True,
+                encoding = "utf-8",
+                  stderr = subprocess.DEVNULL,
+                  stdout = subprocess.DEVNULL,
+                 timeout = timeout,
+            )
+        except subprocess.SubprocessError as err:
+            lines.append(f"\"{dName}\" cannot run \"git add\" ({str(err).removesuffix('.')}).")
+
+    # Return answer ...
+    return lines
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def check_rule(
+    node,
+    receiver,
+    keywords,
+    depth,
+    rule,
+    /,
+):
+    """Check a function call against a compiled rule
+
+    This function checks a function call (or any other node which a rule is
+    dispatched on, see "loop_context()") against a compiled rule and returns
+    the diagnostics. The messages of the diagnostics still have to be formatted
+    with the file name.
+
+    Parameters
+    ----------
+    node : ast.Call or ast.AST
+        the function call (or the other node)
+    receiver : str or None
+        the name of the receiver of the function call
+    keywords : dict
+        the keyword arguments which are passed to the function call
+    depth : int
+        the loop depth of the node
+    rule : dict
+        the compiled rule
+
+    Returns
+    -------
+    diagnostics : list of dict
+        the diagnostics
+    """
+
+    # Initialize list ...
+    diagnostics = []
+
+    # Skip this rule if it only applies inside loops and the node is not inside
+    # a loop ...
+    if rule["loop"] and depth == 0:
+        return diagnostics
+
+    # Skip this rule if the receiver does not match ...
+    if rule["receiver"] is not None:
+        if receiver is None or rule["receiver"].search(receiver) is None:
+            return diagnostics
+
+    # Skip this rule if one of the keyword arguments has an exempt value ...
+    for kwArg, values in rule["exemptions"].items():
+        if getattr(keywords.get(kwArg), "value", None) in values:
+            return diagnostics
+
+    # Create short-hand for the fields that messages can use ...
+    # NOTE: The file name is left as a field in the message (and any braces in
+    #       the other fields are escaped) so that the diagnostics can be cached
+    #       independently of how the file name was spelled on the command line.
+    fields = {
+             "arg0" : str(getattr(node.args[0], "value", None) if getattr(node, "args", None) else None).replace("{", "{{").replace("}", "}}"),
+             "attr" : str(getattr(getattr(node, "func", None), "attr", None)).replace("{", "{{").replace("}", "}}"),
+            "depth" : depth,
+            "fname" : "{fname}",
+         "receiver" : str(receiver).replace("{", "{{").replace("}", "}}"),
+    }
+
+    # Append a diagnostic if the rule matches the node itself ...
+    if "matched" in rule["messages"]:
+        diagnostics.append(
+            {
+                    "col" : node.col_offset,
+                   "line" : node.lineno,
+                "message" : rule["messages"]["matched"].format(**fields),
+                   "rule" : rule["id"],
+            }
+        )
+
+    # Append a diagnostic for each keyword argument which is required but not
+    # set ...
+    for kwArg in rule["required"]:
+        if kwArg in keywords:
+            continue
+        diagnostics.append(
+            {
+                    "col" : node.col_offset,
+                   "line" : node.lineno,
+                "message" : rule["messages"]["required"].format(keyword = kwArg, **fields),
+                   "rule" : rule["id"],
+            }
+        )
+
+    # Append a diagnostic for each keyword argument which is forbidden but
+    # set ...
+    for kwArg in rule["forbidden"]:
+        if kwArg not in keywords:
+            continue
+        diagnostics.append(
+            {
+                    "col" : node.col_offset,
+                   "line" : node.lineno,
+                "message" : rule["messages"]["forbidden"].format(keyword = kwArg, **fields),
+                   "rule" : rule["id"],
+            }
+        )
+
+    # Return answer ...
+    return diagnostics
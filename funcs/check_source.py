@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def check_source(
+    src,
+    rFiles,
+    ruleIds,
+    /,
+    *,
+    profile = False,
+):
+    """Check a Python script against some compiled rules
+
+    This function parses a Python script (if it is not already parsed) and
+    checks all of the function calls in it against the compiled rules which
+    have one of the given IDs (along with any other nodes which the rules of
+    the performance anti-patterns are dispatched on, see "loop_context()"). It
+    is safe to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+    rFiles : tuple of str
+        the JSON files of rules
+    ruleIds : tuple of str
+        the IDs of the rules to check
+    profile : bool, optional
+        time how long it takes to parse and walk the Python script and to check
+        each rule, and count how many nodes there are and how many times each
+        rule is checked
+
+    Returns
+    -------
+    diagnostics : dict
+        the diagnostics, keyed by rule ID
+    stats : dict, optional
+        the times (in seconds) and the counts (only returned if "profile")
+    """
+
+    # Import standard modules ...
+    import ast
+    import time
+
+    # Import sub-functions ...
+    from .callee_key import callee_key
+    from .check_rule import check_rule
+    from .compile_rules import compile_rules
+    from .loop_context import loop_context
+
+    # Compile the rules ...
+    rules, table = compile_rules(rFiles)
+
+    # Initialize dictionaries ...
+    diagnostics = {}
+    stats = {
+        "nodes" : 0,
+        "parse" : 0.0,
+        "rules" : {},
+         "walk" : 0.0,
+    }
+    for ruleId in ruleIds:
+        diagnostics[ruleId] = []
+        stats["rules"][ruleId] = {
+            "calls" : 0,
+             "time" : 0.0,
+        }
+
+    # Parse the Python script (if it is not already parsed) ...
+    start = time.perf_counter()
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+    stats["parse"] = time.perf_counter() - start
+
+    # Find the loop context of every node (if any of the rules to check need
+    # it) ...
+    # NOTE: This is an extra walk of the parsed Python script, so it is only
+    #       done if it is needed.
+    start = time.perf_counter()
+    context = {
+          "depths" : {},
+        "filtered" : set(),
+        "patterns" : {},
+    }
+    if any(rule["id"] in diagnostics and (rule["filtered"] or rule["kind"] != "call" or rule["loop"]) for rule in rules):
+        context = loop_context(tree)
+
+    # Loop over bodies ...
+    for body in tree.body:
+        # Loop over nodes in the body ...
+        for node in ast.walk(body):
+            stats["nodes"] += 1
+
+            # Find the key of this node (skipping it if it is neither a
+            # function call nor one of the other nodes which rules are
+            # dispatched on) ...
+            if isinstance(node, ast.Call):
+                key, receiver = callee_key(node)
+            elif node in context["patterns"]:
+                key, receiver = context["patterns"][node], None
+            else:
+                continue
+
+            # Skip this node if there aren't any rules for it ...
+            if key not in table:
+                continue
+
+            # Find all the keyword arguments that are passed ...
+            keywords = {}
+            for keyword in getattr(node, "keywords", []):
+                if keyword.arg is None:
+                    continue
+                keywords[keyword.arg] = keyword.value
+
+            # Find the loop depth of the node ...
+            depth = context["depths"].get(node, 0)
+
+            # Check everything (timing each rule, if requested) ...
+            for rule in table[key]:
+                if rule["id"] not in diagnostics:
+                    continue
+                if rule["filtered"] and node not in context["filtered"]:
+                    continue
+                if profile:
+                    ruleStart = time.perf_counter()
+                    diagnostics[rule["id"]] += check_rule(node, receiver, keywords, depth, rule)
+                    stats["rules"][rule["id"]]["calls"] += 1
+                    stats["rules"][rule["id"]]["time"] += time.perf_counter() - ruleStart
+                    continue
+                diagnostics[rule["id"]] += check_rule(node, receiver, keywords, depth, rule)
+
+    # Return answer(s) ...
+    if profile:
+        # NOTE: The time spent walking does not include the time spent checking
+        #       the rules.
+        stats["walk"] = time.perf_counter() - start - sum(ruleStats["time"] for ruleStats in stats["rules"].values())
+        return diagnostics, stats
+    return diagnostics
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import functools
+
+# Define function ...
+# NOTE: The compiled rules are memoized so that each worker process only
+#       compiles them once.
+@functools.lru_cache
+def compile_rules(
+    rFiles,
+    /,
+):
+    """Compile rules
+
+    This function loads the rules from some JSON files and compiles them into a
+    list (in the order that they were loaded) and into a single lookup table,
+    keyed by the key that function calls are dispatched on (see
+    "callee_key()"). Each rule has some trigger tokens, at least one of which
+    must appear in the contents of a Python script for the rule to be able to
+    match anything in it (see "find_triggers()"); they default to the names of
+    the callees of the rule. Rules which are not about function calls (such as
+    the rules of the performance anti-patterns) have a kind instead of callees,
+    and they are keyed by "<kind>" (see "loop_context()"), so they must list
+    their trigger tokens.
+
+    Parameters
+    ----------
+    rFiles : tuple of str
+        the JSON files of rules
+
+    Returns
+    -------
+    rules : list of dict
+        the compiled rules
+    table : dict
+        the compiled rules, keyed by the key that function calls are dispatched
+        on
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import json
+    import re
+
+    # Initialize list and lookup table ...
+    rules = []
+    table = {}
+
+    # Loop over rule files ...
+    for rFile in rFiles:
+        # Load the rule file ...
+        with open(rFile, "rt", encoding = "utf-8") as fObj:
+            rawRules = json.load(fObj)
+
+        # Loop over rules ...
+        for rawRule in rawRules:
+            # Find out what the rule is dispatched on ...
+            kind = rawRule.get("kind", "call")
+            callees = rawRule["callees"] if kind == "call" else [f"<{kind}>"]
+
+            # Compile rule ...
+            # NOTE: The fingerprint changes whenever the definition of the rule
+            #       changes, which invalidates any cached diagnostics of it.
+            rule = {
+                 "exemptions" : rawRule.get("exemptions", {}),
+                   "filtered" : rawRule.get("filtered", False),
+                "fingerprint" : hashlib.sha256(json.dumps(rawRule, sort_keys = True).encode("utf-8")).hexdigest(),
+                  "forbidden" : tuple(rawRule.get("forbidden", [])),
+                         "id" : rawRule["id"],
+                       "kind" : kind,
+                       "loop" : rawRule.get("loop", False),
+                   "messages" : rawRule["messages"],
+                   "receiver" : None if rawRule.get("receiver") is None else re.compile(rawRule["receiver"]),
+                   "required" : tuple(rawRule.get("required", [])),
+                   "triggers" : tuple(rawRule.get("triggers", [callee.removeprefix(".") for callee in callees])),
+            }
+            rules.append(rule)
+
+            # Add the compiled rule to the lookup table for each of its
+            # callees ...
+            for callee in callees:
+                if callee not in table:
+                    table[callee] = []
+                table[callee].append(rule)
+
+    # Return answer ...
+    return rules, table
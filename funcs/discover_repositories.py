@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def discover_repositories(
+    dname,
+    /,
+    *,
+    cacheDir = "~/.cache/misc",
+       debug = __debug__,
+     timeout = 60.0,
+):
+    """Find the Git repositories in a folder
+
+    This function returns a sorted list of the Git repositories in a folder
+    (which are the same ones as "glob.glob("*/.git")" finds), along with the
+    URL of their "origin" remote, whether they are published on Gist or on
+    GitHub and the paths of their submodules. The answers are kept in a cache
+    which is keyed by the modification times of ".git/config" and of
+    ".gitmodules", so Git is only run for the Git repositories which are new or
+    whose remotes or submodules may have changed (two calls to Git each, at
+    most).
+
+    Parameters
+    ----------
+    dname : str
+        the folder
+    cacheDir : str, optional
+        the folder to store the cache in (if None then the cache is neither
+        loaded nor saved)
+    debug : bool, optional
+        print debug messages
+    timeout : float, optional
+        the timeout for each call to Git
+
+    Returns
+    -------
+    repositories : list of dict
+        the Git repositories, each having the folder (as "dname"), whether
+        ".git" is a folder rather than a file (as "gitDir", as it is a file in
+        submodules and worktrees), the URL of the "origin" remote (as "remote",
+        or None if there isn't one), whether it is published on Gist (as
+        "onGist") or on GitHub (as "onGitHub") and the paths of its submodules
+        (as "submodules")
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Import sub-functions ...
+    from .load_cache import load_cache
+    from .save_cache import save_cache
+
+    # Define the version of the cache (which must be changed whenever the
+    # structure of the entries changes) ...
+    version = "1"
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Load cache ...
+    cache = {}
+    if cacheDir is not None:
+        cacheDir = os.path.expanduser(cacheDir)
+        cache = load_cache(
+            f"{cacheDir}/discover_repositories.json",
+            version,
+            debug = debug,
+        )
+
+    # Initialize list, set and counter ...
+    repositories = []
+    keys = set()
+    nRefreshed = 0
+
+    # Loop over the folders in the folder (in the same order as
+    # "sorted(glob.glob("*/.git"))", which skips hidden folders) ...
+    for name in sorted(os.listdir(dname), key = lambda name: f"{name}/"):
+        # Skip this folder if it is hidden or if it is not a Git repository ...
+        gName = os.path.join(dname, name, ".git")
+        if name.startswith(".") or not os.path.exists(gName):
+            continue
+
+        # Create short-hands ...
+        # NOTE: The configuration of a submodule or a worktree is not in it,
+        #       so the modification time of its ".git" file is used instead.
+        rName = os.path.normpath(os.path.join(dname, name))
+        gitDir = os.path.isdir(gName)
+        key = os.path.realpath(rName)
+        keys.add(key)
+        stamps = [
+            os.stat(f"{gName}/config" if gitDir and os.path.exists(f"{gName}/config") else gName).st_mtime_ns,
+            os.stat(f"{rName}/.gitmodules").st_mtime_ns if os.path.exists(f"{rName}/.gitmodules") else None,
+        ]
+
+        # Check if the cache entry is out-of-date ...
+        if key not in cache or cache[key]["stamps"] != stamps:
+            nRefreshed += 1
+
+            # Find the URL of the "origin" remote ...
+            resp = subprocess.run(
+                [gitPath, "-C", rName, "remote", "get-url", "origin"],
+                   check = False,
+                encoding = "utf-8",
+                  stderr = subprocess.DEVNULL,
+                  stdout = subprocess.PIPE,
+                 timeout = timeout,
+            )
+            remote = resp.stdout.strip() if resp.returncode == 0 else None
+
+            # Find the paths of the submodules ...
+            # NOTE: "git config" exits with 1 if nothing matches.
+            submodules = []
+            if stamps[1] is not None:
+                resp = subprocess.run(
+                    [gitPath, "-C", rName, "config", "-z", "--file", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"],
+                       check = False,
+                    encoding = "utf-8",
+                      stderr = subprocess.DEVNULL,
+                      stdout = subprocess.PIPE,
+                     timeout = timeout,
+                )
+                for entry in resp.stdout.split("\0"):
+                    if entry:
+                        submodules.append(entry.partition("\n")[2])
+
+            # Update the cache entry ...
+            cache[key] = {
+                    "remote" : remote,
+                    "stamps" : stamps,
+                "submodules" : sorted(submodules),
+            }
+
+        # Append the Git repository ...
+        remote = cache[key]["remote"]
+        repositories.append(
+            {
+                     "dname" : rName,
+                    "gitDir" : gitDir,
+                    "onGist" : remote is not None and remote.startswith("git@gist.github.com:"),
+                  "onGitHub" : remote is not None and remote.startswith("git@github.com:"),
+                    "remote" : remote,
+                "submodules" : cache[key]["submodules"],
+            }
+        )
+
+    # Remove the cache entries of the Git repositories in the folder which no
+    # longer exist ...
+    for key in list(cache.keys()):
+        if os.path.dirname(key) == os.path.realpath(dname) and key not in keys:
+            del cache[key]
+            nRefreshed += 1
+
+    # Save cache (if any of the cache entries were refreshed or removed) ...
+    if debug:
+        print(f"DEBUG: Refreshed {nRefreshed:,d} of the {len(repositories):,d} Git repositories in \"{dname}\".")
+    if cacheDir is not None and nRefreshed > 0:
+        save_cache(
+            f"{cacheDir}/discover_repositories.json",
+            version,
+            cache,
+        )
+
+    # Return answer ...
+    return repositories
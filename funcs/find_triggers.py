@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def find_triggers(
+    src,
+    triggers,
+    /,
+    *,
+    load = False,
+):
+    """Find which trigger tokens appear in the contents of a Python script
+
+    This function searches the raw contents of a Python script for some trigger
+    tokens with a single combined regular expression, without parsing it. If
+    none of the trigger tokens of a check appear then the check cannot match
+    anything in the Python script, and so it does not need to be parsed. If the
+    Python script is given by its file name then it is memory mapped rather
+    than read, so that large Python scripts (such as generated data modules)
+    which do not contain any of the trigger tokens are never copied into
+    memory, and (if asked to) the contents of the Python scripts which do
+    contain some of the trigger tokens are copied out of the memory map, so
+    that they do not have to be read again.
+
+    Parameters
+    ----------
+    src : bytes or str
+        the contents of the Python script (or the file name of the Python
+        script)
+    triggers : tuple of str
+        the trigger tokens
+    load : bool, optional
+        return the contents of the Python script too
+
+    Returns
+    -------
+    found : set of str
+        the trigger tokens which appear in the Python script
+    src : bytes or str or None
+        the contents of the Python script (or None if it was given by its file
+        name and none of the trigger tokens appear in it) (only returned if
+        "load")
+    """
+
+    # Import standard modules ...
+    import mmap
+    import os
+    import re
+
+    # Return early if there aren't any trigger tokens ...
+    if not triggers:
+        if load:
+            return set(), None if isinstance(src, str) else src
+        return set()
+
+    # Compile the trigger tokens into a single regular expression ...
+    # NOTE: The longest trigger tokens come first so that a trigger token which
+    #       is a prefix of another one does not hide it.
+    pattern = re.compile(b"|".join(re.escape(trigger.encode("utf-8")) for trigger in sorted(set(triggers), key = len, reverse = True)))
+
+    # Check if the contents of the Python script were passed ...
+    if not isinstance(src, str):
+        found = {match.group().decode("utf-8") for match in pattern.finditer(src)}
+
+        # Return answer ...
+        if load:
+            return found, src
+        return found
+
+    # Return early if the Python script is empty (as empty files cannot be
+    # memory mapped) ...
+    if os.path.getsize(src) == 0:
+        if load:
+            return set(), None
+        return set()
+
+    # Memory map the Python script, find the trigger tokens and copy the
+    # contents out of the memory map (if they are wanted and if any of the
+    # trigger tokens were found) ...
+    with open(src, "rb") as fObj, mmap.mmap(fObj.fileno(), 0, access = mmap.ACCESS_READ) as mObj:
+        found = {match.group().decode("utf-8") for match in pattern.finditer(mObj)}
+        if load:
+            return found, mObj[:] if found else None
+        return found
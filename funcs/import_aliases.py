@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def import_aliases(
+    tree,
+    /,
+    *,
+    relative = False,
+):
+    """Find the names that modules and functions are imported as
+
+    This function returns a dictionary mapping the local names which are bound
+    by the absolute "import" and "from ... import" statements anywhere in a
+    parsed Python script to the fully-qualified dotted names that they refer to.
+    Relative "from ... import" statements can also be included, in which case
+    the dotted names that they refer to start with one dot per level (for
+    example, "from ..a import b" binds "b" to "..a.b"), as they can only be
+    resolved once the name of the module is known.
+
+    Parameters
+    ----------
+    tree : ast.Module
+        the parsed Python script
+    relative : bool, optional
+        include relative "from ... import" statements
+
+    Returns
+    -------
+    aliases : dict
+        the fully-qualified dotted names, keyed by local name
+
+    Notes
+    -----
+    The aliases are per-module, which means that a name which is imported in
+    one function and re-bound to something else in another function will be
+    mis-resolved in the second function.
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize dictionary ...
+    aliases = {}
+
+    # Loop over nodes in the tree ...
+    for node in ast.walk(tree):
+        # Check what sort of import statement it is ...
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                # NOTE: "import a.b.c" binds "a" whereas "import a.b.c as d"
+                #       binds "d" to "a.b.c".
+                if alias.asname is None:
+                    aliases[alias.name.split(".", maxsplit = 1)[0]] = alias.name.split(".", maxsplit = 1)[0]
+                else:
+                    aliases[alias.asname] = alias.name
+        elif isinstance(node, ast.ImportFrom):
+            # Skip relative imports (unless they are wanted) ...
+            if node.level != 0 and not relative:
+                continue
+            prefix = node.level * "." + ("" if node.module is None else f"{node.module}.")
+            for alias in node.names:
+                if alias.name == "*":
+                    continue
+                aliases[alias.name if alias.asname is None else alias.asname] = f"{prefix}{alias.name}"
+
+    # Return answer ...
+    return aliases
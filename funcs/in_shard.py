@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def in_shard(
+    key,
+    shard,
+    /,
+):
+    """Check if a file is in a shard
+
+    This function partitions files into shards by a stable hash of their key
+    (such as their path relative to the folder being checked), so that every
+    machine which checks a shard of the same folder agrees on which files are
+    in it, whatever order they are listed in.
+
+    Parameters
+    ----------
+    key : str
+        the key of the file
+    shard : tuple of int
+        the index (starting at 1) and the number of shards
+
+    Returns
+    -------
+    ans : bool
+        whether the file is in the shard
+    """
+
+    # Import standard modules ...
+    import hashlib
+
+    # Return answer ...
+    return int.from_bytes(hashlib.sha1(key.encode("utf-8")).digest()[:8], "big") % shard[1] == shard[0] - 1
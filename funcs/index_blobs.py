@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def index_blobs(
+    dname,
+    /,
+    *,
+    timeout = 60.0,
+):
+    """Find the Git blob IDs of the unmodified files in a Git repository
+
+    This function returns the Git blob IDs of the files in a folder in a Git
+    repository whose contents are the same as in the index, reading them from
+    the index (with "git ls-files -s") instead of reading the files. Files
+    which Git thinks might have been modified (with "git diff-files") are not
+    returned, so that their Git blob IDs can be found by reading them instead.
+
+    Parameters
+    ----------
+    dname : str
+        the folder
+    timeout : float, optional
+        the timeout for each call to Git
+
+    Returns
+    -------
+    shas : dict
+        the Git blob IDs, keyed by file name (which is empty if Git is not
+        installed or the folder is not in a Git repository)
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        return {}
+
+    # List the files in the index and the files which might have been
+    # modified ...
+    try:
+        staged = subprocess.run(
+            [
+                gitPath,
+                "-C", dname,
+                "ls-files",
+                "-z",
+                "-s",
+            ],
+               check = True,
+            encoding = "utf-8",
+              stderr = subprocess.DEVNULL,
+              stdout = subprocess.PIPE,
+             timeout = timeout,
+        ).stdout
+        modified = subprocess.run(
+            [
+                gitPath,
+                "-C", dname,
+                "diff-files",
+                "-z",
+                "--name-only",
+                "--relative",
+            ],
+               check = True,
+            encoding = "utf-8",
+              stderr = subprocess.DEVNULL,
+              stdout = subprocess.PIPE,
+             timeout = timeout,
+        ).stdout
+    except subprocess.CalledProcessError:
+        return {}
+
+    # Loop over the entries in the index (each one is "<mode> <object>
+    # <stage>\t<path>") and skip the ones which are not regular files, which
+    # are not merged or which might have been modified ...
+    shas = {}
+    skips = set(modified.split("\0"))
+    for line in staged.split("\0"):
+        if not line:
+            continue
+        info, path = line.split("\t", 1)
+        mode, sha, stage = info.split()
+        if mode == "120000" or mode == "160000" or stage != "0" or path in skips:
+            continue
+        shas[os.path.join(dname, path)] = sha
+
+    # Return answer ...
+    return shas
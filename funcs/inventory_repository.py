@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def inventory_repository(
+    dname,
+    /,
+    *,
+    timeout = 60.0,
+):
+    """Find the state of a Git repository
+
+    This function finds the branches (and how far ahead of and behind their
+    upstreams they are), the remote branches, the tags, the remotes, the dirty
+    state and the state of the submodules of a Git repository. It only runs
+    three Git processes: one call to "git for-each-ref" for all of the
+    references, one call to "git status --porcelain=v2 --branch" for the
+    current branch, the dirty state and the state of the submodules and one
+    call to "git config" for the remotes (plus one more call to "git config"
+    for the paths of the submodules, if there are any). It is safe to call
+    from a worker thread.
+
+    Parameters
+    ----------
+    dname : str
+        the Git repository
+    timeout : float, optional
+        the timeout for each call to Git
+
+    Returns
+    -------
+    inventory : dict
+        the state of the Git repository (or the reason that it could not be
+        found, as "error")
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Initialize inventory and dictionary ...
+    inventory = {
+                 "ahead" : None,
+                "behind" : None,
+                "branch" : None,
+              "branches" : {},
+               "changes" : {
+                     "staged" : 0,
+                   "unmerged" : 0,
+                   "unstaged" : 0,
+                  "untracked" : 0,
+                },
+                 "dirty" : False,
+                 "error" : None,
+                  "head" : None,
+        "remoteBranches" : {},
+               "remotes" : {},
+            "submodules" : {},
+                  "tags" : {},
+              "upstream" : None,
+    }
+    states = {}
+
+    # Run the Git commands ...
+    # NOTE: "git config" exits with 1 if nothing matches.
+    resps = []
+    for cmd, codes in [
+        (
+            [
+                "for-each-ref",
+                "--format=%(refname)%00%(objectname)%00%(*objectname)%00%(upstream:short)%00%(upstream:track,nobracket)",
+                "refs/heads",
+                "refs/remotes",
+                "refs/tags",
+            ],
+            [0],
+        ),
+        (
+            [
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "-z",
+                "--ignore-submodules=none",
+            ],
+            [0],
+        ),
+        (
+            [
+                "config",
+                "-z",
+                "--get-regexp",
+                r"^remote\..*\.url$",
+            ],
+            [0, 1],
+        ),
+    ]:
+        try:
+            resp = subprocess.run(
+                [gitPath, "-C", dname] + cmd,
+                   check = False,
+                encoding = "utf-8",
+                  errors = "replace",
+                  stderr = subprocess.PIPE,
+                  stdout = subprocess.PIPE,
+                 timeout = timeout,
+            )
+        except subprocess.TimeoutExpired:
+            inventory["error"] = f"\"git {cmd[0]}\" timed out after {timeout:,.1f} s"
+            return inventory
+        if resp.returncode not in codes:
+            inventory["error"] = f"\"git {cmd[0]}\" failed: {resp.stderr.strip().splitlines()[0] if resp.stderr.strip() else resp.returncode}"
+            return inventory
+        resps.append(resp.stdout)
+
+    # **************************************************************************
+
+    # Loop over references ...
+    for line in resps[0].splitlines():
+        refname, oid, peeled, upstream, track = line.split("\0")
+
+        # Check what sort of reference it is ...
+        if refname.startswith("refs/heads/"):
+            # Find how far ahead of and behind its upstream the branch is ...
+            ahead, behind = 0, 0
+            for part in track.split(", "):
+                if part.startswith("ahead "):
+                    ahead = int(part.removeprefix("ahead "))
+                elif part.startswith("behind "):
+                    behind = int(part.removeprefix("behind "))
+            inventory["branches"][refname.removeprefix("refs/heads/")] = {
+                 "ahead" : ahead if upstream and track != "gone" else None,
+                "behind" : behind if upstream and track != "gone" else None,
+                   "oid" : oid,
+              "upstream" : upstream or None,
+            }
+        elif refname.startswith("refs/remotes/"):
+            inventory["remoteBranches"][refname.removeprefix("refs/remotes/")] = oid
+        else:
+            # NOTE: Annotated tags are peeled to the commit that they point to.
+            inventory["tags"][refname.removeprefix("refs/tags/")] = peeled or oid
+
+    # Loop over the entries of the status ...
+    # NOTE: See https://git-scm.com/docs/git-status#_porcelain_format_version_2
+    #       (where each entry is terminated by NUL and renamed or copied entries
+    #       are followed by the original path).
+    entries = iter(resps[1].split("\0"))
+    for entry in entries:
+        # Skip empty entries ...
+        if not entry:
+            continue
+
+        # Check what sort of entry it is ...
+        match entry[0]:
+            case "#":
+                key, _, value = entry.removeprefix("# ").partition(" ")
+                match key:
+                    case "branch.oid":
+                        inventory["head"] = None if value == "(initial)" else value
+                    case "branch.head":
+                        inventory["branch"] = None if value == "(detached)" else value
+                    case "branch.upstream":
+                        inventory["upstream"] = value
+                    case "branch.ab":
+                        ahead, behind = value.split(" ")
+                        inventory["ahead"] = int(ahead.removeprefix("+"))
+                        inventory["behind"] = int(behind.removeprefix("-"))
+            case "1" | "2":
+                fields = entry.split(" ", 8 if entry[0] == "1" else 9)
+                if fields[1][0] != ".":
+                    inventory["changes"]["staged"] += 1
+                if fields[1][1] != ".":
+                    inventory["changes"]["unstaged"] += 1
+                if fields[2].startswith("S"):
+                    states[fields[-1]] = fields[2]
+                if entry[0] == "2":
+                    next(entries)
+            case "u":
+                inventory["changes"]["unmerged"] += 1
+            case "?":
+                inventory["changes"]["untracked"] += 1
+    inventory["dirty"] = any(count > 0 for count in inventory["changes"].values())
+
+    # Loop over remotes ...
+    for entry in resps[2].split("\0"):
+        # Skip empty entries ...
+        if not entry:
+            continue
+
+        # Add the remote ...
+        key, _, url = entry.partition("\n")
+        inventory["remotes"][key.removeprefix("remote.").removesuffix(".url")] = url
+
+    # **************************************************************************
+
+    # Check if there are any submodules ...
+    if os.path.exists(f"{dname}/.gitmodules"):
+        # Find the paths of the submodules ...
+        # NOTE: "git config" exits with 1 if nothing matches.
+        try:
+            resp = subprocess.run(
+                [gitPath, "-C", dname, "config", "-z", "--file", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"],
+                   check = False,
+                encoding = "utf-8",
+                  errors = "replace",
+                  stderr = subprocess.DEVNULL,
+                  stdout = subprocess.PIPE,
+                 timeout = timeout,
+            )
+        except subprocess.TimeoutExpired:
+            inventory["error"] = f"\"git config\" timed out after {timeout:,.1f} s"
+            return inventory
+
+        # Loop over submodules ...
+        for entry in resp.stdout.split("\0"):
+            # Skip empty entries ...
+            if not entry:
+                continue
+
+            # Add the submodule, where the state is the one from the status (if
+            # it has changed, see "git status") ...
+            _, _, path = entry.partition("\n")
+            inventory["submodules"][path] = {
+                "initialized" : os.path.exists(f"{dname}/{path}/.git"),
+                      "state" : states.get(path, "S..."),
+            }
+
+    # Return answer ...
+    return inventory
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def iter_jobs(
+    func,
+    tasks,
+    /,
+    *,
+    jobs = 1,
+):
+    """Run a function over a list of tasks, yielding the answers
+
+    This function calls a function once for each task (with the task as its
+    positional arguments) and yields the answers in the same order as the
+    tasks, as soon as each one (and all of the ones before it) has been found,
+    so that the caller can start using the answers before all of the tasks
+    have been run. If more than one job is requested then the tasks are run in
+    chunks in a pool of worker processes.
+
+    Parameters
+    ----------
+    func : function
+        the function (which must be importable by the worker processes)
+    tasks : list of tuple
+        the tasks
+    jobs : int, optional
+        the number of worker processes
+
+    Yields
+    ------
+    ans : any
+        the answer of each task
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+
+    # Run the tasks serially if there is no point starting a pool ...
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield func(*task)
+        return
+
+    # Run the tasks in a pool, in chunks which are small enough to keep all of
+    # the workers busy but large enough to amortise the cost of sending them ...
+    with concurrent.futures.ProcessPoolExecutor(max_workers = jobs) as pool:
+        yield from pool.map(
+            func,
+            *zip(*tasks, strict = True),
+            chunksize = max(1, len(tasks) // (4 * jobs)),
+        )
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def keyword_diagnostics(
+    fnames,
+    summaries,
+    /,
+    *,
+      table = None,
+    targets = None,
+):
+    """Find the keyword-only arguments which are not sorted or not passed
+
+    This function builds a project-wide symbol table of all of the function
+    definitions and method definitions in some Python scripts (see
+    "symbol_table()") and then checks all of the calls to those functions and
+    methods in the Python scripts against it, resolving each function call to
+    the one function (or method) that it refers to (see "resolve_symbol()"),
+    so that functions which have the same name in different modules do not
+    collide. It is a generator, so that each diagnostic can be reported as soon
+    as it is found.
+
+    Parameters
+    ----------
+    fnames : list of str
+        the file names of the Python scripts
+    summaries : list of dict
+        the summaries of the Python scripts (see
+        "summarise_keyword_arguments()")
+    table : dict, optional
+        the symbol table of the Python scripts (if None then it is built, see
+        "symbol_table()"), so that a caller which checks the same Python scripts
+        many times can build it once
+    targets : set of str, optional
+        the file names of the Python scripts to report on (if None then all of
+        the Python scripts are reported on, otherwise the symbol table is still
+        built from all of the Python scripts)
+
+    Yields
+    ------
+    diagnostic : dict
+        the diagnostic (see "write_report()")
+    """
+
+    # Import sub-functions ...
+    from .resolve_symbol import resolve_symbol
+    from .symbol_table import symbol_table
+
+    # Build the symbol table (if it has not been built already) ...
+    if table is None:
+        table = symbol_table(fnames, summaries)
+
+    # Loop over Python scripts ...
+    for fname, summary in zip(fnames, summaries, strict = True):
+        # Loop over function definitions ...
+        for body in summary["defs"]:
+            # Check if there are any arguments which are not explicitly either
+            # keyword-only arguments or positional-only arguments...
+            if body["nArgs"] != 0:
+                # Cry ...
+                raise Exception(f"\"{fname}\" has ambiguous arguments (you need to use / and * in the definition)") from None
+
+        # Skip this Python script if it is not to be reported on ...
+        if targets is not None and fname not in targets:
+            continue
+
+        # Loop over function definitions and method definitions ...
+        for body in summary["defs"] + summary["methods"]:
+            # Skip this function if its keyword-only arguments are already
+            # sorted ...
+            if body["kwonlyargs"] == sorted(body["kwonlyargs"], key = str.lower):
+                continue
+
+            # Yield diagnostic ...
+            yield {
+                    "col" : body["col"],
+                   "file" : fname,
+                   "line" : body["line"],
+                "message" : f"The keyword-only arguments of \"{body['name']}()\" in \"{fname}\" are not sorted.",
+                   "rule" : "keyword-arguments-sorted",
+            }
+
+    # **************************************************************************
+
+    # Loop over Python scripts ...
+    for iFile, (fname, summary) in enumerate(zip(fnames, summaries, strict = True)):
+        # Skip this Python script if it is not to be reported on ...
+        if targets is not None and fname not in targets:
+            continue
+
+        # Loop over function calls ...
+        for call in summary["calls"]:
+            # Skip this function call if it cannot be resolved to one of the
+            # functions (or methods) in the symbol table ...
+            key = resolve_symbol(table, iFile, call["callee"])
+            if key is None:
+                continue
+
+            # Loop over keyword-only arguments that *should* be passed ...
+            for keyword in table["defs"][key]["kwonlyargs"]:
+                # Skip this keyword-only argument if it is passed ...
+                if keyword in call["keywords"]:
+                    continue
+
+                # Yield diagnostic ...
+                yield {
+                        "col" : call["col"],
+                       "file" : fname,
+                       "line" : call["line"],
+                    "message" : f"\"{call['caller']}()\" in \"{fname}\" calls \"{call['callee']}()\" but does not pass \"{keyword} = \".",
+                       "rule" : "keyword-arguments-passed",
+                }
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def keyword_targets(
+    dname,
+    fnames,
+    summaries,
+    changed,
+    /,
+    *,
+    base,
+):
+    """Find the Python scripts affected by some changed Python scripts
+
+    This function finds the Python scripts which need to be re-checked for
+    keyword-only arguments when some Python scripts have changed: the changed
+    Python scripts themselves and every Python script which calls a function
+    whose keyword-only arguments have changed. The old function definitions
+    are read from the Git object store (without checking anything out) and
+    the callers are found with a reverse index of the resolved function calls
+    (see "symbol_table()").
+
+    Parameters
+    ----------
+    dname : str
+        the folder in the Git repository
+    fnames : list of str
+        the file names of the Python scripts
+    summaries : list of dict
+        the summaries of each Python script (see
+        "summarise_keyword_arguments()")
+    changed : list of str
+        the file names of the Python scripts which have changed
+    base : str
+        the Git reference to read the old function definitions from
+
+    Returns
+    -------
+    targets : set of str
+        the file names of the Python scripts to report on
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import sub-functions ...
+    from .cat_blobs import cat_blobs
+    from .resolve_symbol import resolve_symbol
+    from .summarise_keyword_arguments import summarise_keyword_arguments
+    from .symbol_table import symbol_table
+
+    # Build the symbol table and create short-hand ...
+    table = symbol_table(fnames, summaries)
+    iFiles = {fname : iFile for iFile, fname in enumerate(fnames)}
+
+    # Initialize sets ...
+    keys = set()
+    targets = set(changed)
+
+    # Loop over the old versions of the changed Python scripts ...
+    for fname, (_, src) in zip(
+        changed,
+        cat_blobs(
+            dname,
+            [f"{base}:./{os.path.relpath(fname, dname)}" for fname in changed],
+        ),
+        strict = True,
+    ):
+        # Skip this Python script if it has not been summarised ...
+        if fname not in iFiles:
+            continue
+
+        # Find the keyword-only arguments of the old and the new function (and
+        # method) definitions ...
+        summary = summaries[iFiles[fname]]
+        new = {body["name"] : body["kwonlyargs"] for body in summary["defs"] + summary["methods"]}
+        old = {}
+        if src is not None:
+            try:
+                summary = summarise_keyword_arguments(src)
+            except SyntaxError:
+                old = None
+            else:
+                old = {body["name"] : body["kwonlyargs"] for body in summary["defs"] + summary["methods"]}
+
+        # Add the keys of the functions whose keyword-only arguments have
+        # changed (which is all of them if the old version cannot be parsed) ...
+        # NOTE: Functions which have been removed are not added, as calls to
+        #       them cannot be resolved any more and so are not checked.
+        file = table["files"][iFiles[fname]]
+        for name, kwonlyargs in new.items():
+            if old is None or old.get(name) != kwonlyargs:
+                keys.add((file["root"], f"{file['module']}.{name}"))
+
+    # Check if no functions have changed ...
+    if not keys:
+        # Return answer ...
+        return targets
+
+    # Build a reverse index of the Python scripts which call each function ...
+    callers : dict[tuple[str, str], set[str]] = {}
+    for iFile, (fname, summary) in enumerate(zip(fnames, summaries, strict = True)):
+        for call in summary["calls"]:
+            key = resolve_symbol(table, iFile, call["callee"])
+            if key is None:
+                continue
+            if key not in callers:
+                callers[key] = set()
+            callers[key].add(fname)
+
+    # Add the Python scripts which call the functions whose keyword-only
+    # arguments have changed ...
+    for key in keys:
+        targets |= callers.get(key, set())
+
+    # Return answer ...
+    return targets
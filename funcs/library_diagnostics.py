@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def library_diagnostics(
+    fnames,
+    summaries,
+    kwFuncs,
+    /,
+    *,
+    lite,
+    unImpKwArgs,
+):
+    """Find the keyword-only arguments which are not passed to some libraries
+
+    This function checks the summaries of the calls to some libraries in some
+    Python scripts against a database of the keyword-only arguments of the
+    functions in the libraries, in the same way as "report_library_calls()".
+    It is a generator, so that each diagnostic can be reported as soon as it is
+    found (instead of being collected into a log).
+
+    Parameters
+    ----------
+    fnames : list of str
+        the file names of the Python scripts
+    summaries : list of list of dict
+        the summaries of the calls to the libraries in each Python script
+    kwFuncs : dict
+        the database of the keyword-only arguments of the functions in the
+        libraries
+    lite : bool
+        don't check for "un-important" keyword-only arguments
+    unImpKwArgs : list of str
+        the "un-important" keyword-only arguments to not check for if "lite"
+
+    Yields
+    ------
+    diagnostic : dict
+        the diagnostic (see "write_report()")
+    """
+
+    # Loop over Python scripts ...
+    for fname, calls in zip(fnames, summaries, strict = True):
+        # Loop over library function calls ...
+        for call in calls:
+            # Create short-hand ...
+            key = call["key"]
+
+            # Skip if this library function doesn't have keywords ...
+            if key not in kwFuncs:
+                continue
+
+            # Catch unexpected types ...
+            if call["keywords"] is None:
+                yield {
+                        "col" : call["col"],
+                       "file" : fname,
+                       "line" : call["line"],
+                    "message" : f"\"{fname}\" calls \"{key}()\" but the keywords which are passed cannot be found as \"node.func.value\" is a \"{call['type']}\".",
+                       "rule" : "library-keyword-arguments-unknown",
+                }
+                continue
+
+            # Check that every keyword which is passed is recognised ...
+            for keyword in call["keywords"]:
+                if keyword not in kwFuncs[key]:
+                    raise Exception(f"{fname}:{call['line']:d} » {key}() » \"{keyword}\" is specified but it is not a recognised keyword")
+
+            # Loop over keywords ...
+            for keyword in kwFuncs[key]:
+                # Check if this keyword is passed ...
+                if keyword in call["keywords"]:
+                    # Yield diagnostic (if it is "un-important" and should not
+                    # be passed) ...
+                    if lite and keyword in unImpKwArgs:
+                        yield {
+                                "col" : call["col"],
+                               "file" : fname,
+                               "line" : call["line"],
+                            "message" : f"\"{fname}\" calls \"{key}()\" and passes \"{keyword} = \" but it shouldn't.",
+                               "rule" : "library-keyword-arguments-un-important",
+                        }
+                    continue
+
+                # Yield diagnostic (unless it is "un-important") ...
+                if not lite or keyword not in unImpKwArgs:
+                    yield {
+                            "col" : call["col"],
+                           "file" : fname,
+                           "line" : call["line"],
+                        "message" : f"\"{fname}\" calls \"{key}()\" but does not pass \"{keyword} = \".",
+                           "rule" : "library-keyword-arguments-passed",
+                    }
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def lint_source(
+    src,
+    plugins,
+    /,
+):
+    """Parse a Python script once and summarise it with some plugins
+
+    This function parses a Python script once and then passes the parsed
+    Python script to each of the plugins in turn, so that a lint session which
+    runs lots of checks only pays for one parse of each Python script. It is
+    safe to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes
+        the contents of the Python script
+    plugins : tuple of tuple
+        the plugins, each one being the name of a function in this module
+        (which accepts an already parsed Python script as its first argument)
+        and a tuple of the rest of its arguments
+
+    Returns
+    -------
+    results : list
+        the results of each plugin
+    """
+
+    # Import standard modules ...
+    import ast
+    import importlib
+
+    # Parse the Python script ...
+    tree = ast.parse(src)
+
+    # Initialize list ...
+    results = []
+
+    # Loop over plugins ...
+    for name, args in plugins:
+        # Find the function and append its result ...
+        func = getattr(importlib.import_module(f".{name}", __package__), name)
+        results.append(func(tree, *args))
+
+    # Return answer ...
+    return results
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def list_files(
+    dname,
+    /,
+    *,
+      debug = __debug__,
+    timeout = 60.0,
+):
+    """List the files in a folder, using the Git index where possible
+
+    This function returns a sorted list of the files in a folder (which may be
+    a Git repository or a folder containing Git repositories). The files in a
+    Git repository are listed from its index with a single call to "git
+    ls-files" (including untracked files which are not ignored), so the
+    ".git" folder, ignored files and Git submodules are never walked (any
+    untracked nested Git repositories are listed in the same way). Any
+    folders which are not in a Git repository are walked, skipping ".git"
+    folders and the paths of any Git submodules listed in ".gitmodules". Git
+    submodules are therefore not listed, and symbolic links are neither
+    followed nor listed.
+
+    Parameters
+    ----------
+    dname : str
+        the folder
+    debug : bool, optional
+        print debug messages
+    timeout : float, optional
+        the timeout for each call to "git ls-files"
+
+    Returns
+    -------
+    fnames : list of str
+        the sorted file names
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+
+    # Initialize set and list ...
+    prunes = set()
+    fnames = []
+
+    # Loop over folders ...
+    for root, dnames, files in os.walk(dname, followlinks = False):
+        # Check if Git is installed and this folder is either the top of a Git
+        # repository (or a Git submodule or a Git worktree, for which ".git" is
+        # a file) or the folder that was asked for (which may be inside a Git
+        # repository) ...
+        if gitPath is not None and (root == dname or os.path.exists(f"{root}/.git")):
+            # List the files in the Git repository from its index (and stop
+            # walking it if this works) ...
+            try:
+                resp = subprocess.run(
+                    [
+                        gitPath,
+                        "-C", root,
+                        "ls-files",
+                        "-z",
+                        "--cached",
+                        "--others",
+                        "--exclude-standard",
+                    ],
+                       check = True,
+                    encoding = "utf-8",
+                      stderr = subprocess.DEVNULL,
+                      stdout = subprocess.PIPE,
+                     timeout = timeout,
+                )
+            except subprocess.CalledProcessError:
+                if debug:
+                    print(f"WARNING: \"{root}\" cannot be listed by Git, so it will be walked.")
+            else:
+                if debug:
+                    print(f"DEBUG: Listed \"{root}\" from its Git index.")
+                for path in set(resp.stdout.split("\0")):
+                    fname = os.path.join(root, path)
+
+                    # Check if it is an untracked folder which is a nested Git
+                    # repository (which "git ls-files" only lists as the
+                    # folder, followed by a "/") and list it in the same way ...
+                    if path.endswith("/") and os.path.exists(f"{fname}.git"):
+                        fnames += list_files(
+                            fname.removesuffix("/"),
+                              debug = debug,
+                            timeout = timeout,
+                        )
+                        continue
+
+                    if not path or os.path.islink(fname) or not os.path.isfile(fname):
+                        continue
+                    fnames.append(fname)
+                dnames.clear()
+                continue
+
+        # Deduce .gitmodules file name, check if it exists and populate set
+        # with the paths of Git submodules to prune if it does ...
+        mname = f"{root}/.gitmodules"
+        if os.path.exists(mname):
+            with open(mname, "rt", encoding = "utf-8") as fObj:
+                for line in fObj:
+                    if not line.strip().startswith("path = "):
+                        continue
+                    prunes.add(os.path.normpath(f'{root}/{"=".join(line.strip().split("=")[1:]).strip()}'))
+
+        # Prune ".git" folders and Git submodules before descending ...
+        dnames[:] = [sub for sub in dnames if sub != ".git" and os.path.normpath(f"{root}/{sub}") not in prunes]
+
+        # Loop over files ...
+        for name in files:
+            fname = os.path.join(root, name)
+            if os.path.islink(fname):
+                continue
+            fnames.append(fname)
+
+    # Return answer ...
+    return sorted(fnames)
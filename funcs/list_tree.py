@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def list_tree(
+    dname,
+    rev,
+    /,
+    *,
+    timeout = 60.0,
+):
+    """List the files in a revision of a Git repository
+
+    This function returns a sorted list of the files (and their blob IDs) in a
+    folder in a revision of a Git repository, reading them from the object
+    store using a single call to "git ls-tree" (so nothing is checked out).
+    Symbolic links and Git submodules are not listed.
+
+    Parameters
+    ----------
+    dname : str
+        the folder
+    rev : str
+        the revision (for example, a commit, a branch or a tag)
+    timeout : float, optional
+        the timeout for the call to "git ls-tree"
+
+    Returns
+    -------
+    files : list of tuple of str
+        the sorted paths (relative to the folder) and blob IDs of the files
+    """
+
+    # Import standard modules ...
+    import shutil
+    import subprocess
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # List the files in the revision ...
+    try:
+        resp = subprocess.run(
+            [
+                gitPath,
+                "-C", dname,
+                "ls-tree",
+                "-r",
+                "-z",
+                rev,
+            ],
+               check = True,
+            encoding = "utf-8",
+              stderr = subprocess.PIPE,
+              stdout = subprocess.PIPE,
+             timeout = timeout,
+        )
+    except subprocess.CalledProcessError as err:
+        raise Exception(f"\"git ls-tree\" failed in \"{dname}\": {err.stderr.strip().splitlines()[0] if err.stderr.strip() else err.returncode}") from None
+
+    # Loop over the entries in the revision (each one is "<mode> <type>
+    # <object>\t<path>") and skip the ones which are not regular files ...
+    files = []
+    for line in resp.stdout.split("\0"):
+        if not line:
+            continue
+        info, path = line.split("\t", 1)
+        mode, kind, sha = info.split()
+        if kind != "blob" or mode == "120000":
+            continue
+        files.append((path, sha))
+
+    # Return answer ...
+    return sorted(files)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_blob_results(
+    db,
+    sha,
+    fingerprints,
+    /,
+):
+    """Load the stored results of some rules for a Git blob ID
+
+    Parameters
+    ----------
+    db : sqlite3.Connection
+        the connection to the store (see "open_blob_store()")
+    sha : str
+        the Git blob ID
+    fingerprints : dict
+        the fingerprints of the rules to load, keyed by rule ID
+
+    Returns
+    -------
+    results : dict
+        the stored diagnostics and fingerprints of the rules which have been
+        stored with the same fingerprints, keyed by rule ID
+    """
+
+    # Import standard modules ...
+    import json
+
+    # Initialize dictionary ...
+    results = {}
+
+    # Loop over the stored results of this Git blob ID and keep the ones which
+    # were found by the current version of each rule ...
+    for ruleId, fingerprint, diagnostics in db.execute(
+        "SELECT rule, fingerprint, diagnostics FROM results WHERE sha = ?",
+        (sha,),
+    ):
+        if fingerprints.get(ruleId) != fingerprint:
+            continue
+        results[ruleId] = {
+            "diagnostics" : json.loads(diagnostics),
+            "fingerprint" : fingerprint,
+        }
+
+    # Return answer ...
+    return results
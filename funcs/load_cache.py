@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_cache(
+    fname,
+    version,
+    /,
+    *,
+    debug = __debug__,
+):
+    """Load a cache
+
+    This function loads a cache from a JSON file. An empty cache is returned if
+    the JSON file does not exist, if it cannot be loaded or if it was written by
+    a different version of the script.
+
+    Parameters
+    ----------
+    fname : str
+        the JSON file name
+    version : str
+        the version of the script which is using the cache
+    debug : bool, optional
+        print debug messages
+
+    Returns
+    -------
+    cache : dict
+        the cache
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Return an empty cache if there isn't a JSON file ...
+    if not os.path.exists(fname):
+        return {}
+
+    # Load the JSON file ...
+    try:
+        with open(fname, "rt", encoding = "utf-8") as fObj:
+            db = json.load(fObj)
+    except json.JSONDecodeError:
+        if debug:
+            print(f"WARNING: \"{fname}\" cannot be loaded, so the cache will be rebuilt.")
+        return {}
+
+    # Return an empty cache if the JSON file is from a different version ...
+    if db.get("version") != version:
+        if debug:
+            print(f"WARNING: \"{fname}\" is from a different version, so the cache will be rebuilt.")
+        return {}
+
+    # Return answer ...
+    return db["cache"]
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loop_context(
+    tree,
+    /,
+):
+    """Find the loop context of every node in a parsed Python script
+
+    This function walks a parsed Python script once and finds how deeply each
+    node is nested inside loops ("for" loops, "while" loops and
+    comprehensions), where the body of a function (or a lambda) starts again
+    at a loop depth of zero. It also finds the nodes which the rules of the
+    performance anti-patterns are dispatched on (see "compile_rules()"):
+
+    * membership tests ("in" and "not in") against a list which is built by a
+      comprehension, by "list()" or by "sorted()" or which is a name that is
+      only ever assigned lists in its scope, as "<membership>";
+    * in-place additions ("+=") to a name which is a string (or which is only
+      ever assigned strings in its scope), as "<concatenation>"; and
+    * function calls whose results are iterated over and then filtered (by
+      the condition of a comprehension or by an "if" statement at the top of
+      the body of a "for" loop), as "filtered".
+
+    Parameters
+    ----------
+    tree : ast.Module
+        the parsed Python script
+
+    Returns
+    -------
+    context : dict
+        the loop depths (as "depths", keyed by node), the function calls whose
+        results are filtered (as "filtered") and the keys of the other nodes
+        which rules are dispatched on (as "patterns", keyed by node)
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize dictionaries, lists and sets ...
+    context = {
+          "depths" : {},
+        "filtered" : set(),
+        "patterns" : {},
+    }
+    kinds : dict[tuple[ast.AST, str], set[str]] = {}
+    handled = set()
+    compares = []
+    augAssigns = []
+
+    # Define a function to find the kind of value that an expression is ...
+    def kind_of(value, /):
+        """Find the kind of value that an expression is"""
+
+        # Return answer ...
+        if isinstance(value, ast.List | ast.ListComp):
+            return "list"
+        if isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and value.func.id in ["list", "sorted"]:
+            return "list"
+        if isinstance(value, ast.JoinedStr) or isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return "str"
+        return "other"
+
+    # Walk the parsed Python script, keeping track of the loop depth and of the
+    # scope of each node ...
+    stack = [(tree, 0, tree)]
+    while stack:
+        node, depth, scope = stack.pop()
+        context["depths"][node] = depth
+
+        # Record the kinds of values that names are assigned in this scope (an
+        # in-place addition does not change the kind of value) ...
+        if isinstance(node, ast.Assign | ast.AnnAssign):
+            for target in node.targets if isinstance(node, ast.Assign) else [node.target]:
+                if isinstance(target, ast.Name):
+                    kinds.setdefault((scope, target.id), set()).add(kind_of(node.value))
+                    handled.add(target)
+        elif isinstance(node, ast.AugAssign):
+            handled.add(node.target)
+            augAssigns.append((node, scope))
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store) and node not in handled:
+            kinds.setdefault((scope, node.id), set()).add("other")
+        elif isinstance(node, ast.arg):
+            kinds.setdefault((scope, node.arg), set()).add("other")
+        elif isinstance(node, ast.Compare):
+            compares.append((node, scope))
+
+        # Check what sort of node it is and push its children with their loop
+        # depths and their scopes ...
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda):
+            # NOTE: The decorators and the default values are evaluated where
+            #       the function is defined, but the arguments and the body are
+            #       in a new scope.
+            body = node.body if isinstance(node.body, list) else [node.body]
+            defaults = node.args.defaults + [kwDefault for kwDefault in node.args.kw_defaults if kwDefault is not None]
+            context["depths"][node.args] = 0
+            for child in ast.iter_child_nodes(node.args):
+                if any(child is default for default in defaults):
+                    stack.append((child, depth, scope))
+                else:
+                    stack.append((child, 0, node))
+            for child in ast.iter_child_nodes(node):
+                if child is node.args:
+                    continue
+                if any(child is stmt for stmt in body):
+                    stack.append((child, 0, node))
+                else:
+                    stack.append((child, depth, scope))
+        elif isinstance(node, ast.For | ast.AsyncFor):
+            # Check if the body of the "for" loop starts by filtering the
+            # result of a function call ...
+            if isinstance(node.iter, ast.Call) and isinstance(node.body[0], ast.If) and not node.body[0].orelse:
+                if len(node.body) == 1 or all(isinstance(stmt, ast.Continue) for stmt in node.body[0].body):
+                    context["filtered"].add(node.iter)
+            for child in [node.target, node.iter] + node.orelse:
+                stack.append((child, depth, scope))
+            for child in node.body:
+                stack.append((child, depth + 1, scope))
+        elif isinstance(node, ast.While):
+            for child in [node.test] + node.body:
+                stack.append((child, depth + 1, scope))
+            for child in node.orelse:
+                stack.append((child, depth, scope))
+        elif isinstance(node, ast.ListComp | ast.SetComp | ast.GeneratorExp | ast.DictComp):
+            # NOTE: Only the iterable of the first generator is evaluated once.
+            for iGen, gen in enumerate(node.generators):
+                if isinstance(gen.iter, ast.Call) and gen.ifs:
+                    context["filtered"].add(gen.iter)
+                context["depths"][gen] = depth + iGen
+                stack.append((gen.iter, depth + iGen, scope))
+                for child in [gen.target] + gen.ifs:
+                    stack.append((child, depth + iGen + 1, scope))
+            for child in [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]:
+                stack.append((child, depth + len(node.generators), scope))
+        else:
+            for child in ast.iter_child_nodes(node):
+                stack.append((child, depth, scope))
+
+    # Define a function to find the kinds of values that a name is assigned (in
+    # its own scope, or in the module if it is not assigned in its own
+    # scope) ...
+    def kinds_of(name, scope, /):
+        """Find the kinds of values that a name is assigned"""
+
+        # Return answer ...
+        return kinds.get((scope, name), kinds.get((tree, name), set()))
+
+    # Loop over membership tests and record the ones against lists ...
+    for node, scope in compares:
+        for op, comparator in zip(node.ops, node.comparators, strict = True):
+            if not isinstance(op, ast.In | ast.NotIn):
+                continue
+            if isinstance(comparator, ast.Name):
+                if kinds_of(comparator.id, scope) != {"list"}:
+                    continue
+            elif isinstance(comparator, ast.List) or kind_of(comparator) != "list":
+                # NOTE: Membership tests against list displays are skipped, as
+                #       they are short and Python turns them into tuples.
+                continue
+            context["patterns"][node] = "<membership>"
+            break
+
+    # Loop over in-place additions and record the ones to strings ...
+    for node, scope in augAssigns:
+        if not isinstance(node.op, ast.Add) or not isinstance(node.target, ast.Name):
+            continue
+        if kind_of(node.value) != "str" and kinds_of(node.target.id, scope) != {"str"}:
+            continue
+        context["patterns"][node] = "<concatenation>"
+
+    # Return answer ...
+    return context
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def non_standard_modules(
+    name,
+    imports,
+    /,
+):
+    """Find the non-standard modules imported by a repository
+
+    This function merges the lists of modules imported by the Python scripts in
+    a repository and returns the ones which are not standard Python modules
+    (or the repository itself), along with the modules which are required by
+    them but which are not imported.
+
+    Parameters
+    ----------
+    name : str
+        the name of the repository
+    imports : list of list of str
+        the lists of modules imported by each Python script in the repository
+
+    Returns
+    -------
+    modules : list of str
+        the names of the imported non-standard modules
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Load list of standard Python modules ...
+    with open(f"{os.path.dirname(os.path.dirname(os.path.realpath(__file__, strict = True)))}/Python 3.12 Standard Modules.json", "rt", encoding = "utf-8") as fObj:
+        standardModules = json.load(fObj)
+
+    # Append common non-standard Python modules that I do not want to be warned
+    # about ...
+    standardModules.append("f90")
+    standardModules.append("funcs")
+    standardModules.append("web_mod")
+
+    # Initialize list ...
+    modules = []
+
+    # Loop over lists of imported modules ...
+    for modulesList in imports:
+        # Append the missing non-standard modules to the list ...
+        for module in modulesList:
+            if module == name:
+                continue
+            if module in standardModules:
+                continue
+            if module in modules:
+                continue
+            modules.append(module)
+
+    # Return early if the repository does not import any non-standard
+    # modules ...
+    if len(modules) == 0:
+        return modules
+
+    # As Sphinx is not imported it is easy to miss Sphinx requirements, so make
+    # sure that Sphinx is there if the Sphinx theme is imported ...
+    if "sphinx_rtd_theme" in modules:
+        if "sphinx" not in modules:
+            modules.append("sphinx")
+    if "sphinx" in modules:
+        if "sphinx_fortran" not in modules:
+            modules.append("sphinx_fortran")
+
+    # It is unclear if NumPy always pulls in Meson/Ninja to allow f2py builds,
+    # so manually add them just in case ...
+    if "numpy" in modules:
+        if "meson" not in modules:
+            modules.append("meson")
+        if "ninja" not in modules:
+            modules.append("ninja")
+
+    # Return answer ...
+    return modules
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def open_blob_store(
+    fname,
+    version,
+    /,
+):
+    """Open a store of results keyed by Git blob ID
+
+    This function opens (creating it if it is missing) a SQLite database of
+    results keyed by the Git blob ID of the file that they are for and by the
+    fingerprint of the rule that found them. It can be shared by every
+    repository (and every revision) that is checked, so that byte-identical
+    files are only checked once. If the database is from a different version
+    then it is emptied.
+
+    Parameters
+    ----------
+    fname : str
+        the SQLite database file name
+    version : str
+        the version of the script which is using the store
+
+    Returns
+    -------
+    db : sqlite3.Connection
+        the connection to the SQLite database (which the caller must commit and
+        close)
+    """
+
+    # Import standard modules ...
+    import os
+    import sqlite3
+
+    # Make output folder if it is missing ...
+    if os.path.dirname(fname) and not os.path.exists(os.path.dirname(fname)):
+        os.makedirs(os.path.dirname(fname))
+
+    # Open the SQLite database and wait for other scripts which are writing to
+    # it ...
+    db = sqlite3.connect(fname, timeout = 60.0)
+
+    # Create the tables (if they are missing) ...
+    db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    db.execute("CREATE TABLE IF NOT EXISTS results (sha TEXT, rule TEXT, fingerprint TEXT, diagnostics TEXT, PRIMARY KEY (sha, rule, fingerprint))")
+
+    # Empty the SQLite database if it is from a different version ...
+    row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    if row is None or row[0] != version:
+        db.execute("DELETE FROM results")
+        db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+        db.commit()
+
+    # Return answer ...
+    return db
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def parse_shard(
+    text,
+    /,
+):
+    """Parse a shard
+
+    Parameters
+    ----------
+    text : str
+        the shard, written as "i/N" (for example, "1/4" is the first of four
+        shards)
+
+    Returns
+    -------
+    shard : tuple of int
+        the index (starting at 1) and the number of shards
+    """
+
+    # Parse the shard ...
+    try:
+        i, n = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise Exception(f"\"{text}\" is not a shard (it should be written as \"i/N\", for example \"1/4\")") from None
+
+    # Check the shard ...
+    if not 1 <= i <= n:
+        raise Exception(f"\"{text}\" is not a shard (\"i\" should be between 1 and \"N\")") from None
+
+    # Return answer ...
+    return i, n
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def plan_checks(
+    fname,
+    src,
+    entry,
+    rules,
+    /,
+    *,
+       checks,
+    libraries,
+       rFiles,
+):
+    """Plan which checks of a Python script need running
+
+    This function finds the checks which do not have valid cached summaries or
+    diagnostics in the cache entry of a Python script, along with the plugins
+    (see "lint_source()") which will create them. Rules which cannot match
+    anything in the Python script, and libraries which are not named in the
+    Python script, are skipped by searching for their trigger tokens (see
+    "find_triggers()") without parsing it, and the cache entry is updated
+    accordingly. Cached diagnostics of rules which no longer exist are
+    forgotten.
+
+    Parameters
+    ----------
+    fname : str
+        the file name of the Python script
+    src : bytes or None
+        the contents of the Python script (or None if it has not been loaded)
+    entry : dict
+        the cache entry of the Python script
+    rules : list of dict
+        the compiled rules
+    checks : list of str
+        the checks to run
+    libraries : list of str
+        the names of the libraries to check the calls of
+    rFiles : tuple of str
+        the JSON files of rules
+
+    Returns
+    -------
+    stale : list of str
+        the checks which need running
+    plugins : list of tuple
+        the plugins which need running
+    """
+
+    # Import sub-functions ...
+    from .find_triggers import find_triggers
+
+    # Create short-hands ...
+    callsKey = f"calls/{','.join(libraries)}"
+    fingerprints = {rule["id"] : rule["fingerprint"] for rule in rules}
+
+    # Forget about the cached diagnostics of any rules which no longer exist ...
+    if "rules" not in entry:
+        entry["rules"] = {}
+    for ruleId in list(entry["rules"].keys()):
+        if ruleId not in fingerprints:
+            del entry["rules"][ruleId]
+
+    # Initialize lists ...
+    stale = []
+    plugins = []
+
+    # Check if the user wants to run the rules ...
+    if "everything" in checks:
+        # Make a list of the rules which do not have valid cached diagnostics ...
+        ruleIds = []
+        for rule in rules:
+            if entry["rules"].get(rule["id"], {}).get("fingerprint") != fingerprints[rule["id"]]:
+                ruleIds.append(rule["id"])
+
+        # Store empty diagnostics for the rules which cannot match anything in
+        # the Python script ...
+        if ruleIds:
+            found = find_triggers(
+                fname if src is None else src,
+                tuple(trigger for rule in rules if rule["id"] in ruleIds for trigger in rule["triggers"]),
+            )
+            for rule in rules:
+                if rule["id"] in ruleIds and found.isdisjoint(rule["triggers"]):
+                    entry["rules"][rule["id"]] = {
+                        "diagnostics" : [],
+                        "fingerprint" : fingerprints[rule["id"]],
+                    }
+                    ruleIds.remove(rule["id"])
+        if ruleIds:
+            stale.append("everything")
+            plugins.append(("check_source", (rFiles, tuple(ruleIds))))
+
+    # Check if the user wants to check keyword-only arguments ...
+    if "keyword-arguments" in checks:
+        if any(key not in entry for key in ["aliases", "calls", "defs", "methods"]):
+            stale.append("keyword-arguments")
+            plugins.append(("summarise_keyword_arguments", ()))
+
+    # Check if the user wants to check keyword-only arguments of libraries ...
+    if "library-keyword-arguments" in checks:
+        # Store an empty summary if none of the libraries are named in the
+        # Python script ...
+        if callsKey not in entry and not find_triggers(
+            fname if src is None else src,
+            tuple(libraries),
+        ):
+            entry[callsKey] = []
+        if callsKey not in entry:
+            stale.append("library-keyword-arguments")
+            plugins.append(("summarise_library_calls", (tuple(libraries),)))
+
+    # Check if the user wants to check the README ...
+    if "readme-links" in checks:
+        if "imports" not in entry:
+            stale.append("readme-links")
+            plugins.append(("summarise_imports", ()))
+
+    # Return answers ...
+    return stale, plugins
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def profile_source(
+    src,
+    rFiles,
+    ruleIds,
+    /,
+):
+    """Check a Python script against some compiled rules and profile it
+
+    This function is the same as "check_source()" but it also returns the
+    times and the counts from profiling it. It only exists so that it can be
+    passed to "run_jobs()" (which only passes positional arguments). It is
+    safe to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+    rFiles : tuple of str
+        the JSON files of rules
+    ruleIds : tuple of str
+        the IDs of the rules to check
+
+    Returns
+    -------
+    diagnostics : dict
+        the diagnostics, keyed by rule ID
+    stats : dict
+        the times (in seconds) and the counts
+    """
+
+    # Import sub-functions ...
+    from .check_source import check_source
+
+    # Return answers ...
+    return check_source(
+        src,
+        rFiles,
+        ruleIds,
+        profile = True,
+    )
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def qualified_name(
+    func,
+    aliases,
+    /,
+):
+    """Find the fully-qualified dotted name of the function in a function call
+
+    This function walks down the chain of "ast.Attribute" nodes of the function
+    in a function call until it reaches an "ast.Name" node and then returns the
+    dotted name, with the first part of the name resolved through the import
+    aliases of the module. If the chain passes through another function call
+    or a subscript (for example, "a.b().c" or "a.b[0].c") then the dotted name
+    of the innermost chain is returned (for example, "a.b" in both cases), which
+    is the same as the text before the first "(" or "[" in the source code.
+
+    Parameters
+    ----------
+    func : ast.expr
+        the function of the function call
+    aliases : dict
+        the fully-qualified dotted names, keyed by local name (see
+        "import_aliases()")
+
+    Returns
+    -------
+    name : str or None
+        the fully-qualified dotted name (or None if the chain does not end in
+        an "ast.Name" node)
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize list ...
+    parts = []
+
+    # Walk down the chain ...
+    while True:
+        if isinstance(func, ast.Attribute):
+            parts.append(func.attr)
+            func = func.value
+        elif isinstance(func, ast.Call):
+            parts = []
+            func = func.func
+        elif isinstance(func, ast.Subscript):
+            parts = []
+            func = func.value
+        elif isinstance(func, ast.Name):
+            parts.append(aliases.get(func.id, func.id))
+            break
+        else:
+            return None
+
+    # Return answer ...
+    return ".".join(reversed(parts))
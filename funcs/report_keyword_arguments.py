@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def report_keyword_arguments(
+    fnames,
+    summaries,
+    /,
+    *,
+      table = None,
+    targets = None,
+):
+    """Report the keyword-only arguments which are not sorted or not passed
+
+    This function builds a symbol table of all of the function (and method)
+    definitions in some Python scripts and then checks all of the calls to
+    those functions in the Python scripts against it (see
+    "keyword_diagnostics()").
+
+    Parameters
+    ----------
+    fnames : list of str
+        the file names of the Python scripts
+    summaries : list of dict
+        the summaries of the Python scripts (see
+        "summarise_keyword_arguments()")
+    table : dict, optional
+        the symbol table of the Python scripts (if None then it is built, see
+        "symbol_table()")
+    targets : set of str, optional
+        the file names of the Python scripts to report on (if None then all of
+        the Python scripts are reported on, otherwise the database is still
+        built from all of the Python scripts)
+
+    Returns
+    -------
+    lines : list of str
+        the lines of the report
+    """
+
+    # Import sub-functions ...
+    from .keyword_diagnostics import keyword_diagnostics
+
+    # Return answer ...
+    return [
+        diagnostic["message"] for diagnostic in keyword_diagnostics(
+            fnames,
+            summaries,
+              table = table,
+            targets = targets,
+        )
+    ]
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def report_library_calls(
+    fnames,
+    summaries,
+    kwFuncs,
+    /,
+    *,
+    debug,
+    lite,
+    unImpKwArgs,
+):
+    """Report the keyword-only arguments which are not passed to some libraries
+
+    This function checks the summaries of the calls to some libraries in some
+    Python scripts against a database of the keyword-only arguments of the
+    functions in the libraries.
+
+    Parameters
+    ----------
+    fnames : list of str
+        the file names of the Python scripts
+    summaries : list of list of dict
+        the summaries of the calls to the libraries in each Python script
+    kwFuncs : dict
+        the database of the keyword-only arguments of the functions in the
+        libraries
+    debug : bool
+        print debug messages
+    lite : bool
+        don't check for "un-important" keyword-only arguments
+    unImpKwArgs : list of str
+        the "un-important" keyword-only arguments to not check for if "lite"
+
+    Returns
+    -------
+    lines : list of str
+        the lines of the report
+    log : list of str
+        the lines of the log
+    """
+
+    # Initialize lists ...
+    lines = []
+    log = []
+
+    # Loop over Python scripts ...
+    for fname, calls in zip(fnames, summaries, strict = True):
+        lines.append(f"Checking \"{fname}\" ...")
+
+        # Loop over library function calls ...
+        for call in calls:
+            # Create short-hands ...
+            key = call["key"]
+            srcGuess = f"{fname}:{call['line']:d} » {key}()"
+            lines.append(f"  Found \"{key}()\" on line {call['line']:d}.")
+
+            # Skip if this library function doesn't have keywords ...
+            if key not in kwFuncs:
+                lines.append(f"    \"{key}\" doesn't have any keywords.")
+                continue
+
+            # Catch unexpected types ...
+            if call["keywords"] is None:
+                lines.append(f"WARNING: Unable to ascertain the keywords specified as \"node.func.value\" is a \"{call['type']}\".")
+                if debug:
+                    lines.append(call["dump"])
+                continue
+
+            # Make a dictionary of flags ...
+            flags = {}
+            for keyword in kwFuncs[key]:
+                flags[keyword] = False
+
+            # Handle library attributes, library calls and library names ...
+            for keyword in call["keywords"]:
+                if keyword in kwFuncs[key]:
+                    flags[keyword] = True
+                    continue
+                raise Exception(f"{srcGuess} » \"{keyword}\" is specified but it is not a recognised keyword")
+            for keyword, flag in flags.items():
+                if flag:
+                    if lite and keyword in unImpKwArgs:
+                        log.append(f"ERROR: {srcGuess} » \"{keyword}\" is specified but it shouldn't be")
+                    continue
+                if not lite or keyword not in unImpKwArgs:
+                    lines.append(f"    \"{keyword}\" isn't specified.")
+                    log.append(f"LOG: {srcGuess} » \"{keyword}\" isn't specified")
+
+    # Return answers ...
+    return lines, log
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def report_readme_links(
+    rname,
+    modules,
+    /,
+):
+    """Report the modules which are not linked to from a README
+
+    Parameters
+    ----------
+    rname : str
+        the file name of the README
+    modules : list of str
+        the names of the imported non-standard modules
+
+    Returns
+    -------
+    lines : list of str
+        the lines of the report
+    """
+
+    # Load README ...
+    with open(rname, "rt", encoding = "utf-8") as fObj:
+        readme = fObj.readlines()
+
+    # Initialize list ...
+    lines = []
+
+    # Loop over imported non-standard modules ...
+    for module in sorted(modules):
+        if module in [
+            "meson",
+            "ninja",
+        ]:
+            continue
+        linked = False
+        for line in readme:
+            if line.strip().startswith(f"* [{module}]("):
+                linked = True
+                break
+        if linked:
+            continue
+        lines.append(f"  ... needs a link adding for \"{module}\"")
+
+    # Return answer ...
+    return lines
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def report_rules(
+    fname,
+    results,
+    rules,
+    /,
+):
+    """Report the diagnostics of some rules in a Python script
+
+    Parameters
+    ----------
+    fname : str
+        the file name of the Python script
+    results : dict
+        the cached diagnostics of the Python script, keyed by rule ID
+    rules : list of dict
+        the compiled rules
+
+    Returns
+    -------
+    lines : list of str
+        the lines of the report
+
+    Notes
+    -----
+    The diagnostics are reported in rule order and then sorted by position in
+    the Python script.
+    """
+
+    # Import sub-functions ...
+    from .rule_diagnostics import rule_diagnostics
+
+    # Return answer ...
+    return [diagnostic["message"] for diagnostic in rule_diagnostics(fname, results, rules)]
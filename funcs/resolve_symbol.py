@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def resolve_symbol(
+    table,
+    iFile,
+    callee,
+    /,
+):
+    """Resolve a function call using a project-wide symbol table
+
+    This function resolves the dotted name that a function is called by in a
+    Python script to the fully-qualified dotted name of the function (or
+    method) that it refers to, by looking up the names which are defined in
+    and imported into the Python script and then following any names which are
+    imported into (or re-exported by) other modules. A class which is called
+    resolves to its "__init__()" method. The answers are memoised in the symbol
+    table.
+
+    Parameters
+    ----------
+    table : dict
+        the symbol table (see "symbol_table()")
+    iFile : int
+        the index of the Python script which makes the function call
+    callee : str
+        the dotted name that the function is called by
+
+    Returns
+    -------
+    key : tuple of str or None
+        the root and the fully-qualified dotted name of the function (or None
+        if it is not defined in any of the Python scripts)
+    """
+
+    # Create short-hand ...
+    file = table["files"][iFile]
+
+    # Make the dotted name absolute using the names which are imported into (or
+    # defined in) the Python script (and return if it is not either, such as
+    # for built-in functions) ...
+    head, _, rest = callee.partition(".")
+    if head in file["aliases"]:
+        dotted = file["aliases"][head] + (f".{rest}" if rest else "")
+    elif head in file["locals"]:
+        dotted = f"{file['module']}.{callee}"
+    else:
+        return None
+    root = file["root"]
+
+    # Return the memoised answer (if there is one) ...
+    start = (root, dotted)
+    if start in table["memo"]:
+        return table["memo"][start]
+
+    # Follow the imports (up to a limit, in case they are circular) ...
+    key = None
+    for _ in range(16):
+        # Stop if the function (or the "__init__()" of the class) is found ...
+        for name in [dotted, f"{dotted}.__init__"]:
+            if (root, name) in table["defs"]:
+                key = (root, name)
+                break
+        if key is not None:
+            break
+
+        # Find the longest prefix of the dotted name which is a module (in the
+        # same root, or else in exactly one other root) and stop if there isn't
+        # one ...
+        parts = dotted.split(".")
+        found = None
+        for n in range(len(parts) - 1, 0, -1):
+            module = ".".join(parts[:n])
+            if (root, module) in table["modules"]:
+                found = (root, module, n)
+                break
+            if len(table["roots"].get(module, [])) == 1:
+                found = (table["roots"][module][0], module, n)
+                break
+        if found is None:
+            break
+
+        # Look in the other root (if the module is in one) ...
+        if found[0] != root:
+            root = found[0]
+            continue
+
+        # Follow the name if it is imported into the module (and stop if it is
+        # not) ...
+        _, module, n = found
+        aliases = table["files"][table["modules"][(root, module)]]["aliases"]
+        if parts[n] not in aliases:
+            break
+        dotted = ".".join([aliases[parts[n]]] + parts[n + 1:])
+
+    # Memoise and return answer ...
+    table["memo"][start] = key
+    return key
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def rule_diagnostics(
+    fname,
+    results,
+    rules,
+    /,
+):
+    """Find the diagnostics of some rules in a Python script
+
+    Parameters
+    ----------
+    fname : str
+        the file name of the Python script
+    results : dict
+        the cached diagnostics of the Python script, keyed by rule ID
+    rules : list of dict
+        the compiled rules
+
+    Returns
+    -------
+    diagnostics : list of dict
+        the diagnostics (see "write_report()")
+
+    Notes
+    -----
+    The diagnostics are found in rule order and then sorted by position in the
+    Python script.
+    """
+
+    # Make a list of the diagnostics, in rule order, and then sort it by
+    # position in the Python script ...
+    diagnostics = []
+    for rule in rules:
+        for diagnostic in results[rule["id"]]["diagnostics"]:
+            diagnostics.append(
+                {
+                        "col" : diagnostic["col"],
+                       "file" : fname,
+                       "line" : diagnostic["line"],
+                    "message" : diagnostic["message"].format(fname = fname),
+                       "rule" : rule["id"],
+                }
+            )
+    diagnostics.sort(key = lambda diagnostic: (diagnostic["line"], diagnostic["col"]))
+
+    # Return answer ...
+    return diagnostics
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def run_fleet(
+    dnames,
+    cmds,
+    /,
+    *,
+       jobs = 8,
+    retries = 2,
+    timeout = 300.0,
+):
+    """Run some Git commands in lots of Git repositories at the same time
+
+    This function runs the same Git commands (in order) in lots of Git
+    repositories, running them in up to "jobs" Git repositories at the same
+    time with asynchronous subprocesses, so that the network round-trips of
+    one Git repository overlap with those of the others. Each Git command is
+    killed if it takes longer than "timeout" and the Git commands which talk
+    to a remote are retried (with an exponential back-off) if they fail. Git
+    is not allowed to prompt for anything. If any of the Git commands talk to
+    a remote then the references of each Git repository are listed before and
+    after, so that the changes can be reported.
+
+    Parameters
+    ----------
+    dnames : list of str
+        the Git repositories
+    cmds : list of tuple
+        the Git commands, as (args, remote), where "args" is the list of
+        arguments to pass to Git and "remote" is whether the Git command talks
+        to a remote (and so may be retried if it fails)
+    jobs : int, optional
+        the number of Git repositories to run the Git commands in at the same
+        time
+    retries : int, optional
+        the number of times to retry a Git command which talks to a remote if
+        it fails (or times out)
+    timeout : float, optional
+        the timeout for each Git command in each Git repository
+
+    Returns
+    -------
+    results : list of dict
+        the results, in the same order as the Git repositories, each having the
+        Git repository (as "dname"), whether all of the Git commands succeeded
+        (as "ok"), how many times Git was run (as "attempts"), the output of
+        the Git commands (as "output"), the reason that it failed (as "error")
+        and the changes to the references (as "changes")
+    """
+
+    # Import standard modules ...
+    import asyncio
+    import os
+    import shutil
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Create an environment which stops Git from prompting for a username or a
+    # password, as there is no terminal to answer it with when lots of Git
+    # repositories are being run at the same time ...
+    env = os.environ.copy()
+    env["GIT_TERMINAL_PROMPT"] = "0"
+
+    # Check if the references need listing ...
+    track = any(remote for _, remote in cmds)
+
+    # **************************************************************************
+
+    # Define a function to run Git in a Git repository ...
+    async def git(dname, args, /):
+        """Run Git in a Git repository"""
+
+        # Start Git ...
+        proc = await asyncio.create_subprocess_exec(
+            gitPath,
+            "-C", dname,
+            *args,
+               env = env,
+            stderr = asyncio.subprocess.STDOUT,
+             stdin = asyncio.subprocess.DEVNULL,
+            stdout = asyncio.subprocess.PIPE,
+        )
+
+        # Wait for Git to finish (and kill it if it takes too long) ...
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            # NOTE: Git may have finished in the meantime.
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            return None, f"timed out after {timeout:,.1f} s\n"
+
+        # Return answers ...
+        return proc.returncode, stdout.decode("utf-8", errors = "replace")
+
+    # Define a function to list the references in a Git repository (or return
+    # None if they cannot be listed) ...
+    async def list_refs(dname, /):
+        """List the references in a Git repository"""
+
+        # List the references ...
+        code, out = await git(dname, ["for-each-ref", "--format=%(objectname) %(refname)"])
+        if code != 0:
+            return None
+
+        # Initialize dictionary ...
+        refs = {}
+
+        # Loop over references ...
+        for line in out.splitlines():
+            sha, ref = line.split(" ", 1)
+            refs[ref] = sha
+
+        # Return answer ...
+        return refs
+
+    # Define a function to run the Git commands in a Git repository ...
+    async def run(dname, semaphore, /):
+        """Run the Git commands in a Git repository"""
+
+        # Initialize result ...
+        result = {
+            "attempts" : 0,
+             "changes" : [],
+               "dname" : dname,
+               "error" : None,
+                  "ok" : True,
+              "output" : "",
+        }
+
+        # Wait until there is a free slot ...
+        async with semaphore:
+            # List the references before ...
+            before = None
+            if track:
+                before = await list_refs(dname)
+
+            # Loop over Git commands ...
+            for args, remote in cmds:
+                # Initialize answers ...
+                code, out = None, ""
+
+                # Loop over attempts ...
+                for attempt in range(1 + (retries if remote else 0)):
+                    # Back-off before retrying ...
+                    if attempt > 0:
+                        await asyncio.sleep(2.0 ** (attempt - 1))
+
+                    # Run Git and stop retrying if it worked ...
+                    result["attempts"] += 1
+                    code, out = await git(dname, args)
+                    if code == 0:
+                        break
+                else:
+                    # Stop running the Git commands in this Git repository
+                    # (reporting the first error message from Git, or else the
+                    # last line of output) ...
+                    lines = [line for line in out.splitlines() if line.startswith(("error:", "fatal:"))] or out.strip().splitlines()[-1:] or [f"exit code {code}"]
+                    result["error"] = f"\"git {' '.join(args)}\" failed: {lines[0]}"
+                    result["ok"] = False
+                result["output"] += out
+                if not result["ok"]:
+                    break
+
+            # List the references after and find the changes ...
+            after = None
+            if track:
+                after = await list_refs(dname)
+            if before is not None and after is not None:
+                for ref in sorted(before.keys() | after.keys()):
+                    if ref not in after:
+                        result["changes"].append(f"{ref} (deleted)")
+                    elif ref not in before:
+                        result["changes"].append(f"{ref} (new at {after[ref][:7]})")
+                    elif before[ref] != after[ref]:
+                        result["changes"].append(f"{ref} ({before[ref][:7]}..{after[ref][:7]})")
+
+        # Return answer ...
+        return result
+
+    # Define a function to run the Git commands in all of the Git
+    # repositories ...
+    async def run_all():
+        """Run the Git commands in all of the Git repositories"""
+
+        # Limit how many Git repositories are run at the same time ...
+        semaphore = asyncio.Semaphore(max(1, jobs))
+
+        # Return answer ...
+        return await asyncio.gather(*[run(dname, semaphore) for dname in dnames])
+
+    # **************************************************************************
+
+    # Return answer ...
+    return list(asyncio.run(run_all()))
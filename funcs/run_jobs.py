@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def run_jobs(
+    func,
+    tasks,
+    /,
+    *,
+    jobs = 1,
+):
+    """Run a function over a list of tasks
+
+    This function calls a function once for each task (with the task as its
+    positional arguments) and returns the answers in the same order as the
+    tasks, so that the output does not depend on how many jobs are used (see
+    "iter_jobs()").
+
+    Parameters
+    ----------
+    func : function
+        the function (which must be importable by the worker processes)
+    tasks : list of tuple
+        the tasks
+    jobs : int, optional
+        the number of worker processes
+
+    Returns
+    -------
+    ans : list
+        the answers
+    """
+
+    # Import sub-functions ...
+    from .iter_jobs import iter_jobs
+
+    # Return answer ...
+    return list(
+        iter_jobs(
+            func,
+            tasks,
+            jobs = jobs,
+        )
+    )
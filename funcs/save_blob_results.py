@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_blob_results(
+    db,
+    sha,
+    results,
+    /,
+):
+    """Save the results of some rules for a Git blob ID
+
+    The results are not committed, so that many of them can be saved in a
+    single transaction.
+
+    Parameters
+    ----------
+    db : sqlite3.Connection
+        the connection to the store (see "open_blob_store()")
+    sha : str
+        the Git blob ID
+    results : dict
+        the diagnostics and fingerprints of the rules, keyed by rule ID
+    """
+
+    # Import standard modules ...
+    import json
+
+    # Save the results ...
+    db.executemany(
+        "INSERT OR REPLACE INTO results (sha, rule, fingerprint, diagnostics) VALUES (?, ?, ?, ?)",
+        [
+            (sha, ruleId, result["fingerprint"], json.dumps(result["diagnostics"], ensure_ascii = False))
+            for ruleId, result in results.items()
+        ],
+    )
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_cache(
+    fname,
+    version,
+    cache,
+    /,
+):
+    """Save a cache
+
+    This function saves a cache to a JSON file. The JSON file is replaced
+    atomically, so that a script which is interrupted part-way through saving
+    does not leave a corrupt cache behind.
+
+    Parameters
+    ----------
+    fname : str
+        the JSON file name
+    version : str
+        the version of the script which is using the cache
+    cache : dict
+        the cache
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Make output folder if it is missing ...
+    if os.path.dirname(fname) and not os.path.exists(os.path.dirname(fname)):
+        os.makedirs(os.path.dirname(fname))
+
+    # Save the JSON file under a temporary name and then move it into place ...
+    with open(f"{fname}.tmp{os.getpid():d}", "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            {
+                  "cache" : cache,
+                "version" : version,
+            },
+            fObj,
+            ensure_ascii = False,
+               sort_keys = True,
+        )
+    os.replace(f"{fname}.tmp{os.getpid():d}", fname)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_shard(
+    fname,
+    checker,
+    version,
+    shard,
+    files,
+    /,
+    *,
+    context,
+):
+    """Save the results of a shard of a checker run
+
+    This function saves the results of a shard of a checker run to a compact
+    JSON file, which "mergeShards.py" combines with the other shards into
+    exactly the output that a single run would print. The JSON file is replaced
+    atomically.
+
+    Parameters
+    ----------
+    fname : str
+        the JSON file name
+    checker : str
+        the name of the checker
+    version : str
+        the version of the checker
+    shard : tuple of int
+        the index (starting at 1) and the number of shards
+    files : list of tuple
+        the index of each file in the full list of files (so that the merged
+        output is in the same order as a single run), the file name and the
+        results of the file
+    context : dict
+        anything else that the checker needs to report the results
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Make output folder if it is missing ...
+    if os.path.dirname(fname) and not os.path.exists(os.path.dirname(fname)):
+        os.makedirs(os.path.dirname(fname))
+
+    # Save the JSON file under a temporary name and then move it into place ...
+    with open(f"{fname}.tmp{os.getpid():d}", "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            {
+                "checker" : checker,
+                "context" : context,
+                  "files" : files,
+                  "shard" : shard,
+                "version" : version,
+            },
+            fObj,
+            ensure_ascii = False,
+              separators = (",", ":"),
+               sort_keys = True,
+        )
+    os.replace(f"{fname}.tmp{os.getpid():d}", fname)
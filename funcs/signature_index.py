@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def signature_index(
+    library,
+    /,
+    *,
+    cacheDir = "~/.cache/misc",
+       debug = __debug__,
+        jobs = 1,
+     noCache = False,
+):
+    """Find the keyword-only arguments of all of the functions in a library
+
+    This function returns a database of the keyword-only arguments of all of
+    the functions in an installed library, keyed by the dotted name that they
+    are called by. The database is cached, keyed by the installed version of
+    the library and by the hashes of its files, so that it only has to be
+    rebuilt from the files which have changed since the last time.
+
+    Parameters
+    ----------
+    library : str
+        the name of the library
+    cacheDir : str, optional
+        the folder to store the cache of signatures in
+    debug : bool, optional
+        print debug messages
+    jobs : int, optional
+        the number of worker processes to parse Python scripts with
+    noCache : bool, optional
+        don't load or save the cache of signatures
+
+    Returns
+    -------
+    kwFuncs : dict
+        the keyword-only arguments of the functions, keyed by the dotted name
+        that they are called by
+    """
+
+    # Import standard modules ...
+    import importlib
+    import importlib.metadata
+    import os
+
+    # Import sub-functions ...
+    from .check_cache import check_cache
+    from .load_cache import load_cache
+    from .run_jobs import run_jobs
+    from .save_cache import save_cache
+    from .summarise_definitions import summarise_definitions
+
+    # Import the library and find out where it is ...
+    try:
+        module = importlib.import_module(library)
+    except ModuleNotFoundError:
+        raise Exception(f"\"{library}\" is not installed") from None
+    path = module.__path__[0]
+
+    # Find out which version of the library is installed ...
+    version = getattr(module, "__version__", "unknown")
+    for dist in importlib.metadata.packages_distributions().get(library, []):
+        version = importlib.metadata.version(dist)
+        break
+
+    # Load cache ...
+    # NOTE: The version of the cache includes the installed version of the
+    #       library, so that the cache is rebuilt from scratch whenever the
+    #       library is upgraded.
+    cache = {}
+    if not noCache:
+        cache = load_cache(
+            f"{os.path.expanduser(cacheDir)}/signatures/{library}.json",
+            f"1/{version}",
+            debug = debug,
+        )
+
+    # Initialize lists ...
+    fnames = []
+    entries = []
+    tasks = []
+    taskEntries = []
+
+    # Loop over Python scripts in the library ...
+    for root, dnames, fnamesInRoot in os.walk(path):
+        dnames.sort()
+        for fname in sorted(fnamesInRoot):
+            # Skip files which are not Python scripts ...
+            if not fname.endswith(".py"):
+                continue
+
+            # Find the cache entry of the Python script and skip it if the
+            # function definitions in it are already summarised ...
+            entry, src = check_cache(
+                cache,
+                f"{root}/{fname}",
+                sha = None,
+            )
+            fnames.append(f"{root}/{fname}")
+            entries.append(entry)
+            if "defs" in entry:
+                continue
+
+            # Load the Python script (if it has not been loaded already) ...
+            if src is None:
+                with open(f"{root}/{fname}", "rb") as fObj:
+                    src = fObj.read()
+
+            # Append task ...
+            tasks.append((src,))
+            taskEntries.append(entry)
+
+    # Summarise the function definitions in the Python scripts (in parallel, if
+    # requested) ...
+    if debug and tasks:
+        print(f"DEBUG: Summarising {len(tasks):,d} Python scripts in \"{path}\" ...")
+    for entry, defs in zip(
+        taskEntries,
+        run_jobs(
+            summarise_definitions,
+            tasks,
+            jobs = jobs,
+        ),
+        strict = True,
+    ):
+        entry["defs"] = defs
+
+    # Initialize database ...
+    kwFuncs : dict[str, list[str]] = {}
+
+    # Loop over Python scripts ...
+    for fname, entry in zip(fnames, entries, strict = True):
+        # Loop over function definitions ...
+        for body in entry["defs"]:
+            # Skip if there aren't any keyword-only arguments ...
+            if not body["kwonlyargs"]:
+                continue
+
+            # Determine key ...
+            # NOTE: The library defines one function per Python script and
+            #       imports it into the package which contains it, therefore,
+            #       the key does not include the name of the Python script.
+            key = f'{library}{os.path.dirname(fname).removeprefix(path).replace("/", ".")}.{body["name"]}'
+
+            # Add this function to the database ...
+            if key not in kwFuncs:
+                kwFuncs[key] = []
+            kwFuncs[key] += body["kwonlyargs"]
+
+    # Save cache (forgetting about any Python scripts which no longer exist) ...
+    if not noCache:
+        keep = set(os.path.abspath(fname) for fname in fnames)
+        for key in list(cache.keys()):
+            if key not in keep:
+                del cache[key]
+        save_cache(
+            f"{os.path.expanduser(cacheDir)}/signatures/{library}.json",
+            f"1/{version}",
+            cache,
+        )
+
+    # Return answer ...
+    return kwFuncs
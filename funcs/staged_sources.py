@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def staged_sources(
+    dname,
+    fnames,
+    /,
+    *,
+    timeout = 60.0,
+):
+    """Read the staged contents of some files in a Git repository
+
+    This function returns the contents of some files in a folder in a Git
+    repository as they are in the index (which is what will be committed),
+    rather than as they are in the folder, finding their Git blob IDs with a
+    single call to "git ls-files -s" and then reading them from the object
+    store (see "cat_blobs()"), so that a file which is only partly staged is
+    checked as it will be committed.
+
+    Parameters
+    ----------
+    dname : str
+        the folder
+    fnames : list of str
+        the file names (for example, from "changed_files()")
+    timeout : float, optional
+        the timeout for the call to "git ls-files"
+
+    Returns
+    -------
+    srcs : dict
+        the staged contents of the files, keyed by file name (files which are
+        not in the index, or which are not merged, are not returned)
+    """
+
+    # Import standard modules ...
+    import os
+    import shutil
+    import subprocess
+
+    # Import sub-functions ...
+    from .cat_blobs import cat_blobs
+
+    # Find Git ...
+    gitPath = shutil.which("git")
+    if gitPath is None:
+        raise Exception("\"git\" is not installed") from None
+
+    # Check if there aren't any files ...
+    if not fnames:
+        # Return answer ...
+        return {}
+
+    # List the files in the index (treating the file names as literal paths,
+    # rather than as patterns) ...
+    resp = subprocess.run(
+        [
+            gitPath,
+            "--literal-pathspecs",
+            "-C", dname,
+            "ls-files",
+            "-z",
+            "-s",
+            "--",
+        ] + [os.path.relpath(fname, dname) for fname in fnames],
+           check = True,
+        encoding = "utf-8",
+          stderr = subprocess.DEVNULL,
+          stdout = subprocess.PIPE,
+         timeout = timeout,
+    )
+
+    # Loop over the entries in the index (each one is "<mode> <object>
+    # <stage>\t<path>") and skip the ones which are not merged ...
+    shas = {}
+    for line in resp.stdout.split("\0"):
+        if not line:
+            continue
+        info, path = line.split("\t", 1)
+        _, sha, stage = info.split()
+        if stage != "0":
+            continue
+        shas[os.path.join(dname, path)] = sha
+
+    # Read the files from the object store ...
+    srcs = {}
+    for fname, (_, src) in zip(
+        shas.keys(),
+        cat_blobs(dname, list(shas.values())),
+        strict = True,
+    ):
+        if src is not None:
+            srcs[fname] = src
+
+    # Return answer ...
+    return srcs
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def store_checks(
+    entry,
+    stale,
+    results,
+    rules,
+    /,
+    *,
+    libraries,
+):
+    """Store the results of some checks of a Python script
+
+    This function stores the results of the plugins which were planned by
+    "plan_checks()" in the cache entry of a Python script.
+
+    Parameters
+    ----------
+    entry : dict
+        the cache entry of the Python script
+    stale : list of str
+        the checks which were run
+    results : list
+        the results of the plugins which were run
+    rules : list of dict
+        the compiled rules
+    libraries : list of str
+        the names of the libraries to check the calls of
+    """
+
+    # Create short-hands ...
+    callsKey = f"calls/{','.join(libraries)}"
+    fingerprints = {rule["id"] : rule["fingerprint"] for rule in rules}
+
+    # Loop over checks ...
+    for check, result in zip(stale, results, strict = True):
+        match check:
+            case "everything":
+                for ruleId, diagnostics in result.items():
+                    entry["rules"][ruleId] = {
+                        "diagnostics" : diagnostics,
+                        "fingerprint" : fingerprints[ruleId],
+                    }
+            case "keyword-arguments":
+                entry.update(result)
+            case "library-keyword-arguments":
+                entry[callsKey] = result
+            case "readme-links":
+                entry["imports"] = result
+            case _:
+                raise ValueError(f"\"{check}\" is an unexpected check") from None
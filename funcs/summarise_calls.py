@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_calls(
+    src,
+    /,
+):
+    """Summarise the function calls in a Python script
+
+    This function parses a Python script (if it is not already parsed) and
+    returns a summary of the calls to functions (or to attributes of modules,
+    classes or "self") from within the top-level function definitions and the
+    methods of the top-level class definitions in it. It is safe to call from
+    a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+
+    Returns
+    -------
+    calls : list of dict
+        the summaries of the function calls
+
+    Notes
+    -----
+    Each function is called by the dotted name that it is written as (for
+    example, "foo" or "module.foo"), except that calls to the methods of
+    "self" (or of whatever the first argument of the method is called) are
+    named after the class (for example, "Class.method"). The dotted names are
+    resolved by "symbol_table()".
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize lists ...
+    calls = []
+    bodies = []
+
+    # Loop over bodies and make a list of the function definitions (and the
+    # method definitions, along with their class and their first argument) ...
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+    for body in tree.body:
+        if isinstance(body, ast.FunctionDef):
+            bodies.append((body.name, body, None, None))
+        elif isinstance(body, ast.ClassDef):
+            for method in body.body:
+                if not isinstance(method, ast.FunctionDef):
+                    continue
+                # NOTE: Static methods do not have a "self".
+                first = None
+                if method.args.posonlyargs + method.args.args and not any(isinstance(decorator, ast.Name) and decorator.id == "staticmethod" for decorator in method.decorator_list):
+                    first = (method.args.posonlyargs + method.args.args)[0].arg
+                bodies.append((f"{body.name}.{method.name}", method, body.name, first))
+
+    # Loop over function definitions ...
+    for caller, body, cls, first in bodies:
+        # Loop over nodes in the body ...
+        for node in ast.walk(body):
+            # Skip this node if it is not a function call ...
+            if not isinstance(node, ast.Call):
+                continue
+
+            # Find the dotted name of the function (and skip this function call
+            # if it is not a chain of attributes of a simple name) ...
+            parts = []
+            func = node.func
+            while isinstance(func, ast.Attribute):
+                parts.append(func.attr)
+                func = func.value
+            if not isinstance(func, ast.Name):
+                continue
+            parts.append(func.id)
+            parts.reverse()
+
+            # Name calls to the methods of "self" after the class (and skip
+            # calls to the methods of attributes of "self") ...
+            if cls is not None and parts[0] == first:
+                if len(parts) != 2:
+                    continue
+                parts[0] = cls
+
+            # Append a summary of this function call ...
+            calls.append(
+                {
+                      "callee" : ".".join(parts),
+                      "caller" : caller,
+                         "col" : node.col_offset,
+                    "keywords" : [keyword.arg for keyword in node.keywords if keyword.arg],
+                        "line" : node.lineno,
+                }
+            )
+
+    # Return answer ...
+    return calls
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_definitions(
+    src,
+    /,
+):
+    """Summarise the function definitions in a Python script
+
+    This function parses a Python script (if it is not already parsed) and
+    returns a summary of the top-level function definitions in it. It is safe
+    to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+
+    Returns
+    -------
+    defs : list of dict
+        the summaries of the function definitions
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize list ...
+    defs = []
+
+    # Loop over bodies ...
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+    for body in tree.body:
+        # Skip bodies which are not function definitions ...
+        if not isinstance(body, ast.FunctionDef):
+            continue
+
+        # Append a summary of this function definition ...
+        defs.append(
+            {
+                       "col" : body.col_offset,
+                "kwonlyargs" : [kwonlyarg.arg for kwonlyarg in body.args.kwonlyargs],
+                      "line" : body.lineno,
+                      "name" : body.name,
+                     "nArgs" : len(body.args.args),
+            }
+        )
+
+    # Return answer ...
+    return defs
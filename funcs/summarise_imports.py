@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_imports(
+    src,
+    /,
+):
+    """Summarise the modules imported by a Python script
+
+    This function parses a Python script (if it is not already parsed) and
+    returns the names of the top-level modules which are imported by "import"
+    statements anywhere in it (for example, "import pyguymer3.geo" imports
+    "pyguymer3"). It is safe to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+
+    Returns
+    -------
+    modules : list of str
+        the sorted names of the imported top-level modules
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize set ...
+    modules = set()
+
+    # Loop over nodes ...
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+    for node in ast.walk(tree):
+        # Skip nodes which are not "import" statements ...
+        if not isinstance(node, ast.Import):
+            continue
+
+        # Loop over the imported names and add their top-level modules ...
+        for alias in node.names:
+            modules.add(alias.name.split(".")[0])
+
+    # Return answer ...
+    return sorted(modules)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_keyword_arguments(
+    src,
+    /,
+):
+    """Summarise the function definitions, the method definitions, the imports
+    and the function calls in a Python script
+
+    This function parses a Python script once (if it is not already parsed) and
+    returns a compact summary of the top-level function definitions in it, the
+    methods of the top-level class definitions in it, the names that modules
+    and functions are imported as in it and the calls to functions from within
+    its functions and methods, which is all that is needed to build a
+    project-wide symbol table (see "symbol_table()") and to check keyword-only
+    arguments across files without keeping the parsed Python script. It is
+    safe to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+
+    Returns
+    -------
+    summary : dict
+        the summaries of the function definitions (as "defs"), the method
+        definitions (as "methods"), the imports (as "aliases") and the function
+        calls (as "calls")
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Import sub-functions ...
+    from .import_aliases import import_aliases
+    from .summarise_calls import summarise_calls
+    from .summarise_definitions import summarise_definitions
+    from .summarise_methods import summarise_methods
+
+    # Parse the Python script (if it is not already parsed) ...
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+
+    # Return answer ...
+    return {
+        "aliases" : import_aliases(
+            tree,
+            relative = True,
+        ),
+          "calls" : summarise_calls(tree),
+           "defs" : summarise_definitions(tree),
+        "methods" : summarise_methods(tree),
+    }
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_library_calls(
+    src,
+    libraries,
+    /,
+):
+    """Summarise the calls to some libraries in a Python script
+
+    This function parses a Python script (if it is not already parsed) and
+    returns a summary of the calls to functions in some libraries, including
+    calls made through names which are imported from the libraries (for
+    example, "import pyguymer3.geo as geo" or "from pyguymer3 import now"). It
+    is safe to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+    libraries : tuple of str
+        the names of the libraries
+
+    Returns
+    -------
+    calls : list of dict
+        the summaries of the function calls
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Import sub-functions ...
+    from .import_aliases import import_aliases
+    from .qualified_name import qualified_name
+
+    # Initialize list ...
+    calls = []
+
+    # Parse the Python script and find the names that are imported ...
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+    aliases = import_aliases(
+        tree,
+        relative = False,
+    )
+
+    # Create short-hand ...
+    prefixes = tuple(f"{library}." for library in libraries)
+
+    # Loop over bodies ...
+    for body in tree.body:
+        # Loop over nodes in the body ...
+        for node in ast.walk(body):
+            # Skip this node if it is not a function call ...
+            if not isinstance(node, ast.Call):
+                continue
+
+            # Skip this function call if the function is not an attribute (or
+            # a name which is imported from one of the libraries) ...
+            if isinstance(node.func, ast.Name):
+                if not aliases.get(node.func.id, "").startswith(prefixes):
+                    continue
+            elif not isinstance(node.func, ast.Attribute):
+                continue
+
+            # Find the fully-qualified name of the function, and skip if it
+            # isn't from one of the libraries ...
+            key = qualified_name(node.func, aliases)
+            if key is None or not key.startswith(prefixes):
+                continue
+
+            # Find the keywords which are specified (which are in different
+            # places for library attributes, library calls and library
+            # names) ...
+            if isinstance(node.func, ast.Name) or isinstance(node.func.value, (ast.Attribute, ast.Name)):
+                keywords = [keyword.arg for keyword in node.keywords]
+            elif isinstance(node.func.value, ast.Call):
+                keywords = [keyword.arg for keyword in node.func.value.keywords]
+            else:
+                keywords = None
+
+            # Append a summary of this function call ...
+            calls.append(
+                {
+                         "col" : node.col_offset,
+                        "dump" : ast.dump(node, indent = 4) if keywords is None else None,
+                         "key" : key,
+                    "keywords" : keywords,
+                        "line" : node.lineno,
+                        "type" : str(type(node.func.value)) if keywords is None else None,
+                }
+            )
+
+    # Return answer ...
+    return calls
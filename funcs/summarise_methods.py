@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_methods(
+    src,
+    /,
+):
+    """Summarise the method definitions in a Python script
+
+    This function parses a Python script (if it is not already parsed) and
+    returns a summary of the methods of the top-level class definitions in it,
+    each one named after its class (for example, "Class.method"). It is safe
+    to call from a worker process.
+
+    Parameters
+    ----------
+    src : bytes or ast.Module
+        the contents of the Python script (or the already parsed Python script)
+
+    Returns
+    -------
+    methods : list of dict
+        the summaries of the method definitions
+    """
+
+    # Import standard modules ...
+    import ast
+
+    # Initialize list ...
+    methods = []
+
+    # Loop over bodies ...
+    tree = src if isinstance(src, ast.Module) else ast.parse(src)
+    for body in tree.body:
+        # Skip bodies which are not class definitions ...
+        if not isinstance(body, ast.ClassDef):
+            continue
+
+        # Loop over the bodies of the class definition ...
+        for method in body.body:
+            # Skip bodies which are not method definitions ...
+            if not isinstance(method, ast.FunctionDef):
+                continue
+
+            # Append a summary of this method definition ...
+            methods.append(
+                {
+                           "col" : method.col_offset,
+                    "kwonlyargs" : [kwonlyarg.arg for kwonlyarg in method.args.kwonlyargs],
+                          "line" : method.lineno,
+                          "name" : f"{body.name}.{method.name}",
+                }
+            )
+
+    # Return answer ...
+    return methods
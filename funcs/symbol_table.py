@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def symbol_table(
+    fnames,
+    summaries,
+    /,
+):
+    """Build a project-wide symbol table of some Python scripts
+
+    This function works out the module name of each Python script (from the
+    "__init__.py" files of the packages that it is in, where the folder above
+    the top-level package is its root) and then builds hash maps of the modules,
+    of the functions and methods (keyed by their fully-qualified dotted names)
+    and of the names that modules and functions are imported as (with relative
+    imports made absolute), so that each function call can be resolved with a
+    few dictionary look-ups (see "resolve_symbol()").
+
+    Parameters
+    ----------
+    fnames : list of str
+        the file names of the Python scripts
+    summaries : list of dict
+        the summaries of the Python scripts (see
+        "summarise_keyword_arguments()")
+
+    Returns
+    -------
+    table : dict
+        the symbol table
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Initialize symbol table ...
+    table = {
+        "defs" : {},
+        "files" : [],
+        "memo" : {},
+        "modules" : {},
+        "roots" : {},
+    }
+
+    # Create short-hand ...
+    known = set(fnames)
+
+    # Loop over Python scripts ...
+    for iFile, (fname, summary) in enumerate(zip(fnames, summaries, strict = True)):
+        # Work out the module name of the Python script by walking up the
+        # packages that it is in ...
+        root = os.path.dirname(fname)
+        isPackage = os.path.basename(fname) == "__init__.py"
+        parts = [] if isPackage else [os.path.basename(fname).removesuffix(".py")]
+        while os.path.join(root, "__init__.py") in known and root != os.path.dirname(root):
+            parts.insert(0, os.path.basename(root))
+            root = os.path.dirname(root)
+        module = ".".join(parts)
+
+        # Make the relative imports absolute (skipping the ones which go above
+        # the top-level package) ...
+        package = parts if isPackage else parts[:-1]
+        aliases = {}
+        for name, target in summary["aliases"].items():
+            level = len(target) - len(target.lstrip("."))
+            if level == 0:
+                aliases[name] = target
+                continue
+            if level - 1 > len(package):
+                continue
+            aliases[name] = ".".join(package[:len(package) - (level - 1)] + [target.lstrip(".")])
+
+        # Add the module, its functions and its methods to the symbol table ...
+        table["files"].append(
+            {
+                "aliases" : aliases,
+                 "locals" : {body["name"].split(".")[0] for body in summary["defs"] + summary["methods"]},
+                 "module" : module,
+                   "root" : root,
+            }
+        )
+        table["modules"][(root, module)] = iFile
+        if module not in table["roots"]:
+            table["roots"][module] = []
+        table["roots"][module].append(root)
+        for body in summary["defs"] + summary["methods"]:
+            table["defs"][(root, f"{module}.{body['name']}")] = body
+
+    # Return answer ...
+    return table
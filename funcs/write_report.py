@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def write_report(
+    diagnostics,
+    fObj,
+    /,
+    *,
+    fmt,
+    tool,
+):
+    """Write some diagnostics as JSON Lines or as SARIF
+
+    This function writes each diagnostic (and flushes it) as soon as it is
+    produced, so that another program can start reading the diagnostics before
+    the checker has finished and so that the diagnostics are never all in
+    memory at the same time. In SARIF, the description of the checker (and the
+    IDs of the rules which were found) are written after the results, which is
+    allowed as the order of the members of a JSON object does not matter.
+
+    Parameters
+    ----------
+    diagnostics : iterable of dict
+        the diagnostics, each of which has a "file", a "line", a "col" (counted
+        from 0, as in the "ast" module), a "rule" and a "message"
+    fObj : file
+        the file to write to
+    fmt : str
+        the format to write ("jsonl" or "sarif")
+    tool : str
+        the name of the checker
+
+    Returns
+    -------
+    n : int
+        the number of diagnostics which were written
+
+    Notes
+    -----
+    Columns are written counted from 1, as in most other linters (and as
+    required by SARIF).
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+    import pathlib
+
+    # Initialize counter and set ...
+    n = 0
+    ruleIds = set()
+
+    # Write the start of the SARIF log ...
+    if fmt == "sarif":
+        fObj.write("{\"$schema\":\"https://json.schemastore.org/sarif-2.1.0.json\",\"runs\":[{\"results\":[")
+        fObj.flush()
+
+    # Loop over diagnostics ...
+    for diagnostic in diagnostics:
+        # Write the diagnostic ...
+        match fmt:
+            case "jsonl":
+                fObj.write(
+                    json.dumps(
+                        {
+                             "column" : diagnostic["col"] + 1,
+                               "file" : diagnostic["file"],
+                               "line" : diagnostic["line"],
+                            "message" : diagnostic["message"],
+                               "rule" : diagnostic["rule"],
+                        },
+                        ensure_ascii = False,
+                    ) + "\n"
+                )
+            case "sarif":
+                fObj.write(
+                    ("," if n else "") + json.dumps(
+                        {
+                                "level" : "warning",
+                            "locations" : [
+                                {
+                                    "physicalLocation" : {
+                                        "artifactLocation" : {
+                                            "uri" : pathlib.Path(diagnostic["file"]).as_uri() if os.path.isabs(diagnostic["file"]) else diagnostic["file"],
+                                        },
+                                        "region" : {
+                                            "startColumn" : diagnostic["col"] + 1,
+                                              "startLine" : diagnostic["line"],
+                                        },
+                                    },
+                                },
+                            ],
+                              "message" : {
+                                "text" : diagnostic["message"],
+                            },
+                               "ruleId" : diagnostic["rule"],
+                        },
+                        ensure_ascii = False,
+                    )
+                )
+            case _:
+                raise Exception(f"\"{fmt}\" is not a supported format") from None
+        fObj.flush()
+
+        # Increment counter and add the rule ...
+        n += 1
+        ruleIds.add(diagnostic["rule"])
+
+    # Write the end of the SARIF log ...
+    if fmt == "sarif":
+        fObj.write(
+            "],\"tool\":" + json.dumps(
+                {
+                    "driver" : {
+                         "name" : tool,
+                        "rules" : [{"id" : ruleId} for ruleId in sorted(ruleIds)],
+                    },
+                },
+                ensure_ascii = False,
+            ) + "}],\"version\":\"2.1.0\"}\n"
+        )
+        fObj.flush()
+
+    # Return answer ...
+    return n
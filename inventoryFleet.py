@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import concurrent.futures
+    import json
+    import os
+    import sys
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Find the branches (and how far ahead of and behind their upstreams they are), the tags, the remotes, the dirty state and the state of the submodules of every Git repository in a folder (which is what \"branch.sh\", \"remote.sh\", \"status.sh\" and \"tag.sh\" print) and save them as a single JSON document.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of Git repositories in",
+           type = str,
+    )
+    parser.add_argument(
+        "--dname",
+        default = "~/Repositories",
+           help = "the folder of Git repositories",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 8,
+           help = "the number of Git repositories to inventory at the same time",
+           type = int,
+    )
+    parser.add_argument(
+        "--json",
+        default = None,
+           dest = "jName",
+           help = "the JSON file to save the inventory to (if not given then it is printed)",
+           type = str,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of Git repositories",
+    )
+    parser.add_argument(
+        "--timeout",
+        default = 60.0,
+           help = "the timeout for each call to Git (in seconds)",
+           type = float,
+    )
+    args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+    args.dname = os.path.expanduser(args.dname)
+
+    # **************************************************************************
+
+    # Find the Git repositories (in the same way as the BASH scripts) ...
+    dnames = [
+        repository["dname"] for repository in funcs.discover_repositories(
+            args.dname,
+            cacheDir = None if args.noCache else args.cacheDir,
+               debug = False,
+             timeout = args.timeout,
+        )
+    ]
+
+    # Inventory the Git repositories in a pool of threads (as the work is done
+    # by the Git processes) ...
+    inventory = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max(1, args.jobs)) as pool:
+        for dname, repository in zip(
+            dnames,
+            pool.map(
+                lambda dname: funcs.inventory_repository(
+                    dname,
+                    timeout = args.timeout,
+                ),
+                dnames,
+            ),
+            strict = True,
+        ):
+            inventory[os.path.relpath(dname, args.dname)] = repository
+
+    # **************************************************************************
+
+    # Save (or print) the inventory ...
+    # NOTE: The keys are sorted and nothing changes between runs unless the Git
+    #       repositories do, so that two inventories can be compared with
+    #       "diff".
+    if args.jName is not None:
+        with open(args.jName, "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                inventory,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+            fObj.write("\n")
+    else:
+        json.dump(
+            inventory,
+            sys.stdout,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+        sys.stdout.write("\n")
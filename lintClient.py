@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import json
+    import os
+    import socket
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Ask \"lintDaemon.py\" to check a Python script and print the same diagnostics as the batch scripts.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "fname",
+        help = "the Python script to check",
+        type = str,
+    )
+    parser.add_argument(
+        "--checks",
+        choices = [
+            "everything",
+            "keyword-arguments",
+            "library-keyword-arguments",
+        ],
+        default = [
+            "everything",
+            "keyword-arguments",
+            "library-keyword-arguments",
+        ],
+           help = "the checks to run (see \"lintSession.py\")",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--socket",
+        default = "~/.cache/misc/lintDaemon.sock",
+           help = "the Unix socket that the daemon is listening on",
+           type = str,
+    )
+    parser.add_argument(
+        "--timeout",
+        default = 60.0,
+           help = "the timeout for the request",
+           type = float,
+    )
+    args = parser.parse_args()
+    args.socket = os.path.expanduser(args.socket)
+
+    # **************************************************************************
+
+    # Send the request to the daemon and receive the response ...
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sObj:
+        sObj.settimeout(args.timeout)
+        sObj.connect(args.socket)
+        sObj.sendall(
+            json.dumps(
+                {
+                    "checks" : args.checks,
+                     "fname" : os.path.abspath(args.fname),
+                }
+            ).encode("utf-8") + b"\n"
+        )
+        with sObj.makefile("rb") as fObj:
+            response = json.loads(fObj.readline())
+
+    # Check if the daemon could not check the Python script ...
+    if "error" in response:
+        # Cry ...
+        raise Exception(response["error"]) from None
+
+    # Print ...
+    for line in response["lines"]:
+        print(line)
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+
+# Define the version of the cache (which must be changed whenever the structure
+# of the summaries or the diagnostics changes) ...
+CACHE_VERSION = "3"
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import json
+    import os
+    import signal
+    import socketserver
+    import sys
+    import threading
+    import time
+    import typing
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Keep the summaries of the Python scripts in a folder (and the signatures of some libraries) in memory, watch the folder for changes and answer requests to check Python scripts from \"lintClient.py\" over a Unix socket.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "dname",
+        help = "the folder to watch",
+        type = str,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of summaries and diagnostics in",
+           type = str,
+    )
+    parser.add_argument(
+        "--checks",
+        choices = [
+            "everything",
+            "keyword-arguments",
+            "library-keyword-arguments",
+        ],
+        default = [
+            "everything",
+            "keyword-arguments",
+            "library-keyword-arguments",
+        ],
+           help = "the checks to keep summaries for (see \"lintSession.py\")",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--interval",
+        default = 1.0,
+           help = "the number of seconds between each scan of the folder for changes",
+           type = float,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to parse and check Python scripts with when starting up",
+           type = int,
+    )
+    parser.add_argument(
+        "--library",
+        default = [
+            "pyguymer3",
+        ],
+           dest = "libraries",
+           help = "the installed libraries to check the calls of (restart the daemon after upgrading them)",
+          nargs = "+",
+           type = str,
+    )
+    funcs.add_lite_arguments(parser)
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of summaries and diagnostics",
+    )
+    parser.add_argument(
+        "--rules",
+        default = [
+            f"{os.path.dirname(os.path.realpath(__file__))}/checkEverything.json",
+        ],
+           dest = "rFiles",
+           help = "the JSON files of rules to check",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--socket",
+        default = "~/.cache/misc/lintDaemon.sock",
+           help = "the Unix socket to listen on",
+           type = str,
+    )
+    args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+    args.dname = os.path.abspath(args.dname)
+    args.rFiles = tuple(os.path.realpath(rFile) for rFile in args.rFiles)
+    args.socket = os.path.expanduser(args.socket)
+
+    # **************************************************************************
+
+    # Compile the rules ...
+    rules, _ = funcs.compile_rules(args.rFiles)
+
+    # Load cache ...
+    cache = {}
+    if not args.noCache:
+        cache = funcs.load_cache(
+            f"{args.cacheDir}/lintDaemon.json",
+            CACHE_VERSION,
+            debug = args.debug,
+        )
+
+    # Create short-hand for where the summaries of the function calls to the
+    # libraries are stored in the cache entries ...
+    callsKey = f"calls/{','.join(args.libraries)}"
+
+    # Initialize database ...
+    kwFuncs : dict[str, list[str]] = {}
+
+    # Check if the user wants to check keyword-only arguments of libraries ...
+    if "library-keyword-arguments" in args.checks:
+        # Loop over libraries and add the keyword-only arguments of their
+        # functions to the database (which is kept in memory from now on) ...
+        for library in args.libraries:
+            kwFuncs.update(
+                funcs.signature_index(
+                    library,
+                    cacheDir = args.cacheDir,
+                       debug = args.debug,
+                        jobs = args.jobs,
+                     noCache = args.noCache,
+                )
+            )
+
+    # **************************************************************************
+
+    # Initialize lists ...
+    fnames = []
+    entries = []
+    tasks = []
+    taskChecks = []
+    taskEntries = []
+
+    # Loop over files in folder (listing them from the Git index where
+    # possible, which skips Git submodules) ...
+    for fname in funcs.list_files(
+        args.dname,
+          debug = args.debug,
+        timeout = 60.0,
+    ):
+        # Skip files which are not Python scripts ...
+        if not fname.endswith(".py"):
+            continue
+
+        # Find the cache entry of the Python script and plan which checks of it
+        # need running ...
+        entry, src = funcs.check_cache(
+            cache,
+            fname,
+            sha = None,
+        )
+        fnames.append(fname)
+        entries.append(entry)
+        checks, plugins = funcs.plan_checks(
+            fname,
+            src,
+            entry,
+            rules,
+               checks = args.checks,
+            libraries = args.libraries,
+               rFiles = args.rFiles,
+        )
+
+        # Skip this Python script if there aren't any checks which need
+        # running ...
+        if not checks:
+            continue
+
+        # Load the Python script (if it has not been loaded already) ...
+        if src is None:
+            with open(fname, "rb") as fObj:
+                src = fObj.read()
+
+        # Append task ...
+        tasks.append((src, tuple(plugins)))
+        taskChecks.append(checks)
+        taskEntries.append(entry)
+
+    # Parse the Python scripts once each and pass them to the plugins (in
+    # parallel, if requested), storing the results in the cache ...
+    for entry, checks, results in zip(
+        taskEntries,
+        taskChecks,
+        funcs.run_jobs(
+            funcs.lint_source,
+            tasks,
+            jobs = args.jobs,
+        ),
+        strict = True,
+    ):
+        funcs.store_checks(
+            entry,
+            checks,
+            results,
+            rules,
+            libraries = args.libraries,
+        )
+
+    # Create a dictionary of the Python scripts being watched and a lock to
+    # stop the watcher and the request handler from changing it at the same
+    # time ...
+    tree = dict(zip(fnames, entries, strict = True))
+    lock = threading.Lock()
+
+    # Initialize the symbol table of the Python scripts being watched (which is
+    # kept in memory and only rebuilt when the Python scripts being watched, or
+    # their summaries, change) ...
+    symbols : dict[str, typing.Any] = {
+           "fnames" : [],
+        "summaries" : [],
+            "table" : None,
+    }
+
+    # **************************************************************************
+
+    # Define a function to rebuild the symbol table (it must be called with the
+    # lock held) ...
+    def rebuild():
+        """Rebuild the symbol table of the Python scripts being watched"""
+
+        # Check if the symbol table is not needed or is already up-to-date ...
+        if "keyword-arguments" not in args.checks or symbols["table"] is not None:
+            return
+
+        # Rebuild the symbol table ...
+        if args.debug:
+            print(f"DEBUG: Rebuilding the symbol table of {len(tree):,d} Python scripts ...")
+        symbols["fnames"] = list(tree.keys())
+        symbols["summaries"] = list(tree.values())
+        symbols["table"] = funcs.symbol_table(symbols["fnames"], symbols["summaries"])
+
+    # Define a function to bring the cache entry of a Python script up-to-date
+    # (it must be called with the lock held) ...
+    def refresh(script, /):
+        """Bring the cache entry of a Python script up-to-date"""
+
+        # Find the cache entry of the Python script and plan which checks of it
+        # need running ...
+        scriptEntry, scriptSrc = funcs.check_cache(
+            cache,
+            script,
+            sha = None,
+        )
+        scriptChecks, scriptPlugins = funcs.plan_checks(
+            script,
+            scriptSrc,
+            scriptEntry,
+            rules,
+               checks = args.checks,
+            libraries = args.libraries,
+               rFiles = args.rFiles,
+        )
+
+        # Run the checks which need running ...
+        if scriptChecks:
+            if scriptSrc is None:
+                with open(script, "rb") as sObj:
+                    scriptSrc = sObj.read()
+            if args.debug:
+                print(f"DEBUG: Re-checking \"{script}\" ...")
+            if "keyword-arguments" in scriptChecks:
+                symbols["table"] = None
+            funcs.store_checks(
+                scriptEntry,
+                scriptChecks,
+                funcs.lint_source(scriptSrc, tuple(scriptPlugins)),
+                rules,
+                libraries = args.libraries,
+            )
+
+        # Return answer ...
+        return scriptEntry
+
+    # Define a function to watch the folder for changes ...
+    def watch():
+        """Watch the folder for changes"""
+
+        # Start infinite loop ...
+        while True:
+            # Wait ...
+            time.sleep(args.interval)
+
+            # Scan the folder for changes ...
+            # NOTE: Any error (such as "git ls-files" timing out) is reported
+            #       and the folder is scanned again after the next wait, as
+            #       otherwise this thread would stop and the daemon would serve
+            #       out-of-date answers for ever.
+            try:
+                # List the Python scripts in the folder ...
+                pnames = [
+                    fname for fname in funcs.list_files(
+                        args.dname,
+                          debug = False,
+                        timeout = 60.0,
+                    )
+                    if fname.endswith(".py")
+                ]
+
+                # Bring all of the cache entries up-to-date, forget about the
+                # Python scripts which no longer exist and rebuild the symbol
+                # table (if anything has changed) ...
+                with lock:
+                    newTree = {}
+                    for pname in pnames:
+                        try:
+                            newTree[pname] = refresh(pname)
+                        except (OSError, SyntaxError, ValueError) as err:
+                            if args.debug:
+                                print(f"WARNING: \"{pname}\" cannot be checked ({err}).")
+                    if list(newTree.keys()) != list(tree.keys()):
+                        symbols["table"] = None
+                    tree.clear()
+                    tree.update(newTree)
+                    for key in list(cache.keys()):
+                        if key not in tree:
+                            del cache[key]
+                    rebuild()
+            except Exception as err:                                            # pylint: disable=broad-exception-caught
+                print(f"WARNING: \"{args.dname}\" cannot be scanned ({err}).")
+                sys.stdout.flush()
+
+    # Define a class to handle requests ...
+    class Handler(socketserver.StreamRequestHandler):
+        """Handle a request to check a Python script"""
+
+        def handle(self):
+            # Load the request ...
+            request = json.loads(self.rfile.readline())
+            script = os.path.abspath(request["fname"])
+
+            # Check the Python script ...
+            lines = []
+            try:
+                with lock:
+                    # Bring the cache entry of the Python script up-to-date and
+                    # start watching it (if it is in the folder) ...
+                    scriptEntry = refresh(script)
+                    if script.startswith(f"{args.dname}/") and script not in tree:
+                        tree[script] = scriptEntry
+                        symbols["table"] = None
+
+                    # Check if the user wants to run the rules ...
+                    if "everything" in request["checks"] and "everything" in args.checks:
+                        lines += funcs.report_rules(script, scriptEntry["rules"], rules)
+
+                    # Check if the user wants to check keyword-only
+                    # arguments ...
+                    if "keyword-arguments" in request["checks"] and "keyword-arguments" in args.checks:
+                        rebuild()
+                        lines += funcs.report_keyword_arguments(
+                            symbols["fnames"],
+                            symbols["summaries"],
+                              table = symbols["table"],
+                            targets = {script},
+                        )
+
+                    # Check if the user wants to check keyword-only arguments of
+                    # libraries ...
+                    if "library-keyword-arguments" in request["checks"] and "library-keyword-arguments" in args.checks:
+                        libLines, log = funcs.report_library_calls(
+                            [script],
+                            [scriptEntry[callsKey]],
+                            kwFuncs,
+                                  debug = args.debug,
+                                   lite = args.lite,
+                            unImpKwArgs = args.unImpKwArgs,
+                        )
+                        lines += libLines
+                        lines.append(80 * "*")
+                        lines += log
+            except Exception as err:                                            # pylint: disable=broad-exception-caught
+                response = {
+                    "error" : f"\"{script}\" cannot be checked ({err})",
+                }
+            else:
+                response = {
+                    "lines" : lines,
+                }
+
+            # Send the response ...
+            self.wfile.write(json.dumps(response, ensure_ascii = False).encode("utf-8") + b"\n")
+
+    # Build the symbol table ...
+    rebuild()
+
+    # **************************************************************************
+
+    # Stop cleanly when asked to ...
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # Remove any socket left behind by a previous daemon ...
+    if os.path.exists(args.socket):
+        os.remove(args.socket)
+    os.makedirs(os.path.dirname(args.socket), exist_ok = True)
+
+    # Start watching the folder ...
+    threading.Thread(target = watch, daemon = True).start()
+
+    # Serve requests until stopped ...
+    try:
+        with socketserver.UnixStreamServer(args.socket, Handler) as server:
+            print(f"Listening on \"{args.socket}\" ...")
+            sys.stdout.flush()
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Remove the socket ...
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+
+        # Save cache ...
+        if not args.noCache:
+            with lock:
+                funcs.save_cache(
+                    f"{args.cacheDir}/lintDaemon.json",
+                    CACHE_VERSION,
+                    cache,
+                )
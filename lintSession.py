@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+# Define the version of the cache (which must be changed whenever the structure
+# of the summaries or the diagnostics changes) ...
+CACHE_VERSION = "3"
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import itertools
+    import os
+    import sys
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Check Python scripts with every checker, parsing each one only once.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "dname",
+        help = "the folder to check",
+        type = str,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of summaries and diagnostics in",
+           type = str,
+    )
+    parser.add_argument(
+        "--checks",
+        choices = [
+            "everything",
+            "keyword-arguments",
+            "library-keyword-arguments",
+            "readme-links",
+        ],
+        default = [
+            "everything",
+            "keyword-arguments",
+            "library-keyword-arguments",
+            "readme-links",
+        ],
+           help = "the checks to run (\"everything\" is \"checkEverything.py\", \"keyword-arguments\" is \"checkAllKeywordArguments.py\", \"library-keyword-arguments\" is \"checkPyGuymer3KeywordArguments.py\" and \"readme-links\" is \"check_READMEs.py\" without writing \"requirements.txt\")",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--format",
+        choices = [
+            "jsonl",
+            "sarif",
+            "text",
+        ],
+        default = "text",
+           help = "the format to print the diagnostics in (\"jsonl\" and \"sarif\" are streamed as they are found, with the file, the line, the column, the rule ID and the message of each diagnostic, and the README check is printed to standard error if it is not \"text\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to parse and check Python scripts with",
+           type = int,
+    )
+    parser.add_argument(
+        "--library",
+        default = [
+            "pyguymer3",
+        ],
+           dest = "libraries",
+           help = "the installed libraries to check the calls of",
+          nargs = "+",
+           type = str,
+    )
+    funcs.add_lite_arguments(parser)
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of summaries and diagnostics",
+    )
+    parser.add_argument(
+        "--rules",
+        default = [
+            f"{os.path.dirname(os.path.realpath(__file__))}/checkEverything.json",
+        ],
+           dest = "rFiles",
+           help = "the JSON files of rules to check",
+          nargs = "+",
+           type = str,
+    )
+    args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+    args.rFiles = tuple(os.path.realpath(rFile) for rFile in args.rFiles)
+
+    # **************************************************************************
+
+    # Compile the rules ...
+    rules, _ = funcs.compile_rules(args.rFiles)
+
+    # Load cache ...
+    cache = {}
+    if not args.noCache:
+        cache = funcs.load_cache(
+            f"{args.cacheDir}/lintSession.json",
+            CACHE_VERSION,
+            debug = args.debug,
+        )
+
+    # Create short-hand for where the summaries of the function calls to the
+    # libraries are stored in the cache entries ...
+    callsKey = f"calls/{','.join(args.libraries)}"
+
+    # **************************************************************************
+
+    # Initialize lists ...
+    fnames = []
+    entries = []
+    tasks = []
+    taskChecks = []
+    taskEntries = []
+
+    # Loop over files in folder (listing them from the Git index where
+    # possible, which skips Git submodules) ...
+    for fname in funcs.list_files(
+        args.dname,
+          debug = args.debug,
+        timeout = 60.0,
+    ):
+        # Skip files which are not Python scripts ...
+        if not fname.endswith(".py"):
+            continue
+
+        # Find the cache entry of the Python script ...
+        entry, src = funcs.check_cache(
+            cache,
+            fname,
+            sha = None,
+        )
+        fnames.append(fname)
+        entries.append(entry)
+
+        # Make a list of the checks which do not have valid cached summaries or
+        # diagnostics in the cache entry, along with the plugins which will
+        # create them ...
+        checks, plugins = funcs.plan_checks(
+            fname,
+            src,
+            entry,
+            rules,
+               checks = args.checks,
+            libraries = args.libraries,
+               rFiles = args.rFiles,
+        )
+
+        # Skip this Python script if there aren't any checks which need
+        # running ...
+        if not checks:
+            continue
+
+        # Load the Python script (if it has not been loaded already) ...
+        if src is None:
+            with open(fname, "rb") as fObj:
+                src = fObj.read()
+
+        # Append task ...
+        tasks.append((src, tuple(plugins)))
+        taskChecks.append(checks)
+        taskEntries.append(entry)
+
+    # Parse the Python scripts once each and pass them to the plugins (in
+    # parallel, if requested), storing the results in the cache ...
+    for entry, checks, results in zip(
+        taskEntries,
+        taskChecks,
+        funcs.run_jobs(
+            funcs.lint_source,
+            tasks,
+            jobs = args.jobs,
+        ),
+        strict = True,
+    ):
+        funcs.store_checks(
+            entry,
+            checks,
+            results,
+            rules,
+            libraries = args.libraries,
+        )
+
+    # **************************************************************************
+
+    # Initialize list (of the diagnostics of each check, which are streamed
+    # once all of the checks have been planned if the diagnostics are not
+    # printed as text) ...
+    streams = []
+
+    # Check if the user wants to run the rules ...
+    if "everything" in args.checks:
+        # Loop over Python scripts and print (or stream) the diagnostics ...
+        if args.format == "text":
+            for fname, entry in zip(fnames, entries, strict = True):
+                for line in funcs.report_rules(fname, entry["rules"], rules):
+                    print(line)
+        else:
+            streams.append(
+                diagnostic
+                for fname, entry in zip(fnames, entries, strict = True)
+                for diagnostic in funcs.rule_diagnostics(fname, entry["rules"], rules)
+            )
+
+    # Check if the user wants to check keyword-only arguments ...
+    if "keyword-arguments" in args.checks:
+        # Print (or stream) the keyword-only arguments which are not sorted
+        # or not passed ...
+        if args.format == "text":
+            for line in funcs.report_keyword_arguments(
+                fnames,
+                entries,
+                  table = None,
+                targets = None,
+            ):
+                print(line)
+        else:
+            streams.append(
+                funcs.keyword_diagnostics(
+                    fnames,
+                    entries,
+                      table = None,
+                    targets = None,
+                )
+            )
+
+    # Check if the user wants to check keyword-only arguments of libraries ...
+    if "library-keyword-arguments" in args.checks:
+        # Initialize database ...
+        kwFuncs : dict[str, list[str]] = {}
+
+        # Loop over libraries and add the keyword-only arguments of their
+        # functions to the database ...
+        for library in args.libraries:
+            kwFuncs.update(
+                funcs.signature_index(
+                    library,
+                    cacheDir = args.cacheDir,
+                       debug = args.debug,
+                        jobs = args.jobs,
+                     noCache = args.noCache,
+                )
+            )
+
+        # Check the library function calls in the Python scripts and print
+        # (or stream) them ...
+        if args.format == "text":
+            lines, log = funcs.report_library_calls(
+                fnames,
+                [entry[callsKey] for entry in entries],
+                kwFuncs,
+                      debug = args.debug,
+                       lite = args.lite,
+                unImpKwArgs = args.unImpKwArgs,
+            )
+            for line in lines:
+                print(line)
+            print(80 * "*")
+            print("\n".join(log))
+        else:
+            streams.append(
+                funcs.library_diagnostics(
+                    fnames,
+                    [entry[callsKey] for entry in entries],
+                    kwFuncs,
+                           lite = args.lite,
+                    unImpKwArgs = args.unImpKwArgs,
+                )
+            )
+
+    # Check if the user wants to check the README ...
+    if "readme-links" in args.checks:
+        # Deduce README name and check that it exists ...
+        # NOTE: The README check is always printed as text, as it does not
+        #       have positions, but to standard error if the diagnostics are
+        #       not printed as text (so that it does not corrupt them).
+        rname = f"{args.dname}/README.md"
+        if os.path.exists(rname):
+            rObj = sys.stdout if args.format == "text" else sys.stderr
+            print(f"Checking \"{rname}\" ...", file = rObj)
+
+            # Find all the non-standard modules which are imported and print
+            # the ones which are not linked to from the README ...
+            modules = funcs.non_standard_modules(
+                os.path.basename(os.path.realpath(args.dname)),
+                [entry["imports"] for entry in entries],
+            )
+            for line in funcs.report_readme_links(rname, modules):
+                print(line, file = rObj)
+
+    # Stream the diagnostics of all of the checks ...
+    if args.format != "text":
+        funcs.write_report(
+            itertools.chain.from_iterable(streams),
+            sys.stdout,
+             fmt = args.format,
+            tool = "lintSession",
+        )
+
+    # Save cache ...
+    if not args.noCache:
+        funcs.save_cache(
+            f"{args.cacheDir}/lintSession.json",
+            CACHE_VERSION,
+            cache,
+        )
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import json
+    import typing
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Merge the shards of a checker run (made with \"--shard\") and print exactly what a single run would print.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "fnames",
+        help = "the JSON files of the shards to merge",
+        nargs = "+",
+        type = str,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Initialize dictionary and list ...
+    shards : dict[int, dict[str, typing.Any]] = {}
+    files = []
+
+    # Loop over JSON files ...
+    for fname in args.fnames:
+        # Load the JSON file ...
+        with open(fname, "rt", encoding = "utf-8") as fObj:
+            shard = json.load(fObj)
+
+        # Check that it is from the same checker run as the first shard ...
+        if shards:
+            first = next(iter(shards.values()))
+            for key in ["checker", "context", "version"]:
+                if shard[key] != first[key]:
+                    raise Exception(f"\"{fname}\" is not from the same checker run as the other shards (its \"{key}\" is different)") from None
+            if shard["shard"][1] != first["shard"][1]:
+                raise Exception(f"\"{fname}\" is not from the same checker run as the other shards (it is one of {shard['shard'][1]:d} shards)") from None
+
+        # Check that it has not already been loaded ...
+        if shard["shard"][0] in shards:
+            raise Exception(f"\"{fname}\" is shard {shard['shard'][0]:d}/{shard['shard'][1]:d}, which has already been loaded") from None
+
+        # Store the shard and append its files ...
+        shards[shard["shard"][0]] = shard
+        files += shard["files"]
+
+    # Check that all of the shards have been loaded ...
+    first = next(iter(shards.values()))
+    missing = sorted(set(range(1, first["shard"][1] + 1)) - shards.keys())
+    if missing:
+        raise Exception(f"shards {', '.join(f'{i:d}' for i in missing)} of {first['shard'][1]:d} are missing") from None
+
+    # Sort the files into the same order as a single run ...
+    files.sort(key = lambda file: file[0])
+    fnames = [file[1] for file in files]
+    results = [file[2] for file in files]
+
+    # **************************************************************************
+
+    # Print what the checker would have printed ...
+    match first["checker"]:
+        case "checkEverything":
+            # Print the diagnostics ...
+            for lines in results:
+                for line in lines:
+                    print(line)
+        case "checkAllKeywordArguments":
+            # Print the keyword-only arguments which are not sorted or not
+            # passed ...
+            for line in funcs.report_keyword_arguments(
+                fnames,
+                results,
+                  table = None,
+                targets = None,
+            ):
+                print(line)
+        case "checkFmcKeywordArguments" | "checkPyGuymer3KeywordArguments":
+            # Check the library function calls in the Python scripts ...
+            lines, log = funcs.report_library_calls(
+                fnames,
+                results,
+                first["context"]["kwFuncs"],
+                      debug = first["context"]["debug"],
+                       lite = first["context"]["lite"],
+                unImpKwArgs = first["context"]["unImpKwArgs"],
+            )
+
+            # Print ...
+            for line in lines:
+                print(line)
+
+            # Print log ...
+            print(80 * "*")
+            print("\n".join(log))
+        case _:
+            # Cry ...
+            raise Exception(f"\"{first['checker']}\" is not a checker that can be merged") from None
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import os
+    import sys
+    import time
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Define the Git commands of each action (which are the same as the ones in
+    # the BASH scripts), as (args, remote) ...
+    actions = {
+        "branch" : [
+            (["remote", "prune", "origin"], True),
+            (["branch", "--all"], False),
+        ],
+        "pull" : [
+            (["pull", "--ff-only", "--recurse-submodules=yes"], True),
+            (["submodule", "init"], False),
+            (["remote", "prune", "origin"], True),
+        ],
+        "push" : [
+            (["push"], True),
+        ],
+        "remote" : [
+            (["remote", "-v"], False),
+        ],
+        "status" : [
+            (["status"], False),
+        ],
+        "tag" : [
+            (["tag"], False),
+        ],
+        "update" : [
+            (["remote", "update"], True),
+            (["remote", "prune", "origin"], True),
+        ],
+    }
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Run the same Git commands as \"branch.sh\", \"pull.sh\", \"push.sh\", \"remote.sh\", \"status.sh\", \"tag.sh\" or \"update.sh\" in every Git repository in a folder, running lots of Git repositories at the same time.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "action",
+        choices = sorted(actions.keys()),
+           help = "the Git commands to run (see the BASH script of the same name)",
+           type = str,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default = "~/.cache/misc",
+           dest = "cacheDir",
+           help = "the folder to store the cache of Git repositories in",
+           type = str,
+    )
+    parser.add_argument(
+        "--dname",
+        default = "~/Repositories",
+           help = "the folder of Git repositories",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 8,
+           help = "the number of Git repositories to run the Git commands in at the same time",
+           type = int,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action = "store_true",
+          dest = "noCache",
+          help = "don't load or save the cache of Git repositories",
+    )
+    parser.add_argument(
+        "--quiet",
+        action = "store_true",
+          help = "don't print the output of the Git commands (only print the summary)",
+    )
+    parser.add_argument(
+        "--retries",
+        default = 2,
+           help = "the number of times to retry a Git command which talks to a remote if it fails (or times out)",
+           type = int,
+    )
+    parser.add_argument(
+        "--timeout",
+        default = 300.0,
+           help = "the timeout for each Git command in each Git repository (in seconds)",
+           type = float,
+    )
+    args = parser.parse_args()
+    args.cacheDir = os.path.expanduser(args.cacheDir)
+    args.dname = os.path.expanduser(args.dname)
+
+    # **************************************************************************
+
+    # Find the Git repositories (in the same way as the BASH scripts) ...
+    dnames = [
+        repository["dname"] for repository in funcs.discover_repositories(
+            args.dname,
+            cacheDir = None if args.noCache else args.cacheDir,
+               debug = False,
+             timeout = args.timeout,
+        )
+    ]
+
+    # Run the Git commands in the Git repositories ...
+    start = time.perf_counter()
+    results = funcs.run_fleet(
+        dnames,
+        actions[args.action],
+           jobs = args.jobs,
+        retries = args.retries,
+        timeout = args.timeout,
+    )
+    wall = time.perf_counter() - start
+
+    # Print the output of the Git commands (in the same order as the BASH
+    # scripts) ...
+    if not args.quiet:
+        for result in results:
+            print(f"Checking \"{os.path.relpath(result['dname'], args.dname)}\" ...")
+            print(result["output"], end = "")
+
+    # **************************************************************************
+
+    # Print the summary ...
+    failures = [result for result in results if not result["ok"]]
+    changes = [result for result in results if result["changes"]]
+    print(f"Ran \"{args.action}\" in {len(results):,d} Git repositories in {wall:,.1f} s ({sum(result['attempts'] for result in results):,d} Git commands, {len(failures):,d} failures and {len(changes):,d} changed).")
+    for result in changes:
+        print(f"  \"{os.path.relpath(result['dname'], args.dname)}\" changed:")
+        for change in result["changes"]:
+            print(f"    {change}")
+    for result in failures:
+        print(f"  \"{os.path.relpath(result['dname'], args.dname)}\" failed after {result['attempts']:,d} Git commands: {result['error']}")
+
+    # Exit with an error if any of the Git repositories failed ...
+    if failures:
+        sys.exit(1)